@@ -0,0 +1,4 @@
+"""
+ベンチマークパッケージ
+PDFMergerの性能測定スクリプトと合成PDFコーパス生成機能を提供
+"""
@@ -0,0 +1,51 @@
+"""
+並列バッチ結合のベンチマーク
+ワーカープロセス数ごとのスループット（ジョブ/秒）とスケーリングを計測する
+
+実行方法:
+    python -m benchmarks.bench_batch [--jobs 32] [--files 10] [--pages 20]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from pdf_merger import MergeJob, PDFMerger
+from benchmarks.corpus import generate_corpus
+
+def main():
+    parser = argparse.ArgumentParser(description="並列バッチ結合のベンチマーク")
+    parser.add_argument("--jobs", type=int, default=32, help="結合ジョブ数")
+    parser.add_argument("--files", type=int, default=10, help="1ジョブあたりの入力ファイル数")
+    parser.add_argument("--pages", type=int, default=20, help="1ファイルあたりのページ数")
+    parser.add_argument("--payload", type=int, default=2048, help="1ページあたりの付加バイト数")
+    args = parser.parse_args()
+
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, 8, 16, cpu_count} & set(range(1, cpu_count + 1)))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pdf_files = generate_corpus(temp_dir, args.files, args.pages, args.payload)
+        jobs = [
+            MergeJob(pdf_files, str(Path(temp_dir) / "out" / f"job_{index:04d}.pdf"))
+            for index in range(args.jobs)
+        ]
+
+        print(f"ジョブ: {args.jobs}件 x {args.files}ファイル x {args.pages}ページ  (CPU: {cpu_count})")
+        baseline = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            results = PDFMerger(streaming=True).merge_batch(jobs, max_workers=workers)
+            elapsed = time.perf_counter() - start
+            if not all(result.success for result in results):
+                raise RuntimeError("失敗したジョブがあります")
+
+            throughput = len(jobs) / elapsed
+            baseline = baseline or throughput
+            print(f"workers={workers:<3} {elapsed:7.2f} 秒  {throughput:7.2f} ジョブ/秒  "
+                  f"x{throughput / baseline:.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+共有リソース重複排除のベンチマーク
+同じ画像を埋め込んだ合成PDF群を結合し、重複排除の有無で出力サイズと所要時間を比較する
+
+実行方法:
+    python -m benchmarks.bench_dedup [--files 100] [--pages 3] [--resource 262144]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from pdf_merger import PDFMerger
+from benchmarks.corpus import generate_corpus
+
+def main():
+    parser = argparse.ArgumentParser(description="共有リソース重複排除のベンチマーク")
+    parser.add_argument("--files", type=int, default=100, help="入力ファイル数")
+    parser.add_argument("--pages", type=int, default=3, help="1ファイルあたりのページ数")
+    parser.add_argument("--payload", type=int, default=1024, help="1ページあたりの付加バイト数")
+    parser.add_argument("--resource", type=int, default=256 * 1024, help="共有画像のバイト数")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pdf_files = generate_corpus(temp_dir, args.files, args.pages, args.payload,
+                                    shared_resource_bytes=args.resource)
+        input_bytes = sum(os.path.getsize(path) for path in pdf_files)
+        output_path = str(Path(temp_dir) / "merged.pdf")
+
+        print(f"入力: {args.files}ファイル x {args.pages}ページ, 共有画像 {args.resource / 1024:.0f}KB "
+              f"(合計 {input_bytes / (1024 * 1024):.1f}MB)")
+        for streaming in (False, True):
+            for deduplicate in (False, True):
+                merger = PDFMerger(streaming=streaming, deduplicate=deduplicate)
+                start = time.perf_counter()
+                if not merger.merge_pdfs(pdf_files, output_path):
+                    raise RuntimeError("結合に失敗しました")
+                elapsed = time.perf_counter() - start
+
+                label = f"{'streaming' if streaming else 'in-memory'} dedup={'on ' if deduplicate else 'off'}"
+                line = (f"{label:<24} 出力: {os.path.getsize(output_path) / (1024 * 1024):7.2f} MB  "
+                        f"合計: {elapsed * 1000:8.1f} ms")
+                stats = merger.dedup_stats
+                if stats is not None:
+                    line += (f"  共有: {stats.duplicates}個  削減: {stats.bytes_saved / (1024 * 1024):.2f} MB  "
+                             f"ハッシュ: {stats.elapsed * 1000:.1f} ms")
+                print(line)
+
+if __name__ == "__main__":
+    main()
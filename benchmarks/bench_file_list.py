@@ -0,0 +1,54 @@
+"""
+ファイルリストの重複検出のベンチマーク
+大量のパスを1件ずつ追加する際の所要時間を、従来の線形探索と正規化パス索引で比較する
+
+実行方法:
+    python -m benchmarks.bench_file_list [--files 10000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import List
+
+from gui.file_list_model import PDFFileListModel
+
+def legacy_add(file_paths: List[str]) -> int:
+    """従来方式: 追加のたびにリスト全体を走査して重複をチェック"""
+    pdf_files: List[dict] = []
+    for file_path in file_paths:
+        if not any(pdf['file_path'] == file_path for pdf in pdf_files):
+            pdf_files.append({'file_path': file_path})
+    return len(pdf_files)
+
+def indexed_add(file_paths: List[str]) -> int:
+    """索引方式: PDFFileListModelで予約・追加"""
+    model = PDFFileListModel()
+    for file_path in file_paths:
+        if model.reserve(file_path):
+            model.append({'file_path': file_path})
+    return len(model)
+
+def main():
+    parser = argparse.ArgumentParser(description="ファイルリストの重複検出のベンチマーク")
+    parser.add_argument("--files", type=int, default=10000, help="追加するファイル数")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_paths = []
+        for index in range(args.files):
+            file_path = os.path.join(temp_dir, f"file_{index:05d}.pdf")
+            open(file_path, 'wb').close()
+            file_paths.append(file_path)
+
+        print(f"入力: {args.files}ファイル")
+        for label, add in (("before", legacy_add), ("after", indexed_add)):
+            start = time.perf_counter()
+            count = add(file_paths)
+            elapsed = time.perf_counter() - start
+            print(f"{label:<8} 追加: {count}件  合計: {elapsed * 1000:9.1f} ms  "
+                  f"1件あたり: {elapsed * 1e6 / args.files:8.1f} us")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+増分結合のベンチマーク
+結合済みのN件の入力の末尾に1件を追加して結合し直す場合の所要時間を、
+全体の結合し直し（従来方式）と前回の出力への追記で比較する
+
+実行方法:
+    python -m benchmarks.bench_incremental [--files 200] [--pages 20] [--payload 2048]
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from pdf_merger import PDFMerger
+from benchmarks.corpus import generate_corpus, make_pdf
+from utils.merge_manifest import manifest_path
+
+def main():
+    parser = argparse.ArgumentParser(description="増分結合のベンチマーク")
+    parser.add_argument("--files", type=int, default=200, help="結合済みの入力ファイル数")
+    parser.add_argument("--pages", type=int, default=20, help="1ファイルあたりのページ数")
+    parser.add_argument("--payload", type=int, default=2048, help="1ページあたりの付加バイト数")
+    parser.add_argument("--repeat", type=int, default=3, help="計測の繰り返し回数")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pdf_files = generate_corpus(temp_dir, args.files, page_count=args.pages, payload_bytes=args.payload)
+        extra = make_pdf(os.path.join(temp_dir, "extra.pdf"), args.pages, args.payload, seed=args.files)
+        base_path = os.path.join(temp_dir, "base.pdf")
+        output_path = os.path.join(temp_dir, "out.pdf")
+        PDFMerger(incremental=True, streaming=True).merge_pdfs(pdf_files, base_path)
+        print(f"結合済み: {args.files}ファイル x {args.pages}ページ, "
+              f"{Path(base_path).stat().st_size / 1024 / 1024:.1f}MB に1ファイルを追加")
+
+        for label, incremental in (("before", False), ("after", True)):
+            elapsed = []
+            for _ in range(args.repeat):
+                shutil.copy2(base_path, output_path)
+                shutil.copy2(manifest_path(base_path), manifest_path(output_path))
+                merger = PDFMerger(incremental=incremental, streaming=True)
+                start = time.perf_counter()
+                assert merger.merge_pdfs(pdf_files + [extra], output_path)
+                elapsed.append(time.perf_counter() - start)
+            print(f"{label:<8} 最小: {min(elapsed) * 1000:9.1f} ms  ({args.repeat}回)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+PDF情報取得のベンチマーク
+ファイルリストへの追加時に行うget_pdf_info（ページ数・メタデータの取得）の1ファイルあたりの所要時間を、
+文書全体の解析（従来方式）と末尾の相互参照情報だけを読む簡易解析で比較する。
+PDF情報キャッシュに登録済みの状態（同じフォルダを再度追加した場合）も計測する
+
+実行方法:
+    python -m benchmarks.bench_pdf_info [--files 5] [--pages 2000] [--payload 1024]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from pdf_merger import PDFMerger
+from benchmarks.corpus import generate_corpus
+from utils.pdf_cache import PDFInfoCache
+
+def _measure(label: str, merger: PDFMerger, pdf_files: List[str], repeat: int) -> None:
+    latencies = []
+    for _ in range(repeat):
+        for file_path in pdf_files:
+            start = time.perf_counter()
+            info = merger.get_pdf_info(file_path)
+            latencies.append(time.perf_counter() - start)
+            assert info is not None
+
+    print(f"{label:<12} 中央値: {statistics.median(latencies) * 1000:9.2f} ms  "
+          f"最大: {max(latencies) * 1000:9.2f} ms  ({len(latencies)}回)")
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF情報取得のベンチマーク")
+    parser.add_argument("--files", type=int, default=5, help="入力ファイル数")
+    parser.add_argument("--pages", type=int, default=2000, help="1ファイルあたりのページ数")
+    parser.add_argument("--payload", type=int, default=1024, help="1ページあたりの付加バイト数")
+    parser.add_argument("--repeat", type=int, default=3, help="計測の繰り返し回数")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pdf_files = generate_corpus(temp_dir, args.files, page_count=args.pages, payload_bytes=args.payload)
+        # オブジェクトストリーム・相互参照ストリーム形式の入力も計測する
+        compact_path = str(Path(temp_dir) / "compact.pdf")
+        PDFMerger(profile="compact").merge_pdfs(pdf_files[:1], compact_path)
+
+        total_bytes = sum(Path(file_path).stat().st_size for file_path in pdf_files)
+        print(f"入力: {args.files}ファイル x {args.pages}ページ, 合計 {total_bytes / 1024 / 1024:.1f}MB")
+
+        for label, files in (("xref表", pdf_files), ("xref流", [compact_path])):
+            print(f"[{label}]")
+            _measure("before", PDFMerger(fast_info=False), files, args.repeat)
+            _measure("after", PDFMerger(fast_info=True), files, args.repeat)
+
+            cache = PDFInfoCache(os.path.join(temp_dir, f"cache_{label}.sqlite3"))
+            try:
+                # 1回目で登録し、2回目以降のキャッシュから返す場合を計測
+                merger = PDFMerger(fast_info=False, cache=cache)
+                _measure("cold cache", merger, files, 1)
+                _measure("warm cache", merger, files, args.repeat)
+                # 簡易解析できるファイルはキャッシュを参照しないため、キャッシュなしのafterと同程度になる
+                _measure("after+cache", PDFMerger(fast_info=True, cache=cache), files, args.repeat)
+            finally:
+                cache.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+出力プロファイルのベンチマーク
+プロファイルごとの結合・書き出し時間と出力サイズを比較する
+
+実行方法:
+    python -m benchmarks.bench_profiles [--files 50] [--pages 10] [--payload 4096] [--resource 65536]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from pdf_merger import PDFMerger
+from benchmarks.corpus import generate_corpus
+from utils.output_profile import OUTPUT_PROFILES
+
+def main():
+    parser = argparse.ArgumentParser(description="出力プロファイルのベンチマーク")
+    parser.add_argument("--files", type=int, default=50, help="入力ファイル数")
+    parser.add_argument("--pages", type=int, default=10, help="1ファイルあたりのページ数")
+    parser.add_argument("--payload", type=int, default=4096, help="1ページあたりの付加バイト数")
+    parser.add_argument("--resource", type=int, default=64 * 1024, help="全ファイル共通の埋め込み画像のバイト数")
+    parser.add_argument("--repeat", type=int, default=3, help="計測回数（最短時間を採用）")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pdf_files = generate_corpus(temp_dir, args.files, args.pages, args.payload,
+                                    shared_resource_bytes=args.resource)
+        input_bytes = sum(os.path.getsize(path) for path in pdf_files)
+        output_path = str(Path(temp_dir) / "merged.pdf")
+
+        print(f"入力: {args.files}ファイル x {args.pages}ページ (合計 {input_bytes / (1024 * 1024):.1f}MB)")
+        for name in OUTPUT_PROFILES:
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                if not PDFMerger(profile=name).merge_pdfs(pdf_files, output_path):
+                    raise RuntimeError(f"{name}: 結合に失敗しました")
+                timings.append(time.perf_counter() - start)
+
+            elapsed = min(timings)
+            output_bytes = os.path.getsize(output_path)
+            print(f"{name:<8} 時間: {elapsed * 1000:8.1f} ms  "
+                  f"出力: {output_bytes / (1024 * 1024):7.2f} MB ({output_bytes / input_bytes:6.1%})  "
+                  f"スループット: {input_bytes / (1024 * 1024) / elapsed:7.1f} MB/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+単一解析パイプラインのベンチマーク
+入力1件あたりのPdfReader生成回数と所要時間を、従来の二重解析方式と比較する
+
+実行方法:
+    python -m benchmarks.bench_single_parse [--files 20] [--pages 50] [--payload 4096]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+import pdf_merger
+from pdf_merger import PDFMerger
+from benchmarks.corpus import generate_corpus
+
+class _ParseCounter:
+    """pdf_merger.PdfReaderを差し替えて生成回数を数える"""
+
+    def __init__(self):
+        self.count = 0
+        self._original = pdf_merger.PdfReader
+
+    def __enter__(self):
+        original = self._original
+        counter = self
+
+        class CountingReader(original):
+            def __init__(self, *args, **kwargs):
+                counter.count += 1
+                super().__init__(*args, **kwargs)
+
+        pdf_merger.PdfReader = CountingReader
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pdf_merger.PdfReader = self._original
+
+def legacy_merge(merger: PDFMerger, pdf_files: List[str], output_path: str) -> bool:
+    """従来方式: validate_pdf_fileで解析した後、同じファイルを再度解析してページをコピー"""
+    merger.reset()
+    total_pages = 0
+    for file_path in pdf_files:
+        if not merger.validate_pdf_file(file_path):
+            return False
+        with open(file_path, 'rb') as file:
+            reader = pdf_merger.PdfReader(file)
+            for page_num in range(len(reader.pages)):
+                merger.writer.add_page(reader.pages[page_num])
+            total_pages += len(reader.pages)
+    merger._update_page_numbers(total_pages)
+    with open(output_path, 'wb') as output_file:
+        merger.writer.write(output_file)
+    return True
+
+def _measure(label: str, merge: Callable[[PDFMerger, List[str], str], bool],
+             pdf_files: List[str], output_path: str) -> None:
+    merger = PDFMerger()
+    with _ParseCounter() as counter:
+        start = time.perf_counter()
+        ok = merge(merger, pdf_files, output_path)
+        elapsed = time.perf_counter() - start
+    if not ok:
+        raise RuntimeError(f"{label}: 結合に失敗しました")
+    per_input = len(pdf_files)
+    print(f"{label:<8} 解析回数/入力: {counter.count / per_input:.1f}  "
+          f"合計: {elapsed * 1000:8.1f} ms  入力あたり: {elapsed * 1000 / per_input:7.2f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="単一解析パイプラインのベンチマーク")
+    parser.add_argument("--files", type=int, default=20, help="入力ファイル数")
+    parser.add_argument("--pages", type=int, default=50, help="1ファイルあたりのページ数")
+    parser.add_argument("--payload", type=int, default=4096, help="1ページあたりの付加バイト数")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pdf_files = generate_corpus(temp_dir, args.files, args.pages, args.payload)
+        output_path = str(Path(temp_dir) / "merged.pdf")
+
+        print(f"入力: {args.files}ファイル x {args.pages}ページ")
+        _measure("before", legacy_merge, pdf_files, output_path)
+        _measure("after", PDFMerger.merge_pdfs, pdf_files, output_path)
+
+if __name__ == "__main__":
+    main()
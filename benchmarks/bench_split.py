@@ -0,0 +1,69 @@
+"""
+分割出力のベンチマーク
+結合結果を上限ページ数ごとのファイルに分ける場合の所要時間とピークメモリを、
+merge_pdfsで1ファイルに結合してから分割し直す方式（従来方式）と分割出力（split_options）で比較する
+
+実行方法:
+    python -m benchmarks.bench_split [--files 100] [--pages 20] [--max-pages 500]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+
+from pypdf import PdfReader, PdfWriter
+
+from pdf_merger import PDFMerger
+from benchmarks.corpus import generate_corpus
+from utils.output_split import SplitOptions, split_output_path
+
+def merge_then_split(pdf_files, output_path: str, max_pages: int) -> int:
+    """1ファイルに結合してから上限ページ数ごとに書き出し直す（従来方式）"""
+    assert PDFMerger(fsync="none").merge_pdfs(pdf_files, output_path)
+    reader = PdfReader(output_path)
+    count = 0
+    for start in range(0, len(reader.pages), max_pages):
+        writer = PdfWriter()
+        for page in reader.pages[start:start + max_pages]:
+            writer.add_page(page)
+        count += 1
+        writer.write(split_output_path(output_path, count))
+    return count
+
+def split_merge(pdf_files, output_path: str, max_pages: int) -> int:
+    """分割出力で結合"""
+    merger = PDFMerger(split_options=SplitOptions(max_pages=max_pages), fsync="none")
+    assert merger.merge_pdfs(pdf_files, output_path)
+    return len(merger.output_files)
+
+def main():
+    parser = argparse.ArgumentParser(description="分割出力のベンチマーク")
+    parser.add_argument("--files", type=int, default=100, help="入力ファイル数")
+    parser.add_argument("--pages", type=int, default=20, help="1ファイルあたりのページ数")
+    parser.add_argument("--payload", type=int, default=2048, help="1ページあたりの付加バイト数")
+    parser.add_argument("--max-pages", type=int, default=500, help="1出力ファイルあたりの最大ページ数")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pdf_files = generate_corpus(temp_dir, args.files, page_count=args.pages, payload_bytes=args.payload)
+        print(f"入力: {args.files}ファイル x {args.pages}ページ, {args.max_pages}ページごとに分割")
+
+        for label, run in (("before", merge_then_split), ("after", split_merge)):
+            output_path = os.path.join(temp_dir, label, "out.pdf")
+            os.makedirs(os.path.dirname(output_path))
+            tracemalloc.start()
+            try:
+                start = time.perf_counter()
+                count = run(pdf_files, output_path, args.max_pages)
+                elapsed = time.perf_counter() - start
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            print(f"{label:<8} {elapsed:8.2f} 秒  ピーク {peak / (1024 * 1024):7.1f} MB  ({count}ファイル)")
+
+if __name__ == "__main__":
+    main()
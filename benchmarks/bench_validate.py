@@ -0,0 +1,44 @@
+"""
+入力ファイルの検証のベンチマーク
+多数の入力の検証にかかる時間を、validate_pdf_fileを1件ずつ呼ぶ方式（従来方式）と
+validate_many（スレッドプール・プロセスプール）で比較する
+
+実行方法:
+    python -m benchmarks.bench_validate [--files 500] [--pages 50] [--workers 4]
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+
+from pdf_merger import PDFMerger
+from benchmarks.corpus import generate_corpus
+
+def main():
+    parser = argparse.ArgumentParser(description="入力ファイルの検証のベンチマーク")
+    parser.add_argument("--files", type=int, default=500, help="入力ファイル数")
+    parser.add_argument("--pages", type=int, default=50, help="1ファイルあたりのページ数")
+    parser.add_argument("--payload", type=int, default=512, help="1ページあたりの付加バイト数")
+    parser.add_argument("--workers", type=int, default=None, help="並列数（省略時はプールの既定値）")
+    args = parser.parse_args()
+    logging.getLogger().setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pdf_files = generate_corpus(temp_dir, args.files, page_count=args.pages, payload_bytes=args.payload)
+        merger = PDFMerger()
+        print(f"入力: {args.files}ファイル x {args.pages}ページ")
+
+        start = time.perf_counter()
+        assert all(merger.validate_pdf_file(file_path) for file_path in pdf_files)
+        print(f"{'before':<16} {time.perf_counter() - start:8.2f} 秒")
+
+        for label, use_processes in (("after (thread)", False), ("after (process)", True)):
+            start = time.perf_counter()
+            results = merger.validate_many(pdf_files, max_workers=args.workers, use_processes=use_processes)
+            elapsed = time.perf_counter() - start
+            assert all(result.ok for result in results)
+            print(f"{label:<16} {elapsed:8.2f} 秒")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""
+合成PDFコーパス生成モジュール
+ベンチマーク用のPDFファイルを外部ファイルなしで決定的に生成する
+"""
+
+import random
+import zlib
+from pathlib import Path
+from typing import List
+
+from pypdf import PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    DecodedStreamObject,
+    DictionaryObject,
+    IndirectObject,
+    NameObject,
+    NumberObject,
+    StreamObject,
+)
+
+# 共有リソースの内容を決める乱数シード（全ファイルで同じロゴ画像を埋め込む）
+SHARED_RESOURCE_SEED = 12345
+
+def make_shared_image(writer: PdfWriter, resource_bytes: int) -> IndirectObject:
+    """
+    全ファイルで同一内容となるグレースケール画像XObjectを追加（ロゴやフォントの代わり）
+
+    Args:
+        writer (PdfWriter): 追加先のライター
+        resource_bytes (int): 画像データのバイト数（正方形に切り詰める）
+
+    Returns:
+        IndirectObject: 追加した画像への参照
+    """
+    rng = random.Random(SHARED_RESOURCE_SEED)
+    side = max(1, int(resource_bytes ** 0.5))
+    image = DecodedStreamObject()
+    image.set_data(bytes(rng.getrandbits(8) for _ in range(side * side)))
+    image.update({
+        NameObject("/Type"): NameObject("/XObject"),
+        NameObject("/Subtype"): NameObject("/Image"),
+        NameObject("/Width"): NumberObject(side),
+        NameObject("/Height"): NumberObject(side),
+        NameObject("/ColorSpace"): NameObject("/DeviceGray"),
+        NameObject("/BitsPerComponent"): NumberObject(8),
+    })
+    return writer._add_object(image)
+
+def make_pdf(file_path: str, page_count: int = 1, payload_bytes: int = 0, seed: int = 0,
+             shared_resource_bytes: int = 0) -> str:
+    """
+    合成PDFファイルを1つ生成
+
+    Args:
+        file_path (str): 出力ファイルパス
+        page_count (int): ページ数
+        payload_bytes (int): 1ページあたりのコンテンツストリームに付加するバイト数
+        seed (int): 乱数シード（同じ値なら同じ内容を生成）
+        shared_resource_bytes (int): 全ページから参照する共有画像のバイト数
+            （0の場合は埋め込まない。内容はseedによらず全ファイルで同じ）
+
+    Returns:
+        str: 生成したファイルパス
+    """
+    rng = random.Random(seed)
+    writer = PdfWriter()
+    logo = make_shared_image(writer, shared_resource_bytes) if shared_resource_bytes else None
+
+    for page_num in range(page_count):
+        page = writer.add_blank_page(width=612, height=792)
+        content = DecodedStreamObject()
+        body = f"BT /F1 12 Tf 72 720 Td (Page {page_num + 1} seed {seed}) Tj ET\n".encode()
+        if logo is not None:
+            page[NameObject("/Resources")] = DictionaryObject({
+                NameObject("/XObject"): DictionaryObject({NameObject("/Logo"): logo})
+            })
+            body += b"q 96 0 0 96 72 600 cm /Logo Do Q\n"
+        if payload_bytes:
+            # 圧縮されにくいコメント行でページを水増しする
+            filler = bytes(rng.getrandbits(8) % 94 + 33 for _ in range(payload_bytes))
+            body += b"% " + filler + b"\n"
+        content.set_data(body)
+        page.replace_contents(content)
+
+    Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(file_path, 'wb') as output_file:
+        writer.write(output_file)
+
+    return file_path
+
+def generate_corpus(directory: str, count: int, page_count: int = 1,
+                    payload_bytes: int = 0, prefix: str = "doc",
+                    shared_resource_bytes: int = 0) -> List[str]:
+    """
+    合成PDFファイル群を生成
+
+    Args:
+        directory (str): 出力ディレクトリ
+        count (int): 生成するファイル数
+        page_count (int): 1ファイルあたりのページ数
+        payload_bytes (int): 1ページあたりの付加バイト数
+        prefix (str): ファイル名の接頭辞
+        shared_resource_bytes (int): 全ファイル共通の埋め込み画像のバイト数
+
+    Returns:
+        List[str]: 生成したファイルパスのリスト（ファイル名順）
+    """
+    return [
+        make_pdf(
+            str(Path(directory) / f"{prefix}_{index:04d}.pdf"),
+            page_count=page_count,
+            payload_bytes=payload_bytes,
+            seed=index,
+            shared_resource_bytes=shared_resource_bytes
+        )
+        for index in range(count)
+    ]
+
+def make_scan_pdf(file_path: str, page_count: int = 1, width: int = 850, height: int = 1100,
+                  seed: int = 0) -> str:
+    """
+    スキャン文書を模した合成PDFファイルを生成（各ページに個別のグレースケール画像を1枚描画）
+
+    Args:
+        file_path (str): 出力ファイルパス
+        page_count (int): ページ数
+        width (int): 画像の幅（ピクセル）
+        height (int): 画像の高さ（ピクセル）
+        seed (int): 乱数シード（同じ値なら同じ内容を生成）
+
+    Returns:
+        str: 生成したファイルパス
+    """
+    rng = random.Random(seed)
+    # 紙の地色に近い明るい値だけを使い、スキャン画像程度に圧縮が効くようにする
+    paper = bytes(0xC0 | (value & 0x3F) for value in range(256))
+    writer = PdfWriter()
+
+    for _ in range(page_count):
+        page = writer.add_blank_page(width=612, height=792)
+        image = StreamObject()
+        image._data = zlib.compress(rng.randbytes(width * height).translate(paper), 6)
+        image.update({
+            NameObject("/Type"): NameObject("/XObject"),
+            NameObject("/Subtype"): NameObject("/Image"),
+            NameObject("/Width"): NumberObject(width),
+            NameObject("/Height"): NumberObject(height),
+            NameObject("/ColorSpace"): NameObject("/DeviceGray"),
+            NameObject("/BitsPerComponent"): NumberObject(8),
+            NameObject("/Filter"): NameObject("/FlateDecode"),
+        })
+        page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/XObject"): DictionaryObject({NameObject("/Scan"): writer._add_object(image)})
+        })
+        content = DecodedStreamObject()
+        content.set_data(b"q 612 0 0 792 0 0 cm /Scan Do Q\n")
+        page.replace_contents(content)
+
+    Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(file_path, 'wb') as output_file:
+        writer.write(output_file)
+
+    return file_path
+
+def make_font_pdf(file_path: str, page_count: int = 1, font_bytes: int = 64 * 1024, seed: int = 0) -> str:
+    """
+    埋め込みフォントを持つ合成PDFファイルを生成（フォントの内容は全ファイルで同じ）
+
+    フォントプログラムは決定的なダミーのバイト列で、描画には使えない。
+    入力間で同一のフォントを共有する文書群（重複排除の効果が大きい）の代わりとして使う
+
+    Args:
+        file_path (str): 出力ファイルパス
+        page_count (int): ページ数
+        font_bytes (int): 埋め込むフォントプログラムのバイト数
+        seed (int): 乱数シード（ページの本文のみが変わる）
+
+    Returns:
+        str: 生成したファイルパス
+    """
+    writer = PdfWriter()
+    font_file = StreamObject()
+    font_file._data = zlib.compress(random.Random(SHARED_RESOURCE_SEED).randbytes(font_bytes), 6)
+    font_file.update({
+        NameObject("/Length1"): NumberObject(font_bytes),
+        NameObject("/Filter"): NameObject("/FlateDecode"),
+    })
+    descriptor = DictionaryObject({
+        NameObject("/Type"): NameObject("/FontDescriptor"),
+        NameObject("/FontName"): NameObject("/BenchSans"),
+        NameObject("/Flags"): NumberObject(32),
+        NameObject("/FontBBox"): ArrayObject([NumberObject(value) for value in (0, -200, 1000, 900)]),
+        NameObject("/ItalicAngle"): NumberObject(0),
+        NameObject("/Ascent"): NumberObject(900),
+        NameObject("/Descent"): NumberObject(-200),
+        NameObject("/CapHeight"): NumberObject(700),
+        NameObject("/StemV"): NumberObject(80),
+        NameObject("/FontFile2"): writer._add_object(font_file),
+    })
+    font = writer._add_object(DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/TrueType"),
+        NameObject("/BaseFont"): NameObject("/BenchSans"),
+        NameObject("/FontDescriptor"): writer._add_object(descriptor),
+    }))
+
+    for page_num in range(page_count):
+        page = writer.add_blank_page(width=612, height=792)
+        page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/Font"): DictionaryObject({NameObject("/F1"): font})
+        })
+        content = DecodedStreamObject()
+        content.set_data(f"BT /F1 12 Tf 72 720 Td (Page {page_num + 1} seed {seed}) Tj ET\n".encode())
+        page.replace_contents(content)
+
+    Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(file_path, 'wb') as output_file:
+        writer.write(output_file)
+
+    return file_path
+
+def make_deep_tree_pdf(file_path: str, page_count: int, fanout: int = 2, seed: int = 0) -> str:
+    """
+    ページツリーが深い合成PDFファイルを生成（各中間ノードの子はfanout個）
+
+    Args:
+        file_path (str): 出力ファイルパス
+        page_count (int): ページ数
+        fanout (int): 中間ノードあたりの子の数（2の場合、深さは約log2(page_count)）
+        seed (int): 乱数シード
+
+    Returns:
+        str: 生成したファイルパス
+    """
+    writer = PdfWriter()
+    for page_num in range(page_count):
+        page = writer.add_blank_page(width=612, height=792)
+        content = DecodedStreamObject()
+        content.set_data(f"BT /F1 12 Tf 72 720 Td (Page {page_num + 1} seed {seed}) Tj ET\n".encode())
+        page.replace_contents(content)
+
+    root = writer._pages
+    level = list(writer._pages.get_object()["/Kids"])
+    counts = [1] * len(level)
+    # 最下層から順にfanout個ずつ中間ノードにまとめ、ルート直下がfanout個以下になるまで繰り返す
+    while len(level) > fanout:
+        next_level, next_counts = [], []
+        for start in range(0, len(level), fanout):
+            node = DictionaryObject({
+                NameObject("/Type"): NameObject("/Pages"),
+                NameObject("/Kids"): ArrayObject(level[start:start + fanout]),
+                NameObject("/Count"): NumberObject(sum(counts[start:start + fanout])),
+            })
+            reference = writer._add_object(node)
+            for kid in level[start:start + fanout]:
+                kid.get_object()[NameObject("/Parent")] = reference
+            next_level.append(reference)
+            next_counts.append(node["/Count"])
+        level, counts = next_level, next_counts
+
+    for kid in level:
+        kid.get_object()[NameObject("/Parent")] = root
+    root.get_object()[NameObject("/Kids")] = ArrayObject(level)
+
+    Path(file_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(file_path, 'wb') as output_file:
+        writer.write(output_file)
+
+    return file_path
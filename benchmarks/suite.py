@@ -0,0 +1,304 @@
+"""
+ベンチマークスイート
+決定的に生成した複数の合成コーパスに対してPDFMergerの公開操作を計測し、
+保存したベースラインと比較して許容範囲を超える性能低下があれば失敗する
+
+コーパス:
+    tiny:  1ページの小さなPDFが多数
+    huge:  数千ページの大きなPDFが少数
+    scans: ページごとに画像を持つスキャン文書
+    fonts: 同じ埋め込みフォントを共有する文書群
+    deep:  ページツリーが深いPDF
+
+実行方法:
+    python -m benchmarks.suite --quick --save-baseline benchmarks/baseline.json
+    python -m benchmarks.suite --quick --baseline benchmarks/baseline.json [--budget 0.25]
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from pdf_merger import MergeJob, PDFMerger
+from benchmarks.corpus import generate_corpus, make_deep_tree_pdf, make_font_pdf, make_scan_pdf
+
+BASELINE_VERSION = 1
+
+# 比較しない程度の小さな差（計測の揺らぎ）
+DEFAULT_MIN_DELTA_MS = 1.0
+DEFAULT_MIN_DELTA_MEMORY = 256 * 1024
+
+@dataclass
+class CorpusSpec:
+    """合成コーパスの定義"""
+    name: str
+    description: str
+    build: Callable[[str], List[str]]    # 出力ディレクトリを受け取り、生成したファイルのリストを返す
+
+def corpus_specs(quick: bool = False) -> List[CorpusSpec]:
+    """
+    スイートで使うコーパスの定義
+
+    Args:
+        quick (bool): Trueの場合、CIなどで短時間に実行できる縮小版
+
+    Returns:
+        List[CorpusSpec]: コーパスの定義のリスト
+    """
+    def scale(full: int, small: int) -> int:
+        return small if quick else full
+
+    def files(directory: str, count: int, factory: Callable[[str, int], str]) -> List[str]:
+        return [factory(os.path.join(directory, f"doc_{index:04d}.pdf"), index) for index in range(count)]
+
+    return [
+        CorpusSpec("tiny", "1ページのPDFが多数",
+                   lambda directory: generate_corpus(directory, scale(1000, 100), page_count=1)),
+        CorpusSpec("huge", "数千ページのPDFが少数",
+                   lambda directory: generate_corpus(directory, scale(3, 2), page_count=scale(3000, 300),
+                                                     payload_bytes=1024)),
+        CorpusSpec("scans", "ページごとに画像を持つスキャン文書",
+                   lambda directory: files(directory, scale(10, 4), lambda path, seed: make_scan_pdf(
+                       path, scale(5, 2), width=scale(850, 300), height=scale(1100, 400), seed=seed))),
+        CorpusSpec("fonts", "同じ埋め込みフォントを共有する文書群",
+                   lambda directory: files(directory, scale(100, 20), lambda path, seed: make_font_pdf(
+                       path, 3, font_bytes=scale(128, 64) * 1024, seed=seed))),
+        CorpusSpec("deep", "ページツリーが深いPDF",
+                   lambda directory: files(directory, scale(4, 2), lambda path, seed: make_deep_tree_pdf(
+                       path, scale(4096, 512), fanout=2, seed=seed))),
+    ]
+
+@dataclass
+class Operation:
+    """計測するPDFMergerの操作"""
+    name: str
+    run: Callable[[str], None]     # ファイルごとの操作は入力ファイル1件を引数に取る（それ以外は引数を使わない）
+    per_file: bool                 # Trueの場合ファイルごとに呼び出し、Falseの場合コーパス全体で1回呼び出す
+    pages: Optional[int] = None    # コーパス全体で1回呼び出す場合に処理するページ数（Noneの場合は全ページ）
+
+def _operations(pdf_files: List[str], output_dir: str) -> List[Operation]:
+    """計測する操作の一覧"""
+    output_path = os.path.join(output_dir, "merged.pdf")
+    job_size = max(1, len(pdf_files) // 4)
+    jobs = [MergeJob(pdf_files[start:start + job_size], os.path.join(output_dir, f"job_{start}.pdf"))
+            for start in range(0, len(pdf_files), job_size)]
+
+    def check(success: bool) -> None:
+        if not success:
+            raise RuntimeError("ベンチマーク対象の操作が失敗しました")
+
+    return [
+        Operation("get_pdf_info", lambda file_path: check(PDFMerger().get_pdf_info(file_path) is not None), True),
+        Operation("validate_pdf_file", lambda file_path: check(PDFMerger().validate_pdf_file(file_path)), True),
+        Operation("validate_many",
+                  lambda _: check(all(result.ok for result in PDFMerger().validate_many(pdf_files))), False),
+        Operation("merge_pdfs", lambda _: check(PDFMerger(fsync="none").merge_pdfs(pdf_files, output_path)), False),
+        Operation("merge_pdfs_streaming",
+                  lambda _: check(PDFMerger(streaming=True, fsync="none").merge_pdfs(pdf_files, output_path)), False),
+        # 各ファイルの1ページ目だけを結合する
+        Operation("merge_page_specs",
+                  lambda _: check(PDFMerger(fsync="none").merge_page_specs(
+                      [f"{path}:1" for path in pdf_files], output_path)), False, pages=len(pdf_files)),
+        # 4つのジョブに分けて同一プロセスで順に実行する（CPUコア数に依らない値にするため）
+        Operation("merge_batch",
+                  lambda _: check(all(result.success for result in
+                                      PDFMerger(fsync="none").merge_batch(jobs, max_workers=1))), False),
+    ]
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    """最近傍順位法による百分位数（samplesは昇順）"""
+    index = max(0, min(len(samples) - 1, math.ceil(fraction * len(samples)) - 1))
+    return samples[index]
+
+def measure(operation: Operation, pdf_files: List[str], page_counts: List[int], repeat: int) -> Dict[str, float]:
+    """
+    1つの操作を計測
+
+    Args:
+        operation (Operation): 計測する操作
+        pdf_files (List[str]): コーパスのファイル
+        page_counts (List[int]): 各ファイルのページ数
+        repeat (int): 繰り返し回数
+
+    Returns:
+        Dict[str, float]: 呼び出し1回あたりのレイテンシ（p50/p95/p99/平均、ミリ秒）、
+            スループット（ページ/秒、MB/秒）、tracemallocで計測したピークメモリ（バイト）
+    """
+    run = operation.run
+    targets = pdf_files if operation.per_file else [""]
+    pages = operation.pages if operation.pages is not None else sum(page_counts)
+    run(targets[0])  # ウォームアップ（モジュールの初回読み込みなどを除外）
+
+    latencies = []
+    for _ in range(repeat):
+        for target in targets:
+            start = time.perf_counter()
+            run(target)
+            latencies.append(time.perf_counter() - start)
+
+    # ピークメモリは割り当ての追跡で遅くなるため、時間とは別に1回だけ計測する
+    tracemalloc.start()
+    try:
+        for target in targets:
+            run(target)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    total = sum(latencies)
+    input_bytes = sum(os.path.getsize(file_path) for file_path in pdf_files) * repeat
+    latencies.sort()
+    return {
+        'calls': len(latencies),
+        'p50_ms': _percentile(latencies, 0.50) * 1000,
+        'p95_ms': _percentile(latencies, 0.95) * 1000,
+        'p99_ms': _percentile(latencies, 0.99) * 1000,
+        'mean_ms': total / len(latencies) * 1000,
+        'pages_per_s': pages * repeat / total,
+        'mb_per_s': input_bytes / (1024 * 1024) / total,
+        'peak_memory': peak_memory,
+    }
+
+def run_suite(specs: List[CorpusSpec], repeat: int = 3, operations: Optional[List[str]] = None,
+              log: Callable[[str], None] = print) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    全コーパス・全操作を計測
+
+    Args:
+        specs (List[CorpusSpec]): コーパスの定義
+        repeat (int): 各操作の繰り返し回数
+        operations (Optional[List[str]]): 計測する操作名（Noneの場合すべて）
+        log (Callable[[str], None]): 進捗の出力先
+
+    Returns:
+        Dict[str, Dict[str, Dict[str, float]]]: {コーパス名: {操作名: 計測値}}
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for spec in specs:
+            corpus_dir = os.path.join(temp_dir, spec.name)
+            pdf_files = spec.build(os.path.join(corpus_dir, "in"))
+            page_counts = [PDFMerger().get_pdf_info(file_path)['page_count'] for file_path in pdf_files]
+            size = sum(os.path.getsize(file_path) for file_path in pdf_files)
+            log(f"[{spec.name}] {spec.description}: {len(pdf_files)}ファイル, "
+                f"{sum(page_counts)}ページ, {size / (1024 * 1024):.1f}MB")
+
+            results[spec.name] = {}
+            for operation in _operations(pdf_files, os.path.join(corpus_dir, "out")):
+                if operations and operation.name not in operations:
+                    continue
+                metrics = measure(operation, pdf_files, page_counts, repeat)
+                results[spec.name][operation.name] = metrics
+                log(f"  {operation.name:<22} p50 {metrics['p50_ms']:9.2f} ms  p95 {metrics['p95_ms']:9.2f} ms  "
+                    f"p99 {metrics['p99_ms']:9.2f} ms  {metrics['pages_per_s']:10.0f} ページ/秒  "
+                    f"{metrics['mb_per_s']:7.1f} MB/秒  ピーク {metrics['peak_memory'] / (1024 * 1024):7.1f} MB")
+    return results
+
+def compare(results: dict, baseline: dict, budget: float, memory_budget: float,
+            min_delta_ms: float = DEFAULT_MIN_DELTA_MS,
+            min_delta_memory: int = DEFAULT_MIN_DELTA_MEMORY) -> List[str]:
+    """
+    計測結果をベースラインと比較し、許容範囲を超えた性能低下を列挙
+
+    レイテンシはp50、メモリはピークを比較する。ベースラインにない組み合わせは比較しない
+
+    Args:
+        results (dict): run_suiteの結果
+        baseline (dict): ベースラインの結果（run_suiteの結果と同じ形式）
+        budget (float): レイテンシの許容増加率（0.25は25%まで許容）
+        memory_budget (float): ピークメモリの許容増加率
+        min_delta_ms (float): これ未満のレイテンシの増加は揺らぎとみなす（ミリ秒）
+        min_delta_memory (int): これ未満のピークメモリの増加は揺らぎとみなす（バイト）
+
+    Returns:
+        List[str]: 性能低下の説明（ない場合は空）
+    """
+    regressions = []
+    for corpus, operations in results.items():
+        for name, metrics in operations.items():
+            base = baseline.get(corpus, {}).get(name)
+            if base is None:
+                continue
+            label = f"{corpus}/{name}"
+            current, previous = metrics['p50_ms'], base['p50_ms']
+            if current > previous * (1 + budget) and current - previous > min_delta_ms:
+                regressions.append(f"{label}: p50 {previous:.2f} ms → {current:.2f} ms "
+                                   f"(+{current / previous - 1:.0%}, 許容 +{budget:.0%})")
+            current, previous = metrics['peak_memory'], base['peak_memory']
+            if current > previous * (1 + memory_budget) and current - previous > min_delta_memory:
+                regressions.append(f"{label}: ピークメモリ {previous / (1024 * 1024):.1f} MB → "
+                                   f"{current / (1024 * 1024):.1f} MB "
+                                   f"(+{current / previous - 1:.0%}, 許容 +{memory_budget:.0%})")
+    return regressions
+
+def load_baseline(path: str) -> dict:
+    """ベースライン（JSON）を読み込む"""
+    with open(path, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+    if data.get('version') != BASELINE_VERSION:
+        raise ValueError(f"ベースラインの形式が異なります: {path}")
+    return data
+
+def save_baseline(path: str, results: dict, quick: bool, repeat: int) -> None:
+    """計測結果をベースラインとして保存"""
+    data = {
+        'version': BASELINE_VERSION,
+        'quick': quick,
+        'repeat': repeat,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(data, file, ensure_ascii=False, indent=1)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="PDFMergerのベンチマークスイート")
+    parser.add_argument("--quick", action="store_true", help="縮小版のコーパスで短時間に実行")
+    parser.add_argument("--repeat", type=int, default=3, help="各操作の繰り返し回数")
+    parser.add_argument("--corpus", action="append", help="実行するコーパス（複数指定可、省略時はすべて）")
+    parser.add_argument("--operation", action="append", help="計測する操作（複数指定可、省略時はすべて）")
+    parser.add_argument("--baseline", help="比較するベースライン（JSON）")
+    parser.add_argument("--save-baseline", metavar="PATH", help="計測結果をベースラインとして保存")
+    parser.add_argument("--budget", type=float, default=0.25, help="p50レイテンシの許容増加率（既定: 0.25）")
+    parser.add_argument("--memory-budget", type=float, default=None,
+                        help="ピークメモリの許容増加率（省略時は--budgetと同じ）")
+    parser.add_argument("--min-delta-ms", type=float, default=DEFAULT_MIN_DELTA_MS,
+                        help="揺らぎとみなすレイテンシの増加（ミリ秒）")
+    args = parser.parse_args(argv)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    baseline = load_baseline(args.baseline) if args.baseline else None
+    if baseline is not None and baseline.get('quick') != args.quick:
+        print("ベースラインと--quickの指定が異なるため比較できません", file=sys.stderr)
+        return 2
+
+    specs = [spec for spec in corpus_specs(args.quick) if not args.corpus or spec.name in args.corpus]
+    results = run_suite(specs, args.repeat, args.operation)
+
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results, args.quick, args.repeat)
+        print(f"ベースラインを保存しました: {args.save_baseline}")
+
+    if baseline is None:
+        return 0
+    memory_budget = args.memory_budget if args.memory_budget is not None else args.budget
+    regressions = compare(results, baseline['results'], args.budget, memory_budget, args.min_delta_ms)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    print(f"ベースラインとの比較: {len(regressions)}件の性能低下" if regressions else "ベースラインとの比較: 問題なし")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
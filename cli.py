@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+PDF結合ツール - コマンドラインエントリーポイント
+GUI（Tk）を読み込まずにPDFMergerを直接使用するヘッドレス版
+
+使用例:
+    pdf-merger-cli merge -o out.pdf a.pdf b.pdf "scans/*.pdf"
+    pdf-merger-cli merge -o out.pdf "invoices/*.pdf:1-2" report.pdf:-1
+    pdf-merger-cli merge -o out.pdf --max-mb 20 "scans/*.pdf"      # out_001.pdf, out_002.pdf, …
+    pdf-merger-cli batch --manifest jobs.json --workers 8
+    pdf-merger-cli batch --each-dir "customers/*" --output-dir merged/
+    pdf-merger-cli watch scans/ --output-dir merged/ --quiet 30
+"""
+
+import argparse
+import glob
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from utils.atomic_output import DEFAULT_FSYNC, FSYNC_POLICIES
+from utils.output_profile import DEFAULT_PROFILE, OUTPUT_PROFILES
+from utils.output_split import SplitOptions
+from utils.page_range import PageSelection, split_page_spec
+
+# pypdfの読み込みは重いため、pdf_mergerは実際に結合する時点で読み込む
+# （--helpや引数エラーでは読み込まない）
+
+logger = logging.getLogger("pdf_merger.cli")
+
+def expand_inputs(patterns: List[str], base_dir: Optional[str] = None) -> List[Union[str, PageSelection]]:
+    """
+    入力指定（ファイルパスまたはglobパターン）をファイルパスのリストに展開
+
+    globパターンに一致したファイルはファイル名順に並べ、指定順序の中で展開する。
+    末尾に ":1-3,7" のようなページ範囲がある場合は、一致した各ファイルに同じ範囲を適用する
+
+    Args:
+        patterns (List[str]): ファイルパスまたはglobパターンのリスト（ページ範囲付き可）
+        base_dir (Optional[str]): 相対パスの基準ディレクトリ
+
+    Returns:
+        List[str | PageSelection]: 展開後のファイルパス（ページ範囲付きの場合はPageSelection）のリスト
+    """
+    file_paths = []
+    for spec in patterns:
+        pattern, pages = split_page_spec(spec)
+        if base_dir and not os.path.isabs(pattern):
+            pattern = os.path.join(base_dir, pattern)
+
+        if glob.has_magic(pattern):
+            matches = sorted(path for path in glob.glob(pattern, recursive=True)
+                             if path.lower().endswith('.pdf'))
+            if not matches:
+                logger.warning(f"パターンに一致するPDFファイルがありません: {pattern}")
+        else:
+            matches = [pattern]
+
+        file_paths.extend(PageSelection(path, pages) if pages else path for path in matches)
+
+    return file_paths
+
+def load_manifest(manifest_path: str) -> List[Tuple[List[Union[str, PageSelection]], str]]:
+    """
+    バッチ結合のマニフェスト（JSON）を読み込む
+
+    形式: {"jobs": [{"output": "out/a.pdf", "inputs": ["a/*.pdf", "b.pdf:-1"]}, ...]}
+    （トップレベルがジョブの配列でも可）。相対パスはマニフェストの場所を基準とする
+
+    Args:
+        manifest_path (str): マニフェストファイルパス
+
+    Returns:
+        List[Tuple[List[str | PageSelection], str]]: (入力ファイルのリスト, 出力ファイルパス) のリスト
+    """
+    with open(manifest_path, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+
+    jobs = data.get('jobs', []) if isinstance(data, dict) else data
+    base_dir = str(Path(manifest_path).resolve().parent)
+
+    result = []
+    for job in jobs:
+        output_path = job['output']
+        if not os.path.isabs(output_path):
+            output_path = os.path.join(base_dir, output_path)
+        result.append((expand_inputs(job['inputs'], base_dir), output_path))
+
+    return result
+
+def jobs_from_directories(pattern: str, output_dir: str) -> List[Tuple[List[str], str]]:
+    """
+    globに一致する各ディレクトリ内のPDFを1つの出力にまとめるジョブを作成
+
+    Args:
+        pattern (str): ディレクトリのglobパターン
+        output_dir (str): 出力先ディレクトリ（<ディレクトリ名>.pdf を作成）
+
+    Returns:
+        List[Tuple[List[str], str]]: (入力ファイルのリスト, 出力ファイルパス) のリスト
+    """
+    jobs = []
+    for directory in sorted(glob.glob(pattern)):
+        if not os.path.isdir(directory):
+            continue
+        inputs = expand_inputs([os.path.join(glob.escape(directory), '*.pdf')])
+        if inputs:
+            output_path = os.path.join(output_dir, f"{Path(directory).name}.pdf")
+            jobs.append((inputs, output_path))
+
+    return jobs
+
+def image_options_from_args(args: argparse.Namespace):
+    """画像の再エンコードに関する引数からImageDownsampleOptionsを作成（指定がない場合None）"""
+    if args.downsample is None and args.max_image_kb is None:
+        return None
+
+    from utils.image_downsample import ImageDownsampleOptions
+
+    return ImageDownsampleOptions(
+        target_dpi=args.downsample,
+        max_image_bytes=args.max_image_kb * 1024 if args.max_image_kb is not None else None,
+        jpeg_quality=args.jpeg_quality,
+        grayscale=args.grayscale
+    )
+
+def split_options_from_args(args: argparse.Namespace) -> Optional[SplitOptions]:
+    """分割出力に関する引数からSplitOptionsを作成（上限の指定がない場合None）"""
+    if args.max_pages is None and args.max_mb is None:
+        if args.split_on_file_boundary:
+            raise ValueError("--split-on-file-boundaryは--max-pagesか--max-mbと同時に指定してください")
+        return None
+    return SplitOptions(
+        max_pages=args.max_pages,
+        max_bytes=int(args.max_mb * 1024 * 1024) if args.max_mb is not None else None,
+        file_boundaries=args.split_on_file_boundary
+    )
+
+def hooks_from_args(args: argparse.Namespace) -> list:
+    """計測に関する引数から計測フックのリストを作成"""
+    if not args.stats_json:
+        return []
+
+    from utils.instrumentation import JsonLinesHook
+
+    return [JsonLinesHook(args.stats_json)]
+
+def validate_inputs(merger, pdf_files: List[Union[str, PageSelection]], workers: Optional[int] = None) -> bool:
+    """
+    全ての入力ファイルを結合前にまとめて検証し、問題のあるファイルを表示
+
+    Args:
+        merger (PDFMerger): 検証に使うPDFMerger
+        pdf_files (List[str | PageSelection]): 入力ファイルのリスト（重複は1回だけ検証する）
+        workers (Optional[int]): 並列数（Noneの場合は既定値）
+
+    Returns:
+        bool: 全ての入力が結合可能な場合True
+    """
+    unique = list({str(item): item for item in pdf_files}.values())
+    results = merger.validate_many(unique, max_workers=workers)
+    failed = [result for result in results if not result.ok]
+    for result in failed:
+        print(f"NG    [{result.status}] {result.error}", flush=True)
+    if failed:
+        print(f"検証エラー: {len(failed)}/{len(results)} ファイル（出力は作成していません）")
+    return not failed
+
+def add_image_arguments(parser: argparse.ArgumentParser) -> None:
+    """画像の再エンコードに関する引数を追加"""
+    group = parser.add_argument_group("画像の再エンコード")
+    group.add_argument("--downsample", type=int, metavar="DPI",
+                       help="この解像度を超える埋め込み画像を縮小してJPEGに再エンコード")
+    group.add_argument("--max-image-kb", type=int, metavar="KB",
+                       help="このサイズを超える埋め込み画像は解像度に関わらずJPEGに再エンコード")
+    group.add_argument("--jpeg-quality", type=int, default=75, choices=range(1, 96), metavar="Q",
+                       help="再エンコード時のJPEG品質 1-95（既定: 75）")
+    group.add_argument("--grayscale", action="store_true", help="再エンコードする画像をグレースケールにする")
+
+def add_split_arguments(parser: argparse.ArgumentParser) -> None:
+    """分割出力に関する引数を追加"""
+    group = parser.add_argument_group("分割出力（出力を <名前>_001.pdf, <名前>_002.pdf, … に分ける）")
+    group.add_argument("--max-pages", type=int, metavar="N", help="1ファイルあたりの最大ページ数")
+    group.add_argument("--max-mb", type=float, metavar="MB",
+                       help="1ファイルあたりの推定サイズの上限（入力の1ページあたりの平均サイズから見積もる）")
+    group.add_argument("--split-on-file-boundary", action="store_true",
+                       help="入力ファイルの途中では分割しない（1つの入力だけで上限を超える場合はその入力を1ファイルに出力）")
+
+def run_merge(args: argparse.Namespace) -> int:
+    """mergeサブコマンド: 入力を1つのPDFに結合"""
+    from pdf_merger import PDFMerger
+
+    pdf_files = expand_inputs(args.inputs)
+    if not pdf_files:
+        logger.error("結合するPDFファイルがありません")
+        return 1
+
+    merger = PDFMerger(streaming=args.streaming, read_ahead=args.read_ahead, deduplicate=args.dedup,
+                       profile=args.profile, image_options=image_options_from_args(args),
+                       use_mmap=args.use_mmap, fsync=args.fsync, incremental=args.incremental,
+                       hooks=hooks_from_args(args), split_options=split_options_from_args(args))
+    if args.validate and not validate_inputs(merger, pdf_files):
+        return 1
+    if not merger.merge_pdfs(pdf_files, args.output):
+        return 1
+
+    if merger.split_options is not None:
+        print(f"{args.output}: {len(pdf_files)}個のPDFファイルを{len(merger.output_files)}ファイルに分けて結合しました")
+        for output_file in merger.output_files:
+            print(f"  {output_file} ({os.path.getsize(output_file) / 1024:.0f}KB)")
+    else:
+        print(f"{args.output}: {len(pdf_files)}個のPDFファイルを結合しました")
+    if merger.dedup_stats is not None:
+        stats = merger.dedup_stats
+        print(f"重複リソース: {stats.duplicates}個を共有, {stats.bytes_saved / 1024:.1f}KB削減 "
+              f"({stats.elapsed:.3f}秒)")
+    for stats in merger.image_stats:
+        print(f"画像: {Path(stats.file_path).name}: {stats.images_reencoded}/{stats.images_found}個を再エンコード, "
+              f"{stats.bytes_before / 1024:.0f}KB → {stats.bytes_after / 1024:.0f}KB")
+    return 0
+
+def run_batch(args: argparse.Namespace) -> int:
+    """batchサブコマンド: 複数の結合ジョブをプロセスプールで並列実行"""
+    if args.manifest:
+        jobs = load_manifest(args.manifest)
+    else:
+        jobs = jobs_from_directories(args.each_dir, args.output_dir)
+
+    if not jobs:
+        logger.error("実行する結合ジョブがありません")
+        return 1
+
+    from pdf_merger import PDFMerger
+
+    def report(result) -> None:
+        if result.skipped:
+            print(f"SKIP  {result.output_path} (最新のため省略, {result.page_count}ページ)", flush=True)
+        elif result.success:
+            saved_bytes = result.bytes_saved + result.image_bytes_saved
+            saved = f", {saved_bytes / 1024:.1f}KB削減" if saved_bytes else ""
+            shards = f", {len(result.output_files)}ファイルに分割" if result.output_files else ""
+            print(f"OK    {result.output_path} ({result.input_count}ファイル, "
+                  f"{result.page_count}ページ{shards}, {result.elapsed:.2f}秒{saved})", flush=True)
+        else:
+            print(f"ERROR {result.output_path}: {result.error}", flush=True)
+
+    merger = PDFMerger(streaming=args.streaming, read_ahead=args.read_ahead, deduplicate=args.dedup,
+                       profile=args.profile, image_options=image_options_from_args(args),
+                       use_mmap=args.use_mmap, fsync=args.fsync, hooks=hooks_from_args(args),
+                       split_options=split_options_from_args(args))
+    if args.validate and not validate_inputs(merger, [item for pdf_files, _ in jobs for item in pdf_files],
+                                             args.workers):
+        return 1
+    results = merger.merge_batch(jobs, max_workers=args.workers, on_result=report, checkpoint=args.checkpoint)
+
+    failed = sum(1 for result in results if not result.success)
+    skipped = sum(1 for result in results if result.skipped)
+    print(f"完了: {len(results) - failed}/{len(results)} ジョブ成功" + (f" ({skipped}件は省略)" if skipped else ""))
+    return 1 if failed else 0
+
+def run_watch(args: argparse.Namespace) -> int:
+    """watchサブコマンド: 監視ルート直下のフォルダを監視し、変更が落ち着いたフォルダを結合"""
+    from utils.folder_watcher import FolderWatcher
+    from pdf_merger import PDFMerger
+
+    # 前回の出力からの差分だけを追記できるよう常に増分結合する（再起動後の再結合も入力が同じなら省略される）
+    merger = PDFMerger(streaming=args.streaming, deduplicate=args.dedup, profile=args.profile,
+                       use_mmap=args.use_mmap, fsync=args.fsync, incremental=True, hooks=hooks_from_args(args))
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    def merge_folder(folder: str, pdf_files: List[str]) -> bool:
+        output_path = os.path.join(args.output_dir, f"{Path(folder).name}.pdf")
+        if not merger.merge_pdfs(pdf_files, output_path):
+            print(f"ERROR {output_path}", flush=True)
+            return False
+        print(f"OK    {output_path} ({len(pdf_files)}ファイル)", flush=True)
+        return True
+
+    watcher = FolderWatcher(args.root, merge_folder, quiet_seconds=0 if args.once else args.quiet,
+                            poll_interval=args.interval, use_inotify=not args.polling,
+                            exclude=[args.output_dir])
+    try:
+        if args.once:
+            result = watcher.poll_once()
+            total = len(result.merged) + len(result.failed)
+            print(f"完了: {len(result.merged)}/{total} フォルダ成功")
+            return 1 if result.failed else 0
+        print(f"監視を開始しました: {watcher.root} ({watcher.mode}, {len(watcher.folders)}フォルダ)", flush=True)
+        watcher.run()
+    except KeyboardInterrupt:
+        print("監視を終了しました")
+    finally:
+        watcher.close()
+    return 0
+
+def build_parser() -> argparse.ArgumentParser:
+    """コマンドライン引数パーサーを作成"""
+    parser = argparse.ArgumentParser(
+        prog="pdf-merger-cli",
+        description="PDF結合ツール（コマンドライン版）"
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="詳細なログを出力")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    profile_help = "出力プロファイル: " + " / ".join(
+        f"{profile.name}={profile.description}" for profile in OUTPUT_PROFILES.values()
+    )
+    stats_help = "結合ごとの計測結果（フェーズ別の所要時間・バイト数・ピークメモリ）をJSON Linesで追記するファイル（-は標準出力）"
+    fsync_help = (f"出力ファイルのfsync（既定: {DEFAULT_FSYNC}）: none=しない / file=置き換え前に内容を同期 / "
+                  "file+dir=置き換え後にディレクトリも同期")
+
+    merge_parser = subparsers.add_parser("merge", help="PDFファイルを1つに結合")
+    merge_parser.add_argument("-o", "--output", required=True, help="出力ファイルパス")
+    merge_parser.add_argument("inputs", nargs="+", help="入力PDFファイル（globパターン可、指定順に結合）。"
+                              "末尾に :1-3,7 や :-1（最終ページ）を付けると指定ページのみ結合")
+    merge_parser.add_argument("--streaming", action="store_true",
+                              help="入力ごとに出力へ書き出してメモリ使用量を抑える")
+    merge_parser.add_argument("--read-ahead", type=int, default=0, metavar="N",
+                              help="結合中に後続の入力をN件まで先読み・解析する")
+    merge_parser.add_argument("--dedup", action="store_true",
+                              help="入力間で同一内容のフォント・画像などを1つにまとめて出力サイズを削減")
+    merge_parser.add_argument("--no-mmap", dest="use_mmap", action="store_false",
+                              help="入力ファイルをメモリマップせず通常の読み込みを使う（ネットワークドライブ等向け）")
+    merge_parser.add_argument("--fsync", choices=FSYNC_POLICIES, default=DEFAULT_FSYNC,
+                              help=fsync_help)
+    merge_parser.add_argument("--profile", choices=list(OUTPUT_PROFILES), default=DEFAULT_PROFILE,
+                              help=profile_help)
+    merge_parser.add_argument("--stats-json", metavar="PATH", help=stats_help)
+    merge_parser.add_argument("--validate", action="store_true",
+                              help="結合の前に全ての入力を並列に検証し、問題があれば一覧を表示して何も出力せずに終了")
+    merge_parser.add_argument("--incremental", action="store_true",
+                              help="前回の入力が変わらず末尾に入力を追加しただけの場合、前回の出力に新しいページだけを追記する"
+                              "（入力の記録は <出力>.merge.json に保存）")
+    add_image_arguments(merge_parser)
+    add_split_arguments(merge_parser)
+    merge_parser.set_defaults(handler=run_merge)
+
+    batch_parser = subparsers.add_parser("batch", help="複数の結合ジョブを実行")
+    source = batch_parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--manifest", help="ジョブを記述したJSONマニフェスト")
+    source.add_argument("--each-dir", help="ディレクトリのglobパターン（ディレクトリごとに1ファイルへ結合）")
+    batch_parser.add_argument("--output-dir", default=".", help="--each-dir使用時の出力先ディレクトリ")
+    batch_parser.add_argument("--checkpoint", metavar="PATH",
+                              help="完了したジョブを記録するファイル。再実行時は入力・設定が変わっていない出力を省略")
+    batch_parser.add_argument("--validate", action="store_true",
+                              help="実行の前に全ジョブの入力を並列に検証し、問題があれば一覧を表示して何も出力せずに終了")
+    batch_parser.add_argument("-j", "--workers", type=int, default=None,
+                              help="並列実行するワーカープロセス数（省略時はCPUコア数）")
+    batch_parser.add_argument("--streaming", action="store_true",
+                              help="入力ごとに出力へ書き出してメモリ使用量を抑える")
+    batch_parser.add_argument("--read-ahead", type=int, default=0, metavar="N",
+                              help="結合中に後続の入力をN件まで先読み・解析する")
+    batch_parser.add_argument("--dedup", action="store_true",
+                              help="入力間で同一内容のフォント・画像などを1つにまとめて出力サイズを削減")
+    batch_parser.add_argument("--no-mmap", dest="use_mmap", action="store_false",
+                              help="入力ファイルをメモリマップせず通常の読み込みを使う（ネットワークドライブ等向け）")
+    batch_parser.add_argument("--fsync", choices=FSYNC_POLICIES, default=DEFAULT_FSYNC,
+                              help=fsync_help)
+    batch_parser.add_argument("--profile", choices=list(OUTPUT_PROFILES), default=DEFAULT_PROFILE,
+                              help=profile_help)
+    batch_parser.add_argument("--stats-json", metavar="PATH", help=stats_help)
+    add_image_arguments(batch_parser)
+    add_split_arguments(batch_parser)
+    batch_parser.set_defaults(handler=run_batch)
+
+    watch_parser = subparsers.add_parser("watch", help="フォルダを監視し、変更が落ち着いたフォルダごとに結合")
+    watch_parser.add_argument("root", help="監視ルート（直下の各フォルダのPDFをファイル名の自然順で <フォルダ名>.pdf に結合）")
+    watch_parser.add_argument("--output-dir", required=True, help="出力先ディレクトリ")
+    watch_parser.add_argument("--quiet", type=float, default=10.0, metavar="SEC",
+                              help="フォルダの変更が止まってから結合するまでの秒数（既定: 10）")
+    watch_parser.add_argument("--interval", type=float, default=2.0, metavar="SEC",
+                              help="変更を確認する間隔（秒、既定: 2）")
+    watch_parser.add_argument("--polling", action="store_true",
+                              help="inotifyを使わず、フォルダの更新時刻の比較で変更を検出する（ネットワークドライブ等向け）")
+    watch_parser.add_argument("--once", action="store_true",
+                              help="監視せず、PDFのある全フォルダを1回だけ結合して終了（入力が前回と同じ出力はそのまま）")
+    watch_parser.add_argument("--streaming", action="store_true",
+                              help="入力ごとに出力へ書き出してメモリ使用量を抑える")
+    watch_parser.add_argument("--dedup", action="store_true",
+                              help="入力間で同一内容のフォント・画像などを1つにまとめて出力サイズを削減")
+    watch_parser.add_argument("--no-mmap", dest="use_mmap", action="store_false",
+                              help="入力ファイルをメモリマップせず通常の読み込みを使う（ネットワークドライブ等向け）")
+    watch_parser.add_argument("--fsync", choices=FSYNC_POLICIES, default=DEFAULT_FSYNC,
+                              help=fsync_help)
+    watch_parser.add_argument("--profile", choices=list(OUTPUT_PROFILES), default=DEFAULT_PROFILE,
+                              help=profile_help)
+    watch_parser.add_argument("--stats-json", metavar="PATH", help=stats_help)
+    watch_parser.set_defaults(handler=run_watch)
+
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """メイン関数 - コマンドライン引数を解釈して実行"""
+    args = build_parser().parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(levelname)s: %(message)s"
+    )
+
+    try:
+        return args.handler(args)
+    except Exception as e:
+        logger.error(f"処理に失敗しました: {e}")
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,358 @@
+"""
+ファイルリスト表示モジュール
+表示中の行だけウィジェットを作成し、スクロール時は行ウィジェットを使い回す仮想リスト
+"""
+
+import customtkinter as ctk
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence
+
+from gui.file_list_model import selected_page_count
+
+class PDFFileFrame(ctk.CTkFrame):
+    """PDFファイル表示用フレーム（仮想リストの1行として使い回す）"""
+
+    def __init__(self, master, remove_callback, move_callback, range_callback, height: int):
+        super().__init__(master, height=height)
+
+        self.file_info: Optional[dict] = None
+        self.index = -1
+        self.remove_callback = remove_callback
+        self.move_callback = move_callback
+        self.range_callback = range_callback
+
+        self.create_widgets()
+        # 行の高さを内容に関わらず一定にする
+        self.grid_propagate(False)
+
+    def create_widgets(self):
+        """ウィジェットの作成"""
+        # ファイル名ラベル
+        self.name_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=ctk.CTkFont(size=12, weight="bold"),
+            anchor="w"
+        )
+        self.name_label.grid(row=0, column=0, sticky="ew", padx=10, pady=(5, 0))
+
+        # ページ数表示
+        self.page_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=ctk.CTkFont(size=10),
+            text_color="gray",
+            anchor="w"
+        )
+        self.page_label.grid(row=1, column=0, sticky="ew", padx=10, pady=(0, 5))
+
+        # ボタンフレーム
+        button_frame = ctk.CTkFrame(self, fg_color="transparent")
+        button_frame.grid(row=0, column=1, rowspan=2, padx=10, pady=5)
+
+        # ページ範囲入力欄（空欄の場合は全ページ）
+        self.range_entry = ctk.CTkEntry(
+            button_frame,
+            width=90,
+            height=25,
+            placeholder_text="全ページ"
+        )
+        self.range_entry.pack(side="left", padx=(2, 6))
+        self.range_entry.bind("<Return>", self.apply_range)
+        self.range_entry.bind("<FocusOut>", self.apply_range)
+        self.default_border_color = self.range_entry.cget("border_color")
+
+        # 上移動ボタン
+        self.up_button = ctk.CTkButton(
+            button_frame,
+            text="↑",
+            width=30,
+            height=25,
+            command=self.move_up,
+            fg_color="#6c757d",
+            hover_color="#5a6268"
+        )
+        self.up_button.pack(side="left", padx=2)
+
+        # 下移動ボタン
+        self.down_button = ctk.CTkButton(
+            button_frame,
+            text="↓",
+            width=30,
+            height=25,
+            command=self.move_down,
+            fg_color="#6c757d",
+            hover_color="#5a6268"
+        )
+        self.down_button.pack(side="left", padx=2)
+
+        # 削除ボタン
+        self.remove_button = ctk.CTkButton(
+            button_frame,
+            text="削除",
+            width=60,
+            height=25,
+            command=self.remove_file,
+            fg_color="#dc3545",
+            hover_color="#c82333"
+        )
+        self.remove_button.pack(side="left", padx=2)
+
+        self.grid_columnconfigure(0, weight=1)
+
+    def set_item(self, index: int, file_info: dict):
+        """
+        表示するファイルを設定（ウィジェットは作り直さずラベルだけ更新）
+
+        Args:
+            index (int): リスト内の位置
+            file_info (dict): get_pdf_infoで取得したファイル情報
+        """
+        if self.index == index and self.file_info is file_info:
+            return
+
+        self.index = index
+        self.file_info = file_info
+
+        file_name = Path(file_info['file_path']).name
+        self.name_label.configure(text=f"{index + 1}. {file_name}")
+        self.update_page_label()
+
+        self.range_entry.delete(0, "end")
+        if file_info.get('page_range'):
+            self.range_entry.insert(0, file_info['page_range'])
+        self.range_entry.configure(border_color=self.default_border_color)
+
+    def update_page_label(self):
+        """ページ数表示を更新（範囲指定がある場合は結合するページ数も表示）"""
+        file_info = self.file_info
+        page_count = file_info.get('page_count', '不明')
+        if file_info.get('page_range'):
+            text = f"ページ数: {page_count} (結合: {selected_page_count(file_info)}ページ)"
+        else:
+            text = f"ページ数: {page_count}"
+        self.page_label.configure(text=text)
+
+    def apply_range(self, event=None):
+        """入力されたページ範囲を反映（不正な範囲は枠を赤くして反映しない）"""
+        if self.file_info is None:
+            return
+        text = self.range_entry.get().strip()
+        if text == (self.file_info.get('page_range') or ''):
+            return
+        if self.range_callback(self.index, text):
+            self.range_entry.configure(border_color=self.default_border_color)
+            self.update_page_label()
+        else:
+            self.range_entry.configure(border_color="#dc3545")
+
+    def clear(self):
+        """ファイルの表示を解除して行を隠す"""
+        self.index = -1
+        self.file_info = None
+        self.grid_remove()
+
+    def remove_file(self):
+        """ファイル削除"""
+        self.remove_callback(self.index)
+
+    def move_up(self):
+        """ファイルを上に移動"""
+        self.move_callback(self.index, -1)
+
+    def move_down(self):
+        """ファイルを下に移動"""
+        self.move_callback(self.index, 1)
+
+class VirtualFileList(ctk.CTkFrame):
+    """
+    仮想化したPDFファイルリスト
+
+    画面に収まる行数分のPDFFileFrameだけを作成し、スクロール位置に応じて
+    表示するファイルを差し替える。追加・削除・並べ替えでは表示中の行のラベルを
+    更新するだけなので、リストの長さに関わらずウィジェットは作成・破棄されない。
+    """
+
+    ROW_HEIGHT = 56
+    ROW_PADDING = 2
+
+    def __init__(self, master, items: Sequence[dict], remove_callback: Callable[[int], None],
+                 move_callback: Callable[[int, int], None], range_callback: Callable[[int, str], bool],
+                 label_text: str = "", height: int = 200):
+        super().__init__(master, height=height)
+
+        self.items = items
+        self.remove_callback = remove_callback
+        self.move_callback = move_callback
+        self.range_callback = range_callback
+        self.first_index = 0
+        self.rows: List[PDFFileFrame] = []
+        # 現在の高さに収まる行数（縮小時に作成済みの行は破棄せず、超えた分を隠す）
+        self._visible_count = max(1, height // self.row_pitch)
+
+        # 見出し
+        if label_text:
+            self.label = ctk.CTkLabel(self, text=label_text, font=ctk.CTkFont(size=12))
+            self.label.grid(row=0, column=0, columnspan=2, sticky="ew", padx=5, pady=(5, 0))
+
+        # 行を配置する領域とスクロールバー
+        self.body = ctk.CTkFrame(self, fg_color="transparent", height=height)
+        self.body.grid(row=1, column=0, sticky="nsew", padx=(5, 0), pady=5)
+        self.body.grid_columnconfigure(0, weight=1)
+        self.body.grid_propagate(False)
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.on_scrollbar)
+        self.scrollbar.grid(row=1, column=1, sticky="ns", padx=(0, 5), pady=5)
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        self.body.bind("<Configure>", self.on_resize)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind_all(sequence, self.on_mousewheel, add="+")
+
+        self.ensure_rows(self._visible_count)
+
+    @property
+    def row_pitch(self) -> int:
+        """1行分の高さ（余白を含む）"""
+        return self.ROW_HEIGHT + self.ROW_PADDING * 2
+
+    @property
+    def visible_count(self) -> int:
+        """現在の表示領域の高さに収まる行数"""
+        return self._visible_count
+
+    def ensure_rows(self, count: int):
+        """表示できる行数分の行ウィジェットを用意（ウィンドウサイズ変更時のみ増える）"""
+        while len(self.rows) < count:
+            row = PDFFileFrame(self.body, self.remove_callback, self.move_callback,
+                               self.range_callback, self.ROW_HEIGHT)
+            row.grid(row=len(self.rows), column=0, sticky="ew", padx=5, pady=self.ROW_PADDING)
+            row.grid_remove()
+            self.rows.append(row)
+
+    def on_resize(self, event):
+        """表示領域の高さに合わせて行数を調整（縮小時は収まらなくなった行を隠す）"""
+        visible_count = max(1, event.height // self.row_pitch)
+        if visible_count < self._visible_count:
+            self.commit_pending_ranges()
+        self._visible_count = visible_count
+        self.ensure_rows(visible_count)
+        self.render()
+
+    def commit_pending_ranges(self):
+        """表示中の行で入力途中のページ範囲を反映（行に別のファイルを表示する前に呼ぶ）"""
+        for row in self.rows:
+            row.apply_range()
+
+    # --- リスト変更の通知（いずれも表示中の行だけを更新） ---
+
+    def refresh(self):
+        """表示中の行を現在のリスト内容で更新"""
+        self.render()
+
+    def items_appended(self, count: int = 1):
+        """末尾にcount件のファイルが追加された"""
+        self.render(start_index=len(self.items) - count)
+
+    def item_removed(self, index: int):
+        """indexのファイルが削除された（以降の行番号がずれる）"""
+        self.render(start_index=index)
+
+    def items_swapped(self, index: int, other_index: int):
+        """2つのファイルの位置が入れ替わった"""
+        self.render(start_index=min(index, other_index), end_index=max(index, other_index) + 1)
+        self.ensure_visible(other_index)
+
+    def reset(self):
+        """リストが空になった"""
+        self.first_index = 0
+        self.render()
+
+    # --- スクロール ---
+
+    def ensure_visible(self, index: int):
+        """indexの行が表示されるようにスクロール"""
+        if index < self.first_index:
+            self.scroll_to(index)
+        elif index >= self.first_index + self.visible_count:
+            self.scroll_to(index - self.visible_count + 1)
+
+    def scroll_to(self, first_index: int):
+        """先頭に表示する行を変更"""
+        max_first = max(0, len(self.items) - self.visible_count)
+        first_index = max(0, min(first_index, max_first))
+        if first_index != self.first_index:
+            self.commit_pending_ranges()
+            self.first_index = first_index
+            self.render()
+
+    def on_scrollbar(self, action, *args):
+        """スクロールバー操作のハンドラー"""
+        if action == "moveto":
+            self.scroll_to(round(float(args[0]) * len(self.items)))
+        elif action == "scroll":
+            amount = int(args[0])
+            if len(args) > 1 and args[1] == "pages":
+                amount *= self.visible_count
+            self.scroll_to(self.first_index + amount)
+
+    def on_mousewheel(self, event):
+        """マウスホイールのハンドラー（Windows/macOSはdelta、X11はButton-4/5）"""
+        # bind_allで受け取るため、このリスト上でのホイール操作だけを処理する
+        if not str(event.widget).startswith(str(self)):
+            return
+
+        if getattr(event, "num", None) == 4:
+            step = -1
+        elif getattr(event, "num", None) == 5:
+            step = 1
+        else:
+            step = -1 if event.delta > 0 else 1
+        self.scroll_to(self.first_index + step)
+
+    # --- 描画 ---
+
+    def render(self, start_index: int = 0, end_index: Optional[int] = None):
+        """
+        表示中の行のうち、[start_index, end_index) のファイルを表示する行だけを更新
+
+        Args:
+            start_index (int): 更新が必要な最初のファイル位置
+            end_index (Optional[int]): 更新が必要な範囲の終端（Noneの場合リストの末尾まで）
+        """
+        item_count = len(self.items)
+
+        # 削除で表示範囲が末尾を越えた場合は先頭位置を戻す
+        max_first = max(0, item_count - self.visible_count)
+        if self.first_index > max_first:
+            self.first_index = max_first
+            start_index, end_index = 0, None
+
+        for offset, row in enumerate(self.rows):
+            index = self.first_index + offset
+            if offset >= self.visible_count:
+                # 表示領域に収まらない行（ウィンドウを縮小した後に残っている行）
+                if row.file_info is not None:
+                    row.clear()
+                continue
+            if index < start_index or (end_index is not None and index >= end_index):
+                continue
+            if index < item_count:
+                row.set_item(index, self.items[index])
+                row.grid()
+            else:
+                row.clear()
+
+        self.update_scrollbar()
+
+    def update_scrollbar(self):
+        """スクロールバーの位置と大きさを更新"""
+        item_count = len(self.items)
+        if item_count <= self.visible_count:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            first = self.first_index / item_count
+            last = min(1.0, (self.first_index + self.visible_count) / item_count)
+            self.scrollbar.set(first, last)
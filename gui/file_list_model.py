@@ -0,0 +1,189 @@
+"""
+ファイルリストのモデルモジュール
+結合対象のPDFファイル情報と、重複検出用の正規化パス索引を保持する
+（Tkに依存しないため、GUIを起動せずにテスト・計測できる）
+"""
+
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from utils.file_handler import FileHandler
+from utils.page_range import PageRangeError, resolve_page_ranges
+
+def selected_page_count(file_info: dict) -> int:
+    """
+    ページ範囲の指定を反映した結合ページ数を取得
+
+    Args:
+        file_info (dict): ファイル情報（'page_range'キーがあれば範囲を適用）
+
+    Returns:
+        int: 結合するページ数（範囲が不正な場合は総ページ数）
+    """
+    page_count = file_info.get('page_count', 0)
+    page_range = file_info.get('page_range')
+    if not page_range:
+        return page_count
+    try:
+        return len(resolve_page_ranges(page_range, page_count))
+    except PageRangeError:
+        return page_count
+
+class PDFFileListModel:
+    """
+    結合対象のPDFファイル一覧
+
+    ファイル情報のリストと並行して正規化パス（と任意でファイルの実体）の索引を持ち、
+    重複チェックをリストの長さに関わらずO(1)で行う。索引は追加・削除・並べ替え・全削除に追従する。
+    読み込み中のファイルはreserveで予約しておき、同じファイルの二重投入を防ぐ。
+    """
+
+    def __init__(self, use_file_identity: bool = True):
+        """
+        Args:
+            use_file_identity (bool): Trueの場合、(デバイス番号, inode番号) でも重複を判定する
+                （ハードリンクなど、パスの正規化だけでは同一と判定できないファイル用）
+        """
+        self.use_file_identity = use_file_identity
+        self._items: List[dict] = []
+        self._keys: List[Tuple[str, Optional[Tuple[int, int]]]] = []
+        self._paths: Set[str] = set()
+        self._identities: Dict[Tuple[int, int], int] = {}
+        self._reserved: Dict[str, Optional[Tuple[int, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: int) -> dict:
+        return self._items[index]
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self._items)
+
+    def key_for(self, file_path: str) -> Tuple[str, Optional[Tuple[int, int]]]:
+        """
+        重複判定に使うキーを作成
+
+        Args:
+            file_path (str): ファイルパス
+
+        Returns:
+            Tuple[str, Optional[Tuple[int, int]]]: (正規化パス, ファイルの実体)
+        """
+        identity = FileHandler.file_identity(file_path) if self.use_file_identity else None
+        return FileHandler.normalize_path(file_path), identity
+
+    def contains(self, file_path: str) -> bool:
+        """
+        同じファイルが追加済み、または読み込み中として予約済みかチェック
+
+        Args:
+            file_path (str): ファイルパス
+
+        Returns:
+            bool: 追加・予約済みの場合True
+        """
+        return self._contains_key(self.key_for(file_path))
+
+    def reserve(self, file_path: str) -> bool:
+        """
+        読み込み中のファイルとして予約
+
+        Args:
+            file_path (str): ファイルパス
+
+        Returns:
+            bool: 予約できた場合True（既に追加・予約済みの場合False）
+        """
+        key = self.key_for(file_path)
+        if self._contains_key(key):
+            return False
+        path, identity = key
+        self._reserved[path] = identity
+        self._add_to_index(key)
+        return True
+
+    def release(self, file_path: str) -> None:
+        """
+        予約を解除（読み込みに失敗した場合・中止した場合）
+
+        Args:
+            file_path (str): reserveしたファイルパス
+        """
+        path = FileHandler.normalize_path(file_path)
+        if path in self._reserved:
+            identity = self._reserved.pop(path)
+            self._remove_from_index((path, identity))
+
+    def release_all(self) -> None:
+        """すべての予約を解除"""
+        for path, identity in list(self._reserved.items()):
+            self._remove_from_index((path, identity))
+        self._reserved.clear()
+
+    def append(self, info: dict) -> bool:
+        """
+        ファイル情報を末尾に追加（予約済みの場合は予約を追加済みに切り替える）
+
+        Args:
+            info (dict): get_pdf_infoで取得したファイル情報
+
+        Returns:
+            bool: 追加した場合True（重複していた場合False）
+        """
+        path = FileHandler.normalize_path(info['file_path'])
+        if path in self._reserved:
+            key = (path, self._reserved.pop(path))
+        else:
+            key = self.key_for(info['file_path'])
+            if self._contains_key(key):
+                return False
+            self._add_to_index(key)
+
+        self._items.append(info)
+        self._keys.append(key)
+        return True
+
+    def pop(self, index: int) -> dict:
+        """
+        indexのファイル情報を削除
+
+        Args:
+            index (int): 削除する位置
+
+        Returns:
+            dict: 削除したファイル情報
+        """
+        info = self._items.pop(index)
+        self._remove_from_index(self._keys.pop(index))
+        return info
+
+    def swap(self, index: int, other_index: int) -> None:
+        """2つのファイルの位置を入れ替え（索引は位置に依存しないため変更なし）"""
+        items, keys = self._items, self._keys
+        items[index], items[other_index] = items[other_index], items[index]
+        keys[index], keys[other_index] = keys[other_index], keys[index]
+
+    def clear(self) -> None:
+        """追加済みのファイルをすべて削除（予約は残す）"""
+        for key in self._keys:
+            self._remove_from_index(key)
+        self._items.clear()
+        self._keys.clear()
+
+    def _contains_key(self, key: Tuple[str, Optional[Tuple[int, int]]]) -> bool:
+        path, identity = key
+        return path in self._paths or (identity is not None and identity in self._identities)
+
+    def _add_to_index(self, key: Tuple[str, Optional[Tuple[int, int]]]) -> None:
+        path, identity = key
+        self._paths.add(path)
+        if identity is not None:
+            self._identities[identity] = self._identities.get(identity, 0) + 1
+
+    def _remove_from_index(self, key: Tuple[str, Optional[Tuple[int, int]]]) -> None:
+        path, identity = key
+        self._paths.discard(path)
+        if identity is not None and identity in self._identities:
+            self._identities[identity] -= 1
+            if not self._identities[identity]:
+                del self._identities[identity]
@@ -2,118 +2,49 @@
 メインウィンドウGUIモジュール
 CustomTkinterを使用したモダンなWindows 11スタイルのUI
 ドラッグ&ドロップ機能対応
+
+起動を速くするため、pypdfを読み込むpdf_merger・PDF情報キャッシュ（sqlite3）は最初に使う時点で読み込み、
+ドラッグ&ドロップの拡張（tkdnd）の読み込みとpdf_mergerの先読みはウィンドウの初回描画の後に行う
 """
 
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import filedialog, messagebox
-import ctypes
 import sys
 import os
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
-from pdf_merger import PDFMerger
+from typing import TYPE_CHECKING, Dict, List, Optional
+from gui.file_list import VirtualFileList
+from gui.file_list_model import PDFFileListModel, selected_page_count
+from utils.output_profile import DEFAULT_PROFILE, OUTPUT_PROFILES, get_output_profile
+from utils.page_range import PageRangeError, PageSelection, resolve_page_ranges
 from tkinterdnd2 import TkinterDnD, DND_FILES
 
-class PDFFileFrame(ctk.CTkFrame):
-    """PDFファイル表示用フレーム"""
-    
-    def __init__(self, master, file_info: dict, index: int, remove_callback, move_callback):
-        super().__init__(master)
-        
-        self.file_info = file_info
-        self.index = index
-        self.remove_callback = remove_callback
-        self.move_callback = move_callback
-        
-        self.create_widgets()
-    
-    def create_widgets(self):
-        """ウィジェットの作成"""
-        # ファイル名ラベル
-        file_name = Path(self.file_info['file_path']).name
-        self.name_label = ctk.CTkLabel(
-            self,
-            text=f"{self.index + 1}. {file_name}",
-            font=ctk.CTkFont(size=12, weight="bold"),
-            anchor="w"
-        )
-        self.name_label.grid(row=0, column=0, sticky="ew", padx=10, pady=5)
-        
-        # ページ数表示
-        page_count = self.file_info.get('page_count', '不明')
-        self.page_label = ctk.CTkLabel(
-            self,
-            text=f"ページ数: {page_count}",
-            font=ctk.CTkFont(size=10),
-            text_color="gray",
-            anchor="w"
-        )
-        self.page_label.grid(row=1, column=0, sticky="ew", padx=10, pady=(0, 5))
-        
-        # ボタンフレーム
-        button_frame = ctk.CTkFrame(self, fg_color="transparent")
-        button_frame.grid(row=0, column=1, rowspan=2, padx=10, pady=5)
-        
-        # 上移動ボタン
-        self.up_button = ctk.CTkButton(
-            button_frame,
-            text="↑",
-            width=30,
-            height=25,
-            command=self.move_up,
-            fg_color="#6c757d",
-            hover_color="#5a6268"
-        )
-        self.up_button.pack(side="left", padx=2)
-        
-        # 下移動ボタン
-        self.down_button = ctk.CTkButton(
-            button_frame,
-            text="↓",
-            width=30,
-            height=25,
-            command=self.move_down,
-            fg_color="#6c757d",
-            hover_color="#5a6268"
-        )
-        self.down_button.pack(side="left", padx=2)
-        
-        # 削除ボタン
-        self.remove_button = ctk.CTkButton(
-            button_frame,
-            text="削除",
-            width=60,
-            height=25,
-            command=self.remove_file,
-            fg_color="#dc3545",
-            hover_color="#c82333"
-        )
-        self.remove_button.pack(side="left", padx=2)
-        
-        self.grid_columnconfigure(0, weight=1)
-    
-    def remove_file(self):
-        """ファイル削除"""
-        self.remove_callback(self.index)
-    
-    def move_up(self):
-        """ファイルを上に移動"""
-        self.move_callback(self.index, -1)
-    
-    def move_down(self):
-        """ファイルを下に移動"""
-        self.move_callback(self.index, 1)
+if TYPE_CHECKING:
+    from pdf_merger import MergeProgress, PDFMerger
+    from utils.pdf_cache import PDFInfoCache
 
 class PDFMergerApp(ctk.CTk, TkinterDnD.DnDWrapper):
     """メインアプリケーションクラス - ドラッグ&ドロップ対応"""
     
+    # ファイル読み込み結果をUIへ反映する間隔（ミリ秒）と1回あたりの最大処理件数
+    INGEST_POLL_MS = 50
+    INGEST_BATCH_SIZE = 200
+    
+    # 結合の進捗をUIへ反映する間隔（ミリ秒）と、進捗バーに占めるページコピーの割合
+    MERGE_POLL_MS = 100
+    MERGE_COPY_WEIGHT = 0.7
+    
+    # ウィンドウの作成から、ドラッグ&ドロップの設定・pdf_mergerの先読みを始めるまでの時間（ミリ秒）
+    # （初回描画のイベントを処理してから重い読み込みを始める）
+    STARTUP_DEFER_MS = 100
+    
     def __init__(self):
         super().__init__()
         
-        # TkinterDnDの初期化
-        self.TkdndVersion = TkinterDnD._require(self)
-        
         # アプリケーション設定
         self.version = 770
         self.w_width = 600
@@ -122,7 +53,7 @@ class PDFMergerApp(ctk.CTk, TkinterDnD.DnDWrapper):
         self.resizable(False, False)
         self.minsize(self.w_width, self.w_height)
         self.myappid = u'kaleidpixel.python.pdf_merge_tool.1-1-0'
-        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(self.myappid)
+        self.set_app_user_model_id()
         
         # アイコン設定
         self.icon = "pdf-merger-tool.ico"
@@ -133,31 +64,135 @@ class PDFMergerApp(ctk.CTk, TkinterDnD.DnDWrapper):
         self.iconbitmap(default=self.icon)
         
         # 変数初期化
-        self.pdf_files: List[dict] = []
-        self.pdf_merger = PDFMerger()
+        self.pdf_files = PDFFileListModel()
+        self._pdf_merger: Optional["PDFMerger"] = None
+        self._progress_bar: Optional[ctk.CTkProgressBar] = None
+        self._cancel_ingest_button: Optional[ctk.CTkButton] = None
         self.last_output_dir = os.path.expanduser("~/Documents")  # デフォルト保存先
         
+        # バックグラウンドでのファイル読み込み状態
+        self.ingest_executor: Optional[ThreadPoolExecutor] = None
+        self.ingest_queue: "queue.Queue" = queue.Queue()
+        self.ingest_generation = 0
+        self.ingest_active = False
+        self.ingest_paths: List[str] = []
+        self.ingest_futures: List[Future] = []
+        self.ingest_results: Dict[int, Optional[dict]] = {}
+        self.ingest_next_index = 0
+        self.ingest_added_count = 0
+        self.ingest_error_files: List[str] = []
+        
+        # バックグラウンドでの結合状態
+        self.merge_active = False
+        self.merge_queue: "queue.Queue" = queue.Queue()
+        self.merge_cancel_event = threading.Event()
+        self.merge_job: Optional[dict] = None
+        self.merge_worker: Optional[threading.Thread] = None
+        # 結合中にウィンドウを閉じた場合、書きかけの出力を削除し終えてから終了する
+        self.closing = False
+        
         # GUI作成
         self.create_widgets()
         self.center_window()
         
-        # ドラッグ&ドロップ設定
+        # ドラッグ&ドロップ設定とpdf_mergerの先読みは初回描画の後に行う
+        self.after(self.STARTUP_DEFER_MS, self.finish_startup)
+        
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+    
+    def set_app_user_model_id(self):
+        """タスクバーでアプリケーションを識別するIDを設定（Windowsのみ）"""
+        if sys.platform != "win32":
+            return
+        import ctypes
+        
+        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(self.myappid)
+    
+    def finish_startup(self):
+        """初回描画の後の起動処理: ドラッグ&ドロップの設定と、pdf_merger（pypdf）のバックグラウンドでの読み込み"""
         self.setup_drag_and_drop()
+        if self._pdf_merger is None:
+            threading.Thread(target=preload_pdf_merger, name="pdf-merger-preload", daemon=True).start()
+    
+    @property
+    def pdf_merger(self) -> "PDFMerger":
+        """結合処理（最初に使う時点で作成。pdf_mergerを先読み済みであれば読み込みは待たない）"""
+        if self._pdf_merger is None:
+            from pdf_merger import PDFMerger
+            
+            self._pdf_merger = PDFMerger(cache=self.open_info_cache())
+            self._pdf_merger.profile = get_output_profile(self.profile_menu.get())
+        return self._pdf_merger
+    
+    @property
+    def progress_bar(self) -> ctk.CTkProgressBar:
+        """プログレスバー（最初に表示する時点で作成）"""
+        if self._progress_bar is None:
+            self._progress_bar = ctk.CTkProgressBar(self, width=400)
+            self._progress_bar.set(0)
+        return self._progress_bar
+    
+    @property
+    def cancel_ingest_button(self) -> ctk.CTkButton:
+        """読み込み中止ボタン（最初に表示する時点で作成）"""
+        if self._cancel_ingest_button is None:
+            self._cancel_ingest_button = ctk.CTkButton(
+                self.control_frame,
+                text="⏹ 読み込み中止",
+                width=120,
+                height=35,
+                command=self.cancel_ingest,
+                fg_color="#dc3545",
+                hover_color="#c82333"
+            )
+        return self._cancel_ingest_button
+    
+    def on_close(self):
+        """ウィンドウを閉じる際にバックグラウンド処理を停止"""
+        # 終了時はダイアログ・ステータス表示を行わない
+        self.cancel_ingest(notify=False)
+        self.merge_cancel_event.set()
+        if self.ingest_executor is not None:
+            self.ingest_executor.shutdown(wait=False, cancel_futures=True)
+        if self.merge_active:
+            # 結合スレッドが中止して一時ファイルを削除するまで待ち、poll_mergeで終了を検出してから閉じる
+            self.closing = True
+            self.withdraw()
+            return
+        self.close_info_cache()
+        self.destroy()
+    
+    def close_info_cache(self):
+        """PDF情報キャッシュを閉じる（メモリに溜めた最終参照時刻をDBに書き戻す）"""
+        if self._pdf_merger is not None and self._pdf_merger.cache is not None:
+            self._pdf_merger.cache.close()
+    
+    def open_info_cache(self) -> Optional["PDFInfoCache"]:
+        """PDF情報キャッシュを開く（開けない場合はキャッシュなしで動作）"""
+        try:
+            from utils.pdf_cache import PDFInfoCache
+            
+            return PDFInfoCache()
+        except Exception as e:
+            print(f"PDF情報キャッシュを開けませんでした: {e}")
+            return None
     
     def setup_drag_and_drop(self):
-        """ドラッグ&ドロップ機能の設定"""
+        """ドラッグ&ドロップ機能の設定（tkdnd拡張の読み込みを含む）"""
         try:
+            # TkinterDnDの初期化
+            self.TkdndVersion = TkinterDnD._require(self)
+            
             # メインウィンドウをドロップターゲットとして登録
             self.drop_target_register(DND_FILES)
             self.dnd_bind('<<Drop>>', self.on_drop)
             
             # ファイルリスト表示エリアもドロップターゲットとして登録
-            # CTkScrollableFrameの内部フレームを取得してドロップターゲットに登録
             try:
-                self.files_frame.drop_target_register(DND_FILES)
-                self.files_frame.dnd_bind('<<Drop>>', self.on_drop)
+                self.file_list.drop_target_register(DND_FILES)
+                self.file_list.dnd_bind('<<Drop>>', self.on_drop)
             except AttributeError:
-                # CTkScrollableFrameで直接登録できない場合は、メインウィンドウのみ使用
+                # ファイルリストで直接登録できない場合は、メインウィンドウのみ使用
                 pass
                 
         except Exception as e:
@@ -250,21 +285,25 @@ class PDFMergerApp(ctk.CTk, TkinterDnD.DnDWrapper):
         )
         self.select_button.pack(pady=10)
         
-        # ファイルリスト表示エリア
-        self.files_frame = ctk.CTkScrollableFrame(
-            self, 
+        # ファイルリスト表示エリア（表示中の行だけウィジェットを作成する仮想リスト）
+        self.file_list = VirtualFileList(
+            self,
+            items=self.pdf_files,
+            remove_callback=self.remove_file,
+            move_callback=self.move_file,
+            range_callback=self.set_page_range,
             label_text="選択されたPDFファイル",
             height=200
         )
-        self.files_frame.pack(fill="both", expand=True, padx=20, pady=10)
+        self.file_list.pack(fill="both", expand=True, padx=20, pady=10)
         
         # 操作ボタンフレーム
-        control_frame = ctk.CTkFrame(self, fg_color="transparent")
-        control_frame.pack(fill="x", padx=20, pady=5)
+        self.control_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.control_frame.pack(fill="x", padx=20, pady=5)
         
         # 全削除ボタン
         self.clear_button = ctk.CTkButton(
-            control_frame,
+            self.control_frame,
             text="🗑️ 全て削除",
             width=100,
             height=35,
@@ -275,9 +314,11 @@ class PDFMergerApp(ctk.CTk, TkinterDnD.DnDWrapper):
         )
         self.clear_button.pack(side="left", padx=5)
         
+        # 読み込み中止ボタン（読み込み中のみ表示）はcancel_ingest_buttonで最初の読み込み時に作成する
+        
         # ファイル数表示
         self.file_count_label = ctk.CTkLabel(
-            control_frame,
+            self.control_frame,
             text="ファイル数: 0",
             font=ctk.CTkFont(size=12)
         )
@@ -330,7 +371,34 @@ class PDFMergerApp(ctk.CTk, TkinterDnD.DnDWrapper):
             font=ctk.CTkFont(size=10),
             text_color="gray"
         )
-        self.output_dir_label.grid(row=2, column=0, columnspan=3, sticky="w", padx=10, pady=(0, 10))
+        self.output_dir_label.grid(row=2, column=0, columnspan=3, sticky="w", padx=10, pady=(0, 5))
+        
+        # 出力プロファイル選択（書き出し速度と出力サイズのどちらを優先するか）
+        profile_label = ctk.CTkLabel(
+            output_frame,
+            text="出力形式:",
+            font=ctk.CTkFont(size=12)
+        )
+        profile_label.grid(row=3, column=0, sticky="w", padx=10, pady=(0, 10))
+        
+        self.profile_menu = ctk.CTkOptionMenu(
+            output_frame,
+            values=list(OUTPUT_PROFILES),
+            width=120,
+            command=self.on_profile_changed
+        )
+        self.profile_menu.set(DEFAULT_PROFILE)
+        self.profile_menu.grid(row=3, column=1, sticky="w", padx=10, pady=(0, 10))
+        
+        self.profile_description_label = ctk.CTkLabel(
+            output_frame,
+            text=OUTPUT_PROFILES[DEFAULT_PROFILE].description,
+            font=ctk.CTkFont(size=10),
+            text_color="gray",
+            wraplength=260,
+            justify="left"
+        )
+        self.profile_description_label.grid(row=3, column=1, columnspan=2, sticky="e", padx=10, pady=(0, 10))
         
         output_frame.grid_columnconfigure(1, weight=1)
         
@@ -348,10 +416,7 @@ class PDFMergerApp(ctk.CTk, TkinterDnD.DnDWrapper):
         )
         self.merge_button.pack(pady=20)
         
-        # プログレスバー（非表示状態で作成）
-        self.progress_bar = ctk.CTkProgressBar(self, width=400)
-        self.progress_bar.set(0)
-        self.progress_bar.pack_forget()  # 初期状態では非表示
+        # プログレスバー（読み込み・結合中のみ表示）はprogress_barで最初の表示時に作成する
         
         # ステータスバー
         self.status_label = ctk.CTkLabel(
@@ -362,6 +427,13 @@ class PDFMergerApp(ctk.CTk, TkinterDnD.DnDWrapper):
         )
         self.status_label.pack(side="bottom", fill="x", padx=10, pady=5)
     
+    def on_profile_changed(self, profile_name: str):
+        """出力プロファイルの選択を反映（pdf_merger作成前の場合は作成時に反映する）"""
+        profile = get_output_profile(profile_name)
+        if self._pdf_merger is not None:
+            self._pdf_merger.profile = profile
+        self.profile_description_label.configure(text=profile.description)
+    
     def select_files(self):
         """ファイル選択ダイアログ"""
         file_paths = filedialog.askopenfilenames(
@@ -373,54 +445,165 @@ class PDFMergerApp(ctk.CTk, TkinterDnD.DnDWrapper):
             self.add_pdf_files(file_paths)
     
     def add_pdf_files(self, file_paths: List[str]):
-        """PDFファイルをリストに追加"""
-        added_count = 0
-        error_files = []
+        """PDFファイルをリストに追加（解析はバックグラウンドで行い、結果を順次反映）"""
+        if self.merge_active:
+            self.update_status("結合処理中はファイルを追加できません")
+            return
         
+        new_paths = []
         for file_path in file_paths:
             if file_path.lower().endswith('.pdf'):
-                if not self.is_file_already_added(file_path):
-                    info = self.pdf_merger.get_pdf_info(file_path)
-                    if info:
-                        self.pdf_files.append(info)
-                        added_count += 1
-                    else:
-                        error_files.append(Path(file_path).name)
-        
-        if added_count > 0:
-            self.update_file_list()
-            self.update_status(f"{added_count}個のPDFファイルを追加しました")
+                # 追加済み・読み込み中のファイルと同じ実体であれば予約できない
+                if self.pdf_files.reserve(file_path):
+                    new_paths.append(file_path)
+        
+        if not new_paths:
+            if not self.ingest_active:
+                messagebox.showwarning("警告", "有効なPDFファイルがありませんでした")
+            return
+        
+        self.start_ingest(new_paths)
+    
+    def start_ingest(self, file_paths: List[str]):
+        """ファイル情報の取得をワーカースレッドに投入"""
+        if self.ingest_executor is None:
+            self.ingest_executor = ThreadPoolExecutor(
+                max_workers=min(8, (os.cpu_count() or 1) + 4),
+                thread_name_prefix="pdf-ingest"
+            )
+        
+        if not self.ingest_active:
+            # 新しい読み込みジョブを開始
+            self.ingest_generation += 1
+            self.ingest_active = True
+            self.ingest_paths = []
+            self.ingest_futures = []
+            self.ingest_results = {}
+            self.ingest_next_index = 0
+            self.ingest_added_count = 0
+            self.ingest_error_files = []
+            
+            self.cancel_ingest_button.pack(side="left", padx=5)
+            self.progress_bar.set(0)
+            self.progress_bar.pack(before=self.status_label, pady=10)
+            self.update_ui_state()
+            self.after(self.INGEST_POLL_MS, self.poll_ingest)
+        
+        generation = self.ingest_generation
+        for file_path in file_paths:
+            index = len(self.ingest_paths)
+            self.ingest_paths.append(file_path)
+            future = self.ingest_executor.submit(self.pdf_merger.get_pdf_info, file_path)
+            # 完了通知はワーカースレッドから届くため、キュー経由でTkのスレッドに渡す
+            future.add_done_callback(
+                lambda done, index=index: self.ingest_queue.put((generation, index, done))
+            )
+            self.ingest_futures.append(future)
+        
+        self.update_ingest_progress()
+    
+    def poll_ingest(self):
+        """読み込み結果をまとめてリストに反映（Tkのafterで定期的に呼ばれる）"""
+        if not self.ingest_active:
+            return
+        
+        for _ in range(self.INGEST_BATCH_SIZE):
+            try:
+                generation, index, future = self.ingest_queue.get_nowait()
+            except queue.Empty:
+                break
+            if generation != self.ingest_generation or future.cancelled():
+                continue
+            try:
+                self.ingest_results[index] = future.result()
+            except Exception:
+                self.ingest_results[index] = None
+        
+        # 選択順序を保つため、先頭から連続して読み込みが終わった分だけ追加する
+        added_before = self.ingest_added_count
+        while self.ingest_next_index in self.ingest_results:
+            info = self.ingest_results.pop(self.ingest_next_index)
+            file_path = self.ingest_paths[self.ingest_next_index]
+            if info and self.pdf_files.append(info):
+                self.ingest_added_count += 1
+            elif not info:
+                self.pdf_files.release(file_path)
+                self.ingest_error_files.append(Path(file_path).name)
+            self.ingest_next_index += 1
+        
+        if self.ingest_added_count > added_before:
+            self.file_list.items_appended(self.ingest_added_count - added_before)
+            self.update_ui_state()
+        
+        if self.ingest_next_index >= len(self.ingest_paths):
+            self.finish_ingest()
+        else:
+            self.update_ingest_progress()
+            self.after(self.INGEST_POLL_MS, self.poll_ingest)
+    
+    def update_ingest_progress(self):
+        """読み込みの進捗表示を更新"""
+        total = len(self.ingest_paths)
+        done = self.ingest_next_index + len(self.ingest_results)
+        self.progress_bar.set(done / total if total else 0)
+        self.update_status(f"PDFファイルを読み込み中... {done} / {total} 件解析済み")
+    
+    def cancel_ingest(self, notify: bool = True):
+        """
+        実行中の読み込みを中止（解析済みのファイルはリストに残す）
+        
+        Args:
+            notify (bool): Falseの場合、表示を更新せず結果も通知しない（ウィンドウを閉じる時）
+        """
+        if not self.ingest_active:
+            return
+        
+        for future in self.ingest_futures:
+            future.cancel()
+        
+        total = len(self.ingest_paths)
+        done = self.ingest_next_index
+        self.finish_ingest(notify)
+        if notify:
+            self.update_status(f"読み込みを中止しました ({done} / {total} 件)")
+    
+    def finish_ingest(self, notify: bool = True):
+        """
+        読み込みジョブの終了処理と結果の通知
+        
+        Args:
+            notify (bool): Falseの場合、状態だけを戻し、表示の更新と読み込めなかったファイルの警告を行わない
+        """
+        self.ingest_active = False
+        self.ingest_generation += 1  # 以降に届く結果は無視する
+        self.pdf_files.release_all()
+        self.ingest_futures = []
+        self.ingest_results = {}
+        if not notify:
+            return
         
+        self.cancel_ingest_button.pack_forget()
+        self.progress_bar.pack_forget()
+        self.update_ui_state()
+        
+        if self.ingest_added_count > 0:
+            self.update_status(f"{self.ingest_added_count}個のPDFファイルを追加しました")
+        
+        error_files = self.ingest_error_files
         if error_files:
             messagebox.showwarning(
                 "警告", 
                 f"以下のファイルは読み込めませんでした:\n" + "\n".join(error_files[:5]) +
                 (f"\n他 {len(error_files)-5}個" if len(error_files) > 5 else "")
             )
-        
-        if added_count == 0 and not error_files:
-            messagebox.showwarning("警告", "有効なPDFファイルがありませんでした")
     
     def is_file_already_added(self, file_path: str) -> bool:
         """ファイルが既に追加されているかチェック"""
-        return any(pdf['file_path'] == file_path for pdf in self.pdf_files)
+        return self.pdf_files.contains(file_path)
     
     def update_file_list(self):
-        """ファイルリストの表示更新"""
-        # 既存のウィジェットを削除
-        for widget in self.files_frame.winfo_children():
-            widget.destroy()
-        
-        # ファイルフレームを再作成
-        for i, pdf_info in enumerate(self.pdf_files):
-            file_frame = PDFFileFrame(
-                self.files_frame,
-                pdf_info,
-                i,
-                self.remove_file,
-                self.move_file
-            )
-            file_frame.pack(fill="x", padx=5, pady=2)
+        """ファイルリストの表示更新（表示中の行のみ）"""
+        self.file_list.refresh()
         
         # UI状態の更新
         self.update_ui_state()
@@ -432,6 +615,16 @@ class PDFMergerApp(ctk.CTk, TkinterDnD.DnDWrapper):
         # ファイル数表示更新
         self.file_count_label.configure(text=f"ファイル数: {file_count}")
         
+        # 結合中はボタンを結合処理側で管理する
+        if self.merge_active:
+            return
+        
+        # 読み込み中は結合・全削除を行わない（進捗はupdate_ingest_progressで表示）
+        if self.ingest_active:
+            self.merge_button.configure(state="disabled")
+            self.clear_button.configure(state="disabled")
+            return
+        
         # ボタン状態更新
         if file_count >= 2:
             self.merge_button.configure(state="normal")
@@ -453,7 +646,8 @@ class PDFMergerApp(ctk.CTk, TkinterDnD.DnDWrapper):
         """ファイルをリストから削除"""
         if 0 <= index < len(self.pdf_files):
             removed_file = self.pdf_files.pop(index)
-            self.update_file_list()
+            self.file_list.item_removed(index)
+            self.update_ui_state()
             self.update_status(f"ファイルを削除しました: {Path(removed_file['file_path']).name}")
     
     def move_file(self, index: int, direction: int):
@@ -461,16 +655,46 @@ class PDFMergerApp(ctk.CTk, TkinterDnD.DnDWrapper):
         new_index = index + direction
         
         if 0 <= new_index < len(self.pdf_files):
-            self.pdf_files[index], self.pdf_files[new_index] = \
-                self.pdf_files[new_index], self.pdf_files[index]
-            self.update_file_list()
+            self.pdf_files.swap(index, new_index)
+            self.file_list.items_swapped(index, new_index)
             self.update_status("ファイルの順序を変更しました")
     
+    def set_page_range(self, index: int, page_range: str) -> bool:
+        """
+        ファイルの結合するページ範囲を設定
+
+        Args:
+            index (int): リスト内の位置
+            page_range (str): "1-3,7" 形式の範囲（空文字の場合は全ページ）
+
+        Returns:
+            bool: 設定できた場合True（範囲が不正な場合False）
+        """
+        if not 0 <= index < len(self.pdf_files):
+            return False
+
+        file_info = self.pdf_files[index]
+        if not page_range:
+            file_info.pop('page_range', None)
+            self.update_status(f"全ページを結合します: {file_info['file_name']}")
+            return True
+
+        try:
+            pages = resolve_page_ranges(page_range, file_info['page_count'])
+        except PageRangeError as e:
+            self.update_status(f"❌ {e}")
+            return False
+
+        file_info['page_range'] = page_range
+        self.update_status(f"{len(pages)}ページを結合します: {file_info['file_name']}")
+        return True
+
     def clear_all_files(self):
         """全ファイルを削除"""
         if self.pdf_files and messagebox.askyesno("確認", "すべてのファイルを削除しますか？"):
             self.pdf_files.clear()
-            self.update_file_list()
+            self.file_list.reset()
+            self.update_ui_state()
             self.update_status("すべてのファイルを削除しました")
     
     def browse_output_file(self):
@@ -599,84 +823,194 @@ class PDFMergerApp(ctk.CTk, TkinterDnD.DnDWrapper):
                 self.browse_output_file()
                 return
         
-        # 結合処理実行
+        # 結合処理をワーカースレッドで開始
+        self.start_merge(output_path)
+    
+    def start_merge(self, output_path: str):
+        """結合処理をワーカースレッドで開始し、進捗をafterで監視する"""
+        file_paths = [PageSelection(pdf['file_path'], pdf.get('page_range')) for pdf in self.pdf_files]
+        self.merge_job = {
+            'output_path': output_path,
+            'file_count': len(self.pdf_files),
+            'total_pages': sum(selected_page_count(pdf) for pdf in self.pdf_files),
+            # 書き出しの進捗は出力サイズが入力の合計程度になるとみなして見積もる
+            'estimated_bytes': max(1, sum(pdf['file_size'] for pdf in self.pdf_files)),
+        }
+        self.merge_active = True
+        self.merge_cancel_event = threading.Event()
+        self.merge_queue = queue.Queue()
+        
+        # UI状態を処理中に変更（結合ボタンは中止ボタンとして使う）
+        self.merge_button.configure(
+            text="⏹ 結合を中止",
+            command=self.cancel_merge,
+            fg_color="#dc3545",
+            hover_color="#c82333"
+        )
+        self.select_button.configure(state="disabled")
+        self.clear_button.configure(state="disabled")
+        self.browse_button.configure(state="disabled")
+        self.profile_menu.configure(state="disabled")
+        
+        # プログレスバー表示
+        self.progress_bar.set(0)
+        self.progress_bar.pack(before=self.status_label, pady=10)
+        self.update_status("PDF結合処理を開始しています...")
+        
+        self.merge_worker = threading.Thread(
+            target=self.run_merge_worker,
+            args=(file_paths, output_path, self.merge_queue, self.merge_cancel_event),
+            name="pdf-merge",
+            daemon=True
+        )
+        self.merge_worker.start()
+        self.after(self.MERGE_POLL_MS, self.poll_merge)
+    
+    def run_merge_worker(self, file_paths: List[PageSelection], output_path: str,
+                         result_queue: "queue.Queue", cancel_event: threading.Event):
+        """ワーカースレッドで結合を実行（Tkのウィジェットには触れず、キュー経由で通知）"""
         try:
-            # UI状態を処理中に変更
-            self.merge_button.configure(state="disabled", text="🔄 処理中...")
-            self.select_button.configure(state="disabled")
-            self.clear_button.configure(state="disabled")
-            self.browse_button.configure(state="disabled")
-            
-            # プログレスバー表示
-            self.progress_bar.pack(before=self.status_label, pady=10)
-            self.progress_bar.set(0.1)
-            self.update_status("PDF結合処理を開始しています...")
-            self.update()
-            
-            file_paths = [pdf['file_path'] for pdf in self.pdf_files]
-            
-            # プログレス更新
-            self.progress_bar.set(0.3)
-            self.update_status("PDFファイルを読み込み中...")
-            self.update()
-            
-            # 実際の結合処理
-            if self.pdf_merger.merge_pdfs(file_paths, output_path):
-                self.progress_bar.set(0.8)
-                self.update_status("結合処理完了、ファイルを保存中...")
-                self.update()
-                
-                total_pages = sum(pdf['page_count'] for pdf in self.pdf_files)
-                file_size = os.path.getsize(output_path) / (1024 * 1024)  # MB
-                
-                # 完了処理
-                self.progress_bar.set(1.0)
-                self.update()
-                
-                # 成功メッセージ
-                result = messagebox.askyesno(
-                    "結合完了",
-                    f"✅ PDF結合が完了しました！\n\n"
-                    f"📄 出力ファイル: {filename}\n"
-                    f"📁 保存先: {output_dir}\n"
-                    f"📊 総ページ数: {total_pages}ページ\n"
-                    f"📈 ファイルサイズ: {file_size:.1f}MB\n"
-                    f"🔗 結合ファイル数: {len(self.pdf_files)}個\n\n"
-                    f"結合されたPDFファイルを開きますか？"
-                )
-                
-                if result:
-                    try:
-                        os.startfile(output_path)  # Windows
-                    except:
-                        try:
-                            import subprocess
-                            subprocess.run(['start', output_path], shell=True)
-                        except:
-                            messagebox.showinfo("情報", f"ファイルは正常に作成されました:\n{output_path}")
-                
-                self.update_status(f"✅ 結合完了: {filename}")
-                
+            success = self.pdf_merger.merge_pdfs(
+                file_paths,
+                output_path,
+                progress_callback=result_queue.put,
+                cancel_event=cancel_event
+            )
+            result_queue.put(('done', success, None))
+        except Exception as e:
+            result_queue.put(('done', False, e))
+    
+    def poll_merge(self):
+        """結合の進捗をプログレスバーに反映（Tkのafterで定期的に呼ばれる）"""
+        latest = None
+        finished = None
+        while True:
+            try:
+                item = self.merge_queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, tuple):
+                finished = item
             else:
-                messagebox.showerror("エラー", "❌ PDF結合処理に失敗しました")
-                self.update_status("❌ 結合処理に失敗しました")
+                latest = item
+        
+        if latest is not None:
+            self.show_merge_progress(latest)
+        
+        if finished is not None and self.closing:
+            # 結果は表示せずに閉じる（doneの通知後はスレッドの終了を待つだけ）
+            self.merge_worker.join()
+            self.close_info_cache()
+            self.destroy()
+        elif finished is not None:
+            _, success, error = finished
+            self.finish_merge(success, error)
+        else:
+            self.after(self.MERGE_POLL_MS, self.poll_merge)
+    
+    def show_merge_progress(self, progress: "MergeProgress"):
+        """進捗イベントからプログレスバーとステータスを更新"""
+        job = self.merge_job
+        copy_ratio = min(1.0, progress.pages_copied / max(1, job['total_pages']))
+        
+        if progress.phase == 'copy':
+            value = self.MERGE_COPY_WEIGHT * copy_ratio
+            file_name = Path(progress.current_file).name if progress.current_file else ""
+            message = (f"読み込み中 ({progress.file_index + 1}/{progress.file_count}): {file_name} "
+                       f"- {progress.pages_copied}/{job['total_pages']}ページ")
+        elif progress.phase == 'write':
+            write_ratio = min(1.0, progress.bytes_written / job['estimated_bytes'])
+            value = self.MERGE_COPY_WEIGHT + (1 - self.MERGE_COPY_WEIGHT) * write_ratio
+            message = f"ファイルを保存中... {progress.bytes_written / (1024 * 1024):.1f}MB"
+        else:
+            value = 1.0
+            message = "結合処理完了"
         
-        except Exception as e:
-            messagebox.showerror("エラー", f"❌ 予期しないエラーが発生しました:\n{e}")
-            self.update_status(f"❌ エラー: {e}")
+        self.progress_bar.set(value)
+        self.status_label.configure(text=message)
+    
+    def cancel_merge(self):
+        """実行中の結合を中止（書きかけの出力はPDFMergerが削除する）"""
+        if self.merge_active and not self.merge_cancel_event.is_set():
+            self.merge_cancel_event.set()
+            self.merge_button.configure(state="disabled", text="⏳ 中止しています...")
+            self.update_status("結合処理を中止しています...")
+    
+    def finish_merge(self, success: bool, error: Optional[Exception]):
+        """結合処理の終了処理と結果の表示"""
+        job = self.merge_job
+        cancelled = self.merge_cancel_event.is_set()
+        output_path = job['output_path']
+        filename = os.path.basename(output_path)
+        output_dir = os.path.dirname(output_path)
         
-        finally:
-            # UI状態を元に戻す
-            self.merge_button.configure(state="normal", text="🔗 PDF結合実行")
-            self.select_button.configure(state="normal")
-            self.clear_button.configure(state="normal")
-            self.browse_button.configure(state="normal")
-            self.progress_bar.pack_forget()  # プログレスバーを非表示
-            
-            # ボタン状態を再評価
-            self.update_ui_state()
+        # UI状態を元に戻す
+        self.merge_active = False
+        self.merge_job = None
+        self.merge_button.configure(
+            state="normal",
+            text="🔗 PDF結合実行",
+            command=self.merge_pdfs,
+            fg_color="#28a745",
+            hover_color="#218838"
+        )
+        self.select_button.configure(state="normal")
+        self.clear_button.configure(state="normal")
+        self.browse_button.configure(state="normal")
+        self.profile_menu.configure(state="normal")
+        self.progress_bar.pack_forget()  # プログレスバーを非表示
+        
+        # ボタン状態を再評価
+        self.update_ui_state()
+        
+        if error is not None:
+            messagebox.showerror("エラー", f"❌ 予期しないエラーが発生しました:\n{error}")
+            self.update_status(f"❌ エラー: {error}")
+            return
+        
+        if cancelled and not success:
+            self.update_status("⏹ 結合処理を中止しました")
+            return
+        
+        if not success:
+            messagebox.showerror("エラー", "❌ PDF結合処理に失敗しました")
+            self.update_status("❌ 結合処理に失敗しました")
+            return
+        
+        file_size = os.path.getsize(output_path) / (1024 * 1024)  # MB
+        
+        # 成功メッセージ
+        result = messagebox.askyesno(
+            "結合完了",
+            f"✅ PDF結合が完了しました！\n\n"
+            f"📄 出力ファイル: {filename}\n"
+            f"📁 保存先: {output_dir}\n"
+            f"📊 総ページ数: {job['total_pages']}ページ\n"
+            f"📈 ファイルサイズ: {file_size:.1f}MB\n"
+            f"🔗 結合ファイル数: {job['file_count']}個\n\n"
+            f"結合されたPDFファイルを開きますか？"
+        )
+        
+        if result:
+            try:
+                os.startfile(output_path)  # Windows
+            except:
+                try:
+                    import subprocess
+                    subprocess.run(['start', output_path], shell=True)
+                except:
+                    messagebox.showinfo("情報", f"ファイルは正常に作成されました:\n{output_path}")
+        
+        self.update_status(f"✅ 結合完了: {filename}")
     
     def update_status(self, message: str):
         """ステータス表示更新"""
         self.status_label.configure(text=message)
         self.update()
+
+def preload_pdf_merger():
+    """pdf_merger（pypdf）を読み込んでおく（バックグラウンドのスレッドで呼ばれる）"""
+    try:
+        import pdf_merger
+    except Exception as e:
+        print(f"PDF処理モジュールの先読みに失敗しました: {e}")
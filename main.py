@@ -6,12 +6,16 @@ Windows 11対応のPDFファイル結合アプリケーション
 
 import sys
 import os
+import logging
 import customtkinter as ctk
 from gui.main_window import PDFMergerApp
 
 def main():
     """メイン関数 - アプリケーション起動"""
     try:
+        # ログ設定
+        logging.basicConfig(level=logging.INFO)
+        
         # CustomTkinterの設定
         ctk.set_appearance_mode("System")  # System, Light, Dark
         ctk.set_default_color_theme("blue")  # blue, green, dark-blue
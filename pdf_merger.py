@@ -4,29 +4,323 @@ pypdfライブラリを使用してPDFファイルの結合とページ番号の
 """
 
 from pypdf import PdfWriter, PdfReader
+from pypdf.errors import FileNotDecryptedError
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import closing
+from dataclasses import asdict, dataclass, replace
+from itertools import islice
+import gc
+import hashlib
+import json
+import os
+import threading
+import time
 from pathlib import Path
 import logging
-from typing import List, Optional
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
-# ログ設定
-logging.basicConfig(level=logging.INFO)
+from utils.atomic_output import DEFAULT_FSYNC, FSYNC_POLICIES, AtomicOutputFile, atomic_output
+from utils.checkpoint import BatchCheckpoint
+from utils.output_profile import DEFAULT_PROFILE, OutputProfile, get_output_profile
+from utils.dedup import DedupStats, StreamDeduplicator, deduplicate_streams
+from utils.input_source import InputSource, open_input
+from utils.instrumentation import MergeHooks, MergeStats, StatsRecorder
+from utils.merge_manifest import MergeManifest
+from utils.output_split import SplitOptions, split_output_path, stale_split_outputs
+from utils.image_downsample import ImageDownsampleOptions, ImageStats, downsample_images
+from utils.page_range import PageRangeError, PageSelection, parse_page_spec
+from utils.pdf_cache import PDFInfoCache
+from utils.pdf_info import PDFInfo, compact_metadata
+from utils.pdf_probe import PDFProbe, PDFProbeError, probe_pdf, read_append_base
+from utils.stream_writer import StreamingPdfWriter
+
+# ログの出力先・レベルはエントリーポイント（main.py・cli.py）で設定する
 logger = logging.getLogger(__name__)
 
 class PDFMergerError(Exception):
     """PDF結合処理のカスタム例外"""
     pass
 
+class MergeCancelledError(PDFMergerError):
+    """結合処理がキャンセルされた場合の例外"""
+    pass
+
+class PDFValidationError(PDFMergerError):
+    """入力ファイルの検証に失敗した場合の例外（statusは失敗の種類、ValidationResult.statusと同じ値）"""
+    
+    def __init__(self, message: str, status: str):
+        super().__init__(message)
+        self.status = status
+
+@dataclass
+class MergeProgress:
+    """結合処理の進捗（progress_callbackに渡される）"""
+    phase: str                    # 'copy': ページコピー中 / 'write': 書き出し中 / 'done': 完了
+    current_file: Optional[str]   # 処理中の入力ファイル
+    file_index: int               # 処理中の入力の番号（0始まり）
+    file_count: int               # 入力ファイル数
+    pages_copied: int             # コピー済みページ数
+    bytes_written: int            # 出力ファイルへ書き出したバイト数
+
+@dataclass
+class MergeJob:
+    """バッチ結合の1ジョブ（入力ファイルと出力先）"""
+    pdf_files: List[Union[str, PageSelection]]
+    output_path: str
+
+@dataclass
+class MergeJobResult:
+    """バッチ結合の1ジョブの結果"""
+    output_path: str
+    success: bool
+    page_count: int = 0
+    input_count: int = 0
+    elapsed: float = 0.0
+    error: Optional[str] = None
+    bytes_saved: int = 0          # 重複排除で省いたバイト数
+    image_bytes_saved: int = 0    # 画像の再エンコードで省いたバイト数
+    skipped: bool = False         # チェックポイントにより最新と判定され、実行を省略した
+    stats: Optional[MergeStats] = None   # 計測結果（実行を省略した場合None）
+    output_files: Optional[List[str]] = None   # 分割出力した場合の出力ファイル（順序通り）
+
+@dataclass
+class ValidationResult:
+    """入力ファイル1件の検証結果（validate_manyが返す）"""
+    file_path: str
+    # 'ok': 結合可能 / 'missing': ファイルが存在しない / 'not_pdf': PDFファイルではない /
+    # 'encrypted': パスワードが必要 / 'no_pages': ページがない / 'invalid_range': ページ範囲が不正 /
+    # 'parse_error': 解析に失敗
+    status: str
+    page_count: int = 0
+    error: Optional[str] = None
+    elapsed: float = 0.0          # 検証の所要時間（秒）
+    
+    @property
+    def ok(self) -> bool:
+        return self.status == 'ok'
+
+class _OpenedPDF:
+    """一度だけ解析したPDFと読み込み元をまとめて保持するハンドル"""
+    
+    def __init__(self, file_path: str, source: InputSource, reader: PdfReader):
+        self.file_path = file_path
+        self.reader = reader
+        self.page_count = len(reader.pages)
+        self.file_size = source.size
+        self.selected_pages: Optional[List[int]] = None   # Noneの場合は全ページ
+        self.image_stats: Optional[ImageStats] = None      # 画像を再エンコードした場合の結果
+        self._source = source
+    
+    @property
+    def page_indices(self) -> Sequence[int]:
+        """結合するページ番号（0始まり、順序通り）"""
+        return self.selected_pages if self.selected_pages is not None else range(self.page_count)
+    
+    def close(self):
+        """読み込み元を閉じる"""
+        # readerが読み込み元を参照しなくなってから閉じる
+        self.reader = None
+        if self._source is not None:
+            self._source.close()
+            self._source = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class _MergeMonitor:
+    """結合処理の進捗通知とキャンセル確認を行う"""
+    
+    # 書き出し中の進捗通知の間隔（バイト）
+    BYTES_REPORT_INTERVAL = 256 * 1024
+    
+    def __init__(self, file_count: int = 0,
+                 progress_callback: Optional[Callable[[MergeProgress], None]] = None,
+                 cancel_event: Optional[threading.Event] = None):
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event
+        self.phase = 'copy'
+        self.current_file = None
+        self.file_index = -1
+        self.file_count = file_count
+        self.pages_copied = 0
+        self.bytes_written = 0
+        self._last_reported_bytes = 0
+    
+    def check_cancelled(self):
+        """キャンセルが要求されていればMergeCancelledErrorを送出"""
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise MergeCancelledError("結合処理がキャンセルされました")
+    
+    def start_file(self, file_path: str):
+        self.file_index += 1
+        self.current_file = file_path
+        self.notify()
+    
+    def page_copied(self):
+        self.pages_copied += 1
+        self.notify()
+    
+    def start_phase(self, phase: str):
+        self.phase = phase
+        self.notify()
+    
+    def add_bytes(self, size: int):
+        self.bytes_written += size
+        if self.bytes_written - self._last_reported_bytes >= self.BYTES_REPORT_INTERVAL:
+            self._last_reported_bytes = self.bytes_written
+            self.notify()
+    
+    def notify(self):
+        if self.progress_callback is not None:
+            self.progress_callback(MergeProgress(
+                phase=self.phase,
+                current_file=self.current_file,
+                file_index=self.file_index,
+                file_count=self.file_count,
+                pages_copied=self.pages_copied,
+                bytes_written=self.bytes_written
+            ))
+
+class _MonitoredStream:
+    """書き込んだバイト数を数え、書き込みごとにキャンセルを確認する出力ストリーム"""
+    
+    def __init__(self, stream, monitor: _MergeMonitor):
+        self._stream = stream
+        self._monitor = monitor
+    
+    def write(self, data) -> int:
+        self._monitor.check_cancelled()
+        written = self._stream.write(data)
+        self._monitor.add_bytes(len(data))
+        return written
+    
+    def tell(self) -> int:
+        return self._stream.tell()
+    
+    def flush(self):
+        self._stream.flush()
+
 class PDFMerger:
     """PDF結合処理クラス"""
     
-    def __init__(self):
+    def __init__(self, streaming: bool = False, read_ahead: int = 0,
+                 cache: Optional[PDFInfoCache] = None, deduplicate: bool = False,
+                 profile: Union[str, OutputProfile] = DEFAULT_PROFILE,
+                 image_options: Optional[ImageDownsampleOptions] = None, fast_info: bool = True,
+                 use_mmap: bool = True, fsync: str = DEFAULT_FSYNC, incremental: bool = False,
+                 hooks: Optional[List[MergeHooks]] = None, split_options: Optional[SplitOptions] = None):
+        """
+        Args:
+            streaming (bool): Trueの場合、入力ごとにページを出力ファイルへ逐次書き出す
+                （ピークメモリが入力の総量ではなく最大の入力1件分に収まる）
+            read_ahead (int): 結合中に後続の入力を先読み・解析しておく件数（0の場合は先読みしない）
+            cache (Optional[PDFInfoCache]): get_pdf_infoが参照するPDF情報キャッシュ
+            deduplicate (bool): Trueの場合、入力間で同一内容のストリーム（フォント・画像など）を
+                1つにまとめて出力する（結果はdedup_statsに格納）
+            profile (str | OutputProfile): 出力プロファイル（fast / compact / archive）。
+                圧縮・オブジェクトストリームを伴うプロファイルは常に逐次書き出しで出力する
+            image_options (Optional[ImageDownsampleOptions]): 指定した場合、目標解像度・サイズを超える
+                埋め込み画像をJPEGに再エンコードしてから結合する（入力ごとの結果はimage_statsに格納）
+            fast_info (bool): Trueの場合、get_pdf_infoはページツリーを展開せず
+                ファイル末尾の相互参照情報から/Pagesの/Countを読む（簡易解析できない場合は全体を解析）
+            use_mmap (bool): Trueの場合、入力ファイルをメモリマップして読み込む
+                （メモリマップできないファイルはバッファ付きの通常の読み込みを使用）
+            fsync (str): 出力ファイルのfsyncの方針（none / file / file+dir）。
+                出力は常に同じディレクトリの一時ファイルに書き出してから置き換える
+            incremental (bool): Trueの場合、結合結果の隣に入力のフィンガープリントを記録し（<出力>.merge.json）、
+                次回の結合で前回の入力が変更のない先頭部分であれば、前回の出力に新しい入力のページだけを
+                増分更新として追記する（それ以外の場合は全体を結合し直す）
+            hooks (Optional[List[MergeHooks]]): 計測フック（JsonLinesHook・CProfileHook・TracemallocHookなど）。
+                計測結果は結合ごとにmerge_statsにも格納される。バッチ結合ではワーカーから戻った
+                ジョブごとの結果に対してon_merge_endだけを呼ぶ
+            split_options (Optional[SplitOptions]): 指定した場合、ページ数・推定バイト数の上限に達するごとに
+                出力を out_001.pdf, out_002.pdf, … に分けて書き出す（常に逐次書き出し。出力ファイルはoutput_filesに格納）
+            
+        Raises:
+            ValueError: 未知のfsyncの方針の場合、分割出力と増分結合を同時に指定した場合
+        """
         self.writer = None
+        self.streaming = streaming
+        self.read_ahead = max(0, read_ahead)
+        self.cache = cache
+        self.deduplicate = deduplicate
+        self.profile = get_output_profile(profile)
+        self.dedup_stats: Optional[DedupStats] = None
+        self.image_options = image_options
+        self.image_stats: List[ImageStats] = []
+        self.fast_info = fast_info
+        self.use_mmap = use_mmap
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"未知のfsyncの方針です: {fsync} (指定可能: {', '.join(FSYNC_POLICIES)})")
+        self.fsync = fsync
+        self.incremental = incremental
+        if split_options is not None and incremental:
+            raise ValueError("分割出力は増分結合と同時に指定できません")
+        self.split_options = split_options
+        self.output_files: List[str] = []
+        self.hooks: List[MergeHooks] = list(hooks or [])
+        self.merge_stats: Optional[MergeStats] = None
+        self._recorder = StatsRecorder()
+        self._monitor = _MergeMonitor()
+        self._deduplicator: Optional[StreamDeduplicator] = None
+        self._image_executor: Optional[ProcessPoolExecutor] = None
         self.reset()
     
     def reset(self):
         """PDFWriterをリセット"""
         self.writer = PdfWriter()
     
+    def _open_pdf(self, file_path: str, prefetch: bool = False,
+                  recorder: Optional[StatsRecorder] = None) -> _OpenedPDF:
+        """
+        PDFファイルを開いて一度だけ解析する
+        
+        検証・ページ数取得・ページコピーはすべて返されたハンドルの
+        readerを使い回し、同じファイルを再度解析しない
+        
+        Args:
+            file_path (str): PDFファイルパス
+            prefetch (bool): Trueの場合、ファイル全体の先読みをカーネルに依頼する（全ページを読む結合時）
+            recorder (Optional[StatsRecorder]): 読み込み・解析の時間を記録する先（Noneの場合は実行中の結合の計測）。
+                結合以外の処理は別のスレッドから結合中に呼ばれることがあるため、専用の記録先を渡す
+            
+        Returns:
+            _OpenedPDF: 解析済みPDFのハンドル（呼び出し側でcloseする）
+            
+        Raises:
+            PDFValidationError: ファイルが存在しない、PDFでない、暗号化されている、解析できない、ページがない場合
+        """
+        if not Path(file_path).exists():
+            raise PDFValidationError(f"ファイルが存在しません: {file_path}", 'missing')
+        
+        if not file_path.lower().endswith('.pdf'):
+            raise PDFValidationError(f"PDFファイルではありません: {file_path}", 'not_pdf')
+        
+        recorder = recorder or self._recorder
+        with recorder.phase('open', file_path):
+            source = open_input(file_path, use_mmap=self.use_mmap, prefetch=prefetch)
+            recorder.add_bytes_read(source.size)
+        try:
+            with recorder.phase('parse', file_path):
+                opened = _OpenedPDF(file_path, source, PdfReader(source.stream))
+        except FileNotDecryptedError as e:
+            source.close()
+            raise PDFValidationError(f"パスワードで暗号化されたPDFです: {file_path}", 'encrypted') from e
+        except Exception as e:
+            source.close()
+            status = 'parse_error' if _has_pdf_header(file_path) else 'not_pdf'
+            raise PDFValidationError(f"PDFファイルの検証に失敗: {file_path}, エラー: {e}", status) from e
+        
+        if opened.page_count == 0:
+            opened.close()
+            raise PDFValidationError(f"ページが存在しないPDFです: {file_path}", 'no_pages')
+        
+        return opened
+    
     def validate_pdf_file(self, file_path: str) -> bool:
         """
         PDFファイルの妥当性チェック
@@ -37,78 +331,636 @@ class PDFMerger:
         Returns:
             bool: 妥当な場合True
         """
+        result = self._validate(file_path)
+        if not result.ok:
+            logger.error(result.error)
+        return result.ok
+    
+    def validate_many(self, pdf_files: List[Union[str, PageSelection]], max_workers: Optional[int] = None,
+                      use_processes: bool = False) -> List[ValidationResult]:
+        """
+        複数の入力ファイルをまとめて並列に検証
+        
+        結合と同じ解析で全ての入力を検証し、最初の失敗で止めずにファイルごとの結果を返す。
+        結合の前に呼び出すことで、出力を書き始める前に問題のある入力をすべて把握できる
+        
+        Args:
+            pdf_files (List[str | PageSelection]): 検証するファイルのリスト。
+                PageSelectionの場合はページ範囲がページ数に収まるかも検証する
+            max_workers (Optional[int]): 並列数（Noneの場合はプールの既定値、1の場合は呼び出したスレッドで順に検証）
+            use_processes (bool): Trueの場合プロセスプールで検証する（解析はCPU処理が中心のため、
+                ファイル数が多くローカルディスク上にある場合に速い）。Falseの場合スレッドプール
+            
+        Returns:
+            List[ValidationResult]: ファイルごとの検証結果（pdf_filesと同じ順序）
+        """
+        if not pdf_files:
+            return []
+        if max_workers is not None:
+            max_workers = max(1, min(max_workers, len(pdf_files)))
+        
+        if max_workers == 1:
+            results = [self._validate(item) for item in pdf_files]
+        elif use_processes:
+            # ファイルごとの検証は短時間のため、まとめてワーカーへ渡してプロセス間通信を減らす
+            workers = max_workers or os.cpu_count() or 1
+            chunksize = max(1, len(pdf_files) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(_run_validation, pdf_files, [self.use_mmap] * len(pdf_files),
+                                            chunksize=chunksize))
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pdf-validate") as executor:
+                results = list(executor.map(self._validate, pdf_files))
+        
+        failed = sum(1 for result in results if not result.ok)
+        logger.info(f"入力ファイルの検証完了: {len(results) - failed}/{len(results)} 件が結合可能")
+        return results
+    
+    def _validate(self, item: Union[str, PageSelection]) -> ValidationResult:
+        """入力ファイル1件を検証（失敗は例外ではなく結果のstatus・errorで返す）"""
+        selection = item if isinstance(item, PageSelection) else PageSelection(item)
+        start = time.perf_counter()
+        page_count = 0
         try:
-            if not Path(file_path).exists():
-                logger.error(f"ファイルが存在しません: {file_path}")
-                return False
-            
-            if not file_path.lower().endswith('.pdf'):
-                logger.error(f"PDFファイルではありません: {file_path}")
-                return False
-            
-            # PDFファイルの読み込みテスト
-            with open(file_path, 'rb') as file:
-                reader = PdfReader(file)
-                if len(reader.pages) == 0:
-                    logger.error(f"ページが存在しないPDFです: {file_path}")
-                    return False
-                    
+            with self._open_pdf(selection.file_path, recorder=StatsRecorder()) as opened:
+                page_count = opened.page_count
+            if selection.pages:
+                try:
+                    selection.resolve(page_count)
+                except PageRangeError as e:
+                    raise PDFValidationError(f"{e}: {selection.file_path}", 'invalid_range') from e
+            status, error = 'ok', None
+        except PDFValidationError as e:
+            status, error = e.status, str(e)
+        except Exception as e:
+            status, error = 'parse_error', f"PDFファイルの検証に失敗: {selection.file_path}, エラー: {e}"
+        
+        return ValidationResult(file_path=selection.file_path, status=status, page_count=page_count,
+                                error=error, elapsed=time.perf_counter() - start)
+    
+    def merge_pdfs(self, pdf_files: List[Union[str, PageSelection]], output_path: str,
+                   progress_callback: Optional[Callable[[MergeProgress], None]] = None,
+                   cancel_event: Optional[threading.Event] = None) -> bool:
+        """
+        複数のPDFファイルを指定順序で結合
+        
+        各ファイルは一度だけ開いて解析し、同じreaderで検証とページコピーを行う
+        
+        Args:
+            pdf_files (List[str | PageSelection]): 結合するPDFファイルのリスト（順序通り）。
+                PageSelectionの場合は指定された範囲のページだけをコピーする
+            output_path (str): 出力ファイルパス
+            progress_callback (Optional[Callable[[MergeProgress], None]]): 
+                ファイル開始・ページコピー・書き出しの進捗ごとに呼ばれるコールバック（結合処理のスレッドで呼ばれる）
+            cancel_event (Optional[threading.Event]): セットされると結合を中止する（既存の出力ファイルは変更しない）
+            
+        Returns:
+            bool: 成功した場合True（キャンセル時はFalse）
+        """
+        try:
+            self._merge(pdf_files, output_path, progress_callback, cancel_event)
             return True
             
+        except MergeCancelledError:
+            logger.info(f"PDF結合処理をキャンセルしました: {output_path}")
+            return False
         except Exception as e:
-            logger.error(f"PDFファイルの検証に失敗: {file_path}, エラー: {e}")
+            logger.error(f"PDF結合処理に失敗: {e}")
             return False
     
-    def merge_pdfs(self, pdf_files: List[str], output_path: str) -> bool:
+    def merge_page_specs(self, specs: List[str], output_path: str,
+                         progress_callback: Optional[Callable[[MergeProgress], None]] = None,
+                         cancel_event: Optional[threading.Event] = None) -> bool:
         """
-        複数のPDFファイルを指定順序で結合
+        ページ範囲付きの入力指定で結合
+        
+        "a.pdf:1-3,7" は1〜3ページ目と7ページ目、"b.pdf:-1" は最終ページ、"c.pdf" は全ページを結合する。
+        選択されたページだけを1回の結合でコピーするため、結合後に分割し直す必要はない
         
         Args:
-            pdf_files (List[str]): 結合するPDFファイルのリスト（順序通り）
+            specs (List[str]): "path:ranges" 形式の入力指定のリスト（順序通り）
             output_path (str): 出力ファイルパス
+            progress_callback (Optional[Callable[[MergeProgress], None]]): 進捗コールバック
+            cancel_event (Optional[threading.Event]): キャンセル要求
             
         Returns:
             bool: 成功した場合True
         """
+        selections = [parse_page_spec(spec) for spec in specs]
+        return self.merge_pdfs(selections, output_path, progress_callback, cancel_event)
+    
+    def merge_batch(self, jobs: Iterable[Union['MergeJob', Tuple[List[str], str]]],
+                    max_workers: Optional[int] = None,
+                    on_result: Optional[Callable[['MergeJobResult'], None]] = None,
+                    checkpoint: Optional[str] = None) -> List['MergeJobResult']:
+        """
+        独立した複数の結合ジョブをプロセスプールで並列実行
+        
+        各ジョブはワーカープロセス内の個別のPDFMergerで処理されるため、
+        1つのジョブが失敗しても他のジョブには影響しない
+        
+        Args:
+            jobs (Iterable[MergeJob | Tuple[List[str], str]]): 結合ジョブ（入力リストと出力パス）
+            max_workers (Optional[int]): ワーカープロセス数（Noneの場合CPUコア数、1の場合は同一プロセスで順に実行）
+            on_result (Optional[Callable[[MergeJobResult], None]]): ジョブ完了ごとに呼ばれるコールバック
+            checkpoint (Optional[str]): チェックポイントファイルのパス。指定した場合、完了したジョブを記録し、
+                前回の実行以降に入力・設定・出力が変わっていないジョブは実行を省略する（結果のskippedがTrue）
+            
+        Returns:
+            List[MergeJobResult]: ジョブごとの結果（jobsと同じ順序）
+        """
+        jobs = [job if isinstance(job, MergeJob) else MergeJob(list(job[0]), job[1]) for job in jobs]
+        results: List[Optional[MergeJobResult]] = [None] * len(jobs)
+        options = self._worker_options()
+        if checkpoint and self.split_options is not None:
+            logger.warning("分割出力ではチェックポイントを使用できないため、すべてのジョブを実行します")
+            checkpoint = None
+        progress = BatchCheckpoint(checkpoint, self._options_key()) if checkpoint else None
+        
+        def finish(index: int, result: MergeJobResult) -> None:
+            results[index] = result
+            if progress is not None and result.success and not result.skipped:
+                progress.mark_complete(jobs[index].pdf_files, result.output_path, result.page_count)
+            if result.stats is not None:
+                for hook in self.hooks:
+                    hook.on_merge_end(result.stats)
+            if on_result:
+                on_result(result)
+        
+        pending = []
+        for index, job in enumerate(jobs):
+            page_count = progress.completed_page_count(job.pdf_files, job.output_path) if progress else None
+            if page_count is None:
+                pending.append(index)
+            else:
+                finish(index, MergeJobResult(output_path=job.output_path, success=True, page_count=page_count,
+                                             input_count=len(job.pdf_files), skipped=True))
+        
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, len(pending) or 1))
+        
+        if max_workers == 1:
+            for index in pending:
+                finish(index, _run_merge_job(jobs[index], options))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(_run_merge_job, jobs[index], options): index
+                    for index in pending
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        # ワーカープロセス自体が異常終了した場合もジョブ単位の失敗として扱う
+                        result = MergeJobResult(
+                            output_path=jobs[index].output_path,
+                            success=False,
+                            input_count=len(jobs[index].pdf_files),
+                            error=f"ワーカープロセスが異常終了しました: {e}"
+                        )
+                    finish(index, result)
+        
+        succeeded = sum(1 for result in results if result.success)
+        logger.info(f"バッチ結合完了: {succeeded}/{len(results)} ジョブ成功")
+        return results
+    
+    def _worker_options(self) -> dict:
+        """ワーカープロセスで同じ設定のPDFMergerを作成するための引数"""
+        image_options = self.image_options
+        if image_options is not None:
+            # ジョブ単位で並列実行するため、ワーカー内では画像もそのプロセスで再エンコードする
+            image_options = replace(image_options, max_workers=1)
+        return {'streaming': self.streaming, 'read_ahead': self.read_ahead,
+                'deduplicate': self.deduplicate, 'profile': self.profile,
+                'image_options': image_options, 'use_mmap': self.use_mmap, 'fsync': self.fsync,
+                'incremental': self.incremental, 'split_options': self.split_options}
+    
+    def _options_key(self) -> str:
+        """出力内容に影響する設定を表すキー（チェックポイントで設定の変更を検出するために使う）"""
+        options = {
+            'streaming': self.streaming,
+            'deduplicate': self.deduplicate,
+            'profile': asdict(self.profile),
+            'image_options': asdict(self.image_options) if self.image_options is not None else None
+        }
+        if options['image_options'] is not None:
+            options['image_options'].pop('max_workers')
+        encoded = json.dumps(options, sort_keys=True).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()[:16]
+    
+    def _merge(self, pdf_files: List[Union[str, PageSelection]], output_path: str,
+               progress_callback: Optional[Callable[[MergeProgress], None]] = None,
+               cancel_event: Optional[threading.Event] = None) -> int:
+        """
+        結合処理本体（失敗時は例外を送出）
+        
+        Args:
+            pdf_files (List[str | PageSelection]): 結合するPDFファイルのリスト（順序通り）
+            output_path (str): 出力ファイルパス
+            progress_callback (Optional[Callable[[MergeProgress], None]]): 進捗コールバック
+            cancel_event (Optional[threading.Event]): キャンセル要求
+            
+        Returns:
+            int: 総ページ数
+        """
+        if not pdf_files:
+            raise PDFMergerError("結合するPDFファイルが指定されていません")
+        
+        # 出力ディレクトリの存在確認
+        output_dir = Path(output_path).parent
+        if not output_dir.exists():
+            output_dir.mkdir(parents=True, exist_ok=True)
+        
+        self._monitor = _MergeMonitor(len(pdf_files), progress_callback, cancel_event)
+        deduplicate = self.deduplicate or self.profile.deduplicate
+        self._deduplicator = StreamDeduplicator() if deduplicate else None
+        self.dedup_stats = None
+        self.image_stats = []
+        if self.image_options is not None and self.image_options.max_workers != 1:
+            self._image_executor = ProcessPoolExecutor(max_workers=self.image_options.max_workers)
+        self._recorder = StatsRecorder(output_path, len(pdf_files), self.hooks)
+        self._recorder.start()
+        self.output_files = []
+        total_pages = None
+        error = None
         try:
-            if not pdf_files:
-                raise PDFMergerError("結合するPDFファイルが指定されていません")
+            manifest = MergeManifest.load(output_path) if self.incremental else None
+            if manifest is not None:
+                total_pages = self._merge_incremental(pdf_files, output_path, manifest)
             
-            # 出力ディレクトリの存在確認
-            output_dir = Path(output_path).parent
-            if not output_dir.exists():
-                output_dir.mkdir(parents=True, exist_ok=True)
+            if self.split_options is not None:
+                total_pages = self._merge_split(pdf_files, output_path)
+            elif total_pages is None:
+                # pypdfの書き出しは圧縮・オブジェクトストリームに対応しないため、逐次書き出しで出力する
+                if self.streaming or self.profile.rewrites_output:
+                    total_pages = self._merge_streaming(pdf_files, output_path)
+                else:
+                    total_pages = self._merge_in_memory(pdf_files, output_path)
+                self.output_files = [output_path]
             
-            # PDFWriterをリセット
-            self.reset()
+            if self.incremental:
+                MergeManifest.record(pdf_files, output_path, self._options_key(), total_pages,
+                                     previous=manifest).save(output_path, self.fsync)
             
-            total_pages = 0
+            self._monitor.start_phase('done')
+            if self._deduplicator is not None:
+                self.dedup_stats = self._deduplicator.stats
+        except BaseException as e:
+            error = str(e) or type(e).__name__
+            raise
+        finally:
+            page_count = total_pages if total_pages is not None else self._monitor.pages_copied
+            self.merge_stats = self._recorder.finish(page_count, self._monitor.bytes_written, error)
+            self._recorder = StatsRecorder()
+            self._monitor = _MergeMonitor()
+            self._deduplicator = None
+            if self._image_executor is not None:
+                self._image_executor.shutdown(cancel_futures=True)
+                self._image_executor = None
+        
+        logger.info(f"PDF結合完了: {output_path} (総ページ数: {total_pages}, 出力プロファイル: {self.profile.name})")
+        if self.dedup_stats is not None:
+            stats = self.dedup_stats
+            logger.info(f"重複リソースの共有: {stats.duplicates}/{stats.streams_seen} ストリーム, "
+                        f"{stats.bytes_saved}バイト削減 ({stats.elapsed:.3f}秒)")
+        phases = ", ".join(f"{name} {elapsed:.3f}秒" for name, elapsed in self.merge_stats.phases.items())
+        logger.debug(f"結合処理の内訳: {phases} (全体 {self.merge_stats.elapsed:.3f}秒)")
+        return total_pages
+    
+    def _open_pdf_for_merge(self, item: Union[str, PageSelection]) -> _OpenedPDF:
+        """結合対象のPDFファイルを開いて解析し、結合するページを決定（失敗時は結合失敗として送出）"""
+        selection = item if isinstance(item, PageSelection) else PageSelection(item)
+        try:
+            opened = self._open_pdf(selection.file_path, prefetch=True)
+            if selection.pages:
+                try:
+                    opened.selected_pages = selection.resolve(opened.page_count)
+                except PageRangeError as e:
+                    opened.close()
+                    raise PDFValidationError(f"{e}: {selection.file_path}", 'invalid_range') from e
+            if self.image_options is not None:
+                self._downsample_images(opened)
+            return opened
+        except PDFValidationError as e:
+            logger.error(str(e))
+            raise PDFValidationError(f"PDFファイルの追加に失敗: {e}", e.status) from e
+    
+    def _downsample_images(self, opened: _OpenedPDF):
+        """結合するページが参照する画像を再エンコード（失敗した場合は元の画像のまま結合する）"""
+        pages = opened.reader.pages
+        if opened.selected_pages is not None:
+            pages = [pages[index] for index in sorted(set(opened.selected_pages))]
+        try:
+            with self._recorder.phase('images', opened.file_path):
+                opened.image_stats = downsample_images(
+                    opened.file_path, pages, self.image_options, self._image_executor
+                )
+        except Exception as e:
+            logger.warning(f"画像の再エンコードに失敗したため元の画像で結合します: {opened.file_path}, エラー: {e}")
+    
+    def _iter_opened_pdfs(self, pdf_files: List[Union[str, PageSelection]]) -> Iterator[_OpenedPDF]:
+        """
+        結合対象のPDFファイルを指定順序で開いて返す
+        
+        read_aheadが1以上の場合、現在のファイルのページコピー中に
+        後続のファイルをスレッドプールで先読み・解析しておく。
+        先読みは最大read_ahead件までのため、同時に開くファイル数は read_ahead + 1 件に収まる。
+        返されたハンドルのcloseは呼び出し側で行う
+        
+        Args:
+            pdf_files (List[str | PageSelection]): 結合するPDFファイルのリスト（順序通り）
             
-            # 指定順序でPDFを結合
+        Yields:
+            _OpenedPDF: 解析済みPDFのハンドル（pdf_filesと同じ順序）
+        """
+        if self.read_ahead <= 0:
             for file_path in pdf_files:
-                if self.validate_pdf_file(file_path):
-                    with open(file_path, 'rb') as file:
-                        reader = PdfReader(file)
-                        for page_num in range(len(reader.pages)):
-                            page = reader.pages[page_num]
-                            self.writer.add_page(page)
-                        total_pages += len(reader.pages)
-                else:
-                    raise PDFMergerError(f"PDFファイルの追加に失敗: {file_path}")
+                yield self._open_pdf_for_merge(file_path)
+            return
+        
+        remaining = iter(pdf_files)
+        pending: Deque[Future] = deque()
+        
+        with ThreadPoolExecutor(max_workers=self.read_ahead, thread_name_prefix="pdf-read-ahead") as executor:
+            try:
+                for file_path in islice(remaining, self.read_ahead):
+                    pending.append(executor.submit(self._open_pdf_for_merge, file_path))
+                
+                while pending:
+                    future = pending.popleft()
+                    for file_path in islice(remaining, 1):
+                        pending.append(executor.submit(self._open_pdf_for_merge, file_path))
+                    # 結果は投入順に取り出すため、出力のページ順序は常に指定順序どおり
+                    yield future.result()
+            finally:
+                # 中断時は先読み済みのファイルを閉じる
+                for future in pending:
+                    if not future.cancel():
+                        try:
+                            future.result().close()
+                        except Exception:
+                            pass
+    
+    def _copy_pages(self, opened: _OpenedPDF) -> int:
+        """
+        解析済みPDFのページ（ページ範囲の指定がある場合は選択されたページのみ）をself.writerへ追加
+        
+        Args:
+            opened (_OpenedPDF): 解析済みPDFのハンドル
             
-            # ページ番号の再割り振り（メタデータ更新）
-            self._update_page_numbers(total_pages)
+        Returns:
+            int: 追加したページ数
+        """
+        self._start_input(opened)
+        return self._add_pages(opened, opened.page_indices)
+    
+    def _start_input(self, opened: _OpenedPDF):
+        """入力1件のページコピーの開始を通知し、画像の再エンコードの結果を記録"""
+        self._monitor.start_file(opened.file_path)
+        if opened.image_stats is not None:
+            stats = opened.image_stats
+            self.image_stats.append(stats)
+            logger.info(f"画像の再エンコード: {Path(opened.file_path).name} "
+                        f"{stats.images_reencoded}/{stats.images_found}個, "
+                        f"{stats.bytes_before / 1024:.0f}KB → {stats.bytes_after / 1024:.0f}KB")
+    
+    def _add_pages(self, opened: _OpenedPDF, indices: Sequence[int]) -> int:
+        """
+        解析済みPDFの指定したページをself.writerへ追加
+        
+        Args:
+            opened (_OpenedPDF): 解析済みPDFのハンドル
+            indices (Sequence[int]): 追加するページ番号（0始まり、順序通り）
             
-            # 結合PDFの出力
-            with open(output_path, 'wb') as output_file:
-                self.writer.write(output_file)
+        Returns:
+            int: 追加したページ数
+        """
+        pages = opened.reader.pages
+        with self._recorder.phase('copy', opened.file_path):
+            for index in indices:
+                self._monitor.check_cancelled()
+                self.writer.add_page(pages[index])
+                self._monitor.page_copied()
+        return len(indices)
+    
+    def _merge_in_memory(self, pdf_files: List[Union[str, PageSelection]], output_path: str) -> int:
+        """全ページをメモリ上のPdfWriterに集めてから一括で書き出す"""
+        # PDFWriterをリセット
+        self.reset()
+        
+        total_pages = 0
+        
+        # 指定順序でPDFを結合
+        with closing(self._iter_opened_pdfs(pdf_files)) as opened_pdfs:
+            for opened in opened_pdfs:
+                with opened:
+                    total_pages += self._copy_pages(opened)
+        
+        # 入力間で同一内容のストリームを1つにまとめる
+        if self._deduplicator is not None:
+            with self._recorder.phase('dedup'):
+                deduplicate_streams(self.writer, self._deduplicator)
+        
+        # ページ番号の再割り振り（メタデータ更新）
+        self._update_page_numbers(total_pages)
+        
+        # 結合PDFの出力
+        self._monitor.start_phase('write')
+        # 一時ファイルに書き出してから置き換えるため、失敗時も既存の出力ファイルは壊れない
+        with atomic_output(output_path, self.fsync) as output_file:
+            with self._recorder.phase('serialize'):
+                self.writer.write(_MonitoredStream(output_file, self._monitor))
+        
+        return total_pages
+    
+    def _merge_streaming(self, pdf_files: List[Union[str, PageSelection]], output_path: str) -> int:
+        """入力ごとにページを出力ファイルへ書き出し、その入力のreaderを解放する"""
+        total_pages = 0
+        
+        try:
+            # 一時ファイルに書き出してから置き換えるため、失敗・キャンセル時も既存の出力ファイルは壊れない
+            with atomic_output(output_path, self.fsync) as output_file:
+                self.writer = StreamingPdfWriter(
+                    _MonitoredStream(output_file, self._monitor),
+                    deduplicator=self._deduplicator,
+                    compress_level=self.profile.compress_level,
+                    recompress=self.profile.recompress,
+                    object_streams=self.profile.object_streams
+                )
+                
+                with closing(self._iter_opened_pdfs(pdf_files)) as opened_pdfs:
+                    for opened in opened_pdfs:
+                        with opened:
+                            total_pages += self._copy_pages(opened)
+                        with self._recorder.phase('serialize', opened.file_path):
+                            self.writer.flush()
+                        # readerと作業用ライターは循環参照を持つため、次の入力の前に明示的に回収する
+                        gc.collect()
+                
+                self._update_page_numbers(total_pages)
+                self._monitor.start_phase('write')
+                with self._recorder.phase('serialize'):
+                    self.writer.close()
+        finally:
+            self.reset()
+        
+        return total_pages
+    
+    def _merge_split(self, pdf_files: List[Union[str, PageSelection]], output_path: str) -> int:
+        """
+        ページ数・推定バイト数の上限に達するごとに新しい出力ファイルへ切り替えて逐次書き出す
+        
+        各出力ファイルは一時ファイルに書き終えてライターを破棄してから次の出力ファイルを開始するため、
+        メモリに残るのは書き出し中の1ファイル分のオフセット表だけ。すべての出力ファイルを書き終えてから
+        まとめて置き換えるため、失敗・キャンセル時は既存の出力ファイルをどれも変更しない。
+        推定バイト数は書き出し済みのバイト数に、未書き出しのページ数 × 入力ファイルの1ページあたりの
+        平均サイズを加えた値
+        
+        Args:
+            pdf_files (List[str | PageSelection]): 結合するPDFファイルのリスト（順序通り）
+            output_path (str): 分割前の出力ファイルパス（出力は <名前>_001.pdf から順に作成する）
             
-            logger.info(f"PDF結合完了: {output_path} (総ページ数: {total_pages})")
-            return True
+        Returns:
+            int: 総ページ数
+        """
+        options = self.split_options
+        shards: List[AtomicOutputFile] = []
+        total_pages = 0
+        shard_pages = 0
+        
+        try:
+            self._start_shard(output_path, shards)
+            with closing(self._iter_opened_pdfs(pdf_files)) as opened_pdfs:
+                for opened in opened_pdfs:
+                    with opened:
+                        self._start_input(opened)
+                        page_bytes = opened.file_size / max(1, opened.page_count)
+                        chunks = options.plan(opened.page_indices, page_bytes, shard_pages, self.writer.bytes_written)
+                        for number, chunk in enumerate(chunks):
+                            if number > 0:
+                                self._finish_shard(shard_pages)
+                                self._start_shard(output_path, shards)
+                                shard_pages = 0
+                            shard_pages += self._add_pages(opened, chunk)
+                        total_pages += sum(len(chunk) for chunk in chunks)
+                    with self._recorder.phase('serialize', opened.file_path):
+                        self.writer.flush()
+                    gc.collect()
             
-        except Exception as e:
-            logger.error(f"PDF結合処理に失敗: {e}")
-            return False
+            self._finish_shard(shard_pages)
+            self._monitor.start_phase('write')
+            while shards:
+                shards.pop(0).commit()
+        finally:
+            for shard in shards:
+                shard.discard()
+            self.reset()
+        
+        for stale_path in stale_split_outputs(output_path, len(self.output_files)):
+            Path(stale_path).unlink()
+            logger.info(f"前回の分割出力を削除: {stale_path}")
+        logger.info(f"分割出力: {len(self.output_files)}ファイル "
+                    f"({Path(self.output_files[0]).name} 〜 {Path(self.output_files[-1]).name})")
+        return total_pages
+    
+    def _start_shard(self, output_path: str, shards: List[AtomicOutputFile]):
+        """分割出力の次の出力ファイルを一時ファイルとして開き、self.writerを切り替える"""
+        shard_path = split_output_path(output_path, len(self.output_files) + 1)
+        shard = atomic_output(shard_path, self.fsync)
+        output_file = shard.__enter__()
+        shards.append(shard)
+        self.output_files.append(shard_path)
+        if self._deduplicator is not None:
+            # 共有するのは同じ出力ファイル内のオブジェクトのみ
+            self._deduplicator.clear()
+        self.writer = StreamingPdfWriter(
+            _MonitoredStream(output_file, self._monitor),
+            deduplicator=self._deduplicator,
+            compress_level=self.profile.compress_level,
+            recompress=self.profile.recompress,
+            object_streams=self.profile.object_streams
+        )
+    
+    def _finish_shard(self, page_count: int):
+        """分割出力の現在の出力ファイルを書き終え、ライターを破棄する（置き換えは全ファイルの完了後）"""
+        self._update_page_numbers(page_count)
+        with self._recorder.phase('serialize'):
+            self.writer.close()
+        max_bytes = self.split_options.max_bytes
+        if max_bytes is not None and self.writer.bytes_written > max_bytes:
+            logger.warning(f"出力ファイルが上限を超えました: {Path(self.output_files[-1]).name} "
+                           f"({self.writer.bytes_written}バイト > {max_bytes}バイト)")
+        self.writer = None
+        gc.collect()
+    
+    def _merge_incremental(self, pdf_files: List[Union[str, PageSelection]], output_path: str,
+                           manifest: MergeManifest) -> Optional[int]:
+        """
+        前回の結合結果に、追加された入力のページだけを増分更新として追記する
+        
+        前回の出力を一時ファイルへ複製し、その末尾に新しいページのオブジェクト・ページツリー・
+        相互参照表（/Prevで前回の相互参照表を参照）を書き足してから置き換える。
+        既存のオブジェクトは解析も再書き出しもしない
+        
+        Args:
+            pdf_files (List[str | PageSelection]): 結合するPDFファイルのリスト（順序通り）
+            output_path (str): 出力ファイルパス
+            manifest (MergeManifest): 前回の結合時のマニフェスト
+            
+        Returns:
+            Optional[int]: 総ページ数。増分結合できない場合はNone（呼び出し側で全体を結合し直す）
+        """
+        reason = manifest.prefix_mismatch(pdf_files, output_path, self._options_key())
+        if reason is None and self.profile.object_streams:
+            reason = "オブジェクトストリームを使う出力プロファイルは増分更新に対応していません"
+        if reason is None:
+            try:
+                base = read_append_base(output_path, use_mmap=self.use_mmap)
+                if base.page_count != manifest.page_count:
+                    reason = "出力ファイルのページ数がマニフェストと一致しません"
+            except (PDFProbeError, OSError) as e:
+                reason = f"出力ファイルに追記できません: {e}"
+        if reason is not None:
+            logger.info(f"全体を結合し直します: {output_path}, 理由: {reason}")
+            return None
+        
+        new_files = pdf_files[len(manifest.inputs):]
+        if not new_files:
+            logger.info(f"入力に変更がないため前回の結合結果をそのまま使用: {output_path}")
+            return manifest.page_count
+        
+        logger.info(f"前回の結合結果に追記: {output_path} (追加の入力: {len(new_files)}件)")
+        self._monitor.file_index = len(manifest.inputs) - 1
+        total_pages = manifest.page_count
+        try:
+            with atomic_output(output_path, self.fsync, copy_existing=True) as output_file:
+                self.writer = StreamingPdfWriter(
+                    _MonitoredStream(output_file, self._monitor),
+                    deduplicator=self._deduplicator,
+                    compress_level=self.profile.compress_level,
+                    recompress=self.profile.recompress,
+                    append_to=base
+                )
+                
+                with closing(self._iter_opened_pdfs(new_files)) as opened_pdfs:
+                    for opened in opened_pdfs:
+                        with opened:
+                            total_pages += self._copy_pages(opened)
+                        with self._recorder.phase('serialize', opened.file_path):
+                            self.writer.flush()
+                        gc.collect()
+                
+                self._update_page_numbers(total_pages)
+                self._monitor.start_phase('write')
+                with self._recorder.phase('serialize'):
+                    self.writer.close()
+        finally:
+            self.reset()
+        
+        return total_pages
     
     def _update_page_numbers(self, total_pages: int):
         """
@@ -127,39 +979,132 @@ class PDFMerger:
                 '/Producer': 'pypdf'
             }
             
-            self.writer.add_metadata(metadata)
+            with self._recorder.phase('metadata'):
+                self.writer.add_metadata(metadata)
             logger.info(f"ページ番号を再割り振り: 1-{total_pages}")
             
         except Exception as e:
             logger.warning(f"ページ番号の再割り振りに失敗: {e}")
     
-    def get_pdf_info(self, file_path: str) -> Optional[dict]:
+    def get_pdf_info(self, file_path: str) -> Optional[PDFInfo]:
         """
         PDFファイルの情報を取得
         
+        fast_infoの場合はまず簡易解析を試み、簡易解析できないファイルのみ文書全体を解析する。
+        cacheが設定されている場合、文書全体を解析するファイルのうち変更されていないものはキャッシュから返して
+        再解析しない（簡易解析はキャッシュの参照より速いため、簡易解析できるファイルにはキャッシュを使わない）。
+        返す情報は解析結果（PdfReader）を参照しないため、保持し続けても解析した文書はメモリに残らない
+        
         Args:
             file_path (str): PDFファイルパス
             
         Returns:
-            Optional[dict]: PDFファイル情報、失敗時はNone
+            Optional[PDFInfo]: PDFファイル情報（辞書と同じ形式でも参照できる）、失敗時はNone
         """
         try:
-            if not self.validate_pdf_file(file_path):
-                return None
+            probe = self._probe_pdf_info(file_path) if self.fast_info else None
+            if probe is not None:
+                return PDFInfo(file_path, probe.page_count, Path(file_path).stat().st_size, probe.metadata)
             
-            with open(file_path, 'rb') as file:
-                reader = PdfReader(file)
-                
-                info = {
-                    'file_path': file_path,
-                    'file_name': Path(file_path).name,
-                    'page_count': len(reader.pages),
-                    'file_size': Path(file_path).stat().st_size,
-                    'metadata': reader.metadata if reader.metadata else {}
-                }
-                
-                return info
+            cache_key = None
+            if self.cache is not None and file_path.lower().endswith('.pdf') and Path(file_path).exists():
+                cache_key = self.cache.fingerprint(file_path)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return PDFInfo(file_path, cached['page_count'], cached['file_size'], cached['metadata'])
+            
+            with self._open_pdf(file_path, recorder=StatsRecorder()) as opened:
+                page_count, metadata = opened.page_count, compact_metadata(opened.reader.metadata)
+            file_size = cache_key.size if cache_key else Path(file_path).stat().st_size
+            info = PDFInfo(file_path, page_count, file_size, metadata)
+            
+            if cache_key is not None:
+                self.cache.put(cache_key, info.page_count, info.metadata)
+            
+            return info
                 
+        except PDFMergerError as e:
+            logger.error(str(e))
+            return None
         except Exception as e:
             logger.error(f"PDFファイル情報の取得に失敗: {file_path}, エラー: {e}")
             return None
+    
+    def _probe_pdf_info(self, file_path: str) -> Optional[PDFProbe]:
+        """
+        ファイル末尾の相互参照情報だけを読む簡易解析でページ数とメタデータを取得
+        
+        Args:
+            file_path (str): PDFファイルパス
+            
+        Returns:
+            Optional[PDFProbe]: 簡易解析の結果。破損・暗号化などで簡易解析できない場合と
+                ページ数が0の場合はNone（文書全体の解析で検証する）
+        """
+        if not file_path.lower().endswith('.pdf'):
+            return None
+        try:
+            probe = probe_pdf(file_path, use_mmap=self.use_mmap)
+        except (PDFProbeError, OSError) as e:
+            logger.debug(f"簡易解析できないため文書全体を解析: {file_path}, 理由: {e}")
+            return None
+        return probe if probe.page_count > 0 else None
+
+def _has_pdf_header(file_path: str) -> bool:
+    """ファイル先頭1KB以内にPDFヘッダー（%PDF-）があるか"""
+    try:
+        with open(file_path, 'rb') as file:
+            return b"%PDF-" in file.read(1024)
+    except OSError:
+        return False
+
+def _run_validation(item: Union[str, PageSelection], use_mmap: bool) -> ValidationResult:
+    """
+    入力ファイル1件を検証（ProcessPoolExecutorから呼ばれるためモジュールレベルに定義）
+    
+    Args:
+        item (str | PageSelection): 検証するファイル
+        use_mmap (bool): 入力ファイルをメモリマップで読み込むか
+        
+    Returns:
+        ValidationResult: 検証結果
+    """
+    return PDFMerger(use_mmap=use_mmap)._validate(item)
+
+def _run_merge_job(job: MergeJob, options: dict) -> MergeJobResult:
+    """
+    1つの結合ジョブを実行（ProcessPoolExecutorから呼ばれるためモジュールレベルに定義）
+    
+    Args:
+        job (MergeJob): 結合ジョブ
+        options (dict): PDFMergerのコンストラクタ引数
+        
+    Returns:
+        MergeJobResult: ジョブの結果（例外は結果のerrorに格納）
+    """
+    start = time.perf_counter()
+    merger = None
+    try:
+        merger = PDFMerger(**options)
+        page_count = merger._merge(job.pdf_files, job.output_path)
+        return MergeJobResult(
+            output_path=job.output_path,
+            success=True,
+            page_count=page_count,
+            input_count=len(job.pdf_files),
+            elapsed=time.perf_counter() - start,
+            bytes_saved=merger.dedup_stats.bytes_saved if merger.dedup_stats else 0,
+            image_bytes_saved=sum(stats.bytes_saved for stats in merger.image_stats),
+            stats=merger.merge_stats,
+            output_files=merger.output_files if merger.split_options is not None else None
+        )
+    except Exception as e:
+        logger.error(f"PDF結合処理に失敗: {job.output_path}, エラー: {e}")
+        return MergeJobResult(
+            output_path=job.output_path,
+            success=False,
+            input_count=len(job.pdf_files),
+            elapsed=time.perf_counter() - start,
+            error=str(e),
+            stats=merger.merge_stats if merger is not None else None
+        )
@@ -6,6 +6,7 @@ setup(
     author="PDF Merger Tool",
     description="Windows 11対応PDF結合ツール",
     packages=find_packages(),
+    py_modules=["main", "cli", "pdf_merger"],
     install_requires=[
         "customtkinter>=5.2.0",
         "pypdf>=5.6.0",
@@ -15,6 +16,7 @@ setup(
     entry_points={
         "console_scripts": [
             "pdf-merger=main:main",
+            "pdf-merger-cli=cli:main",
         ],
     },
     classifiers=[
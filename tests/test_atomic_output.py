@@ -0,0 +1,142 @@
+"""
+アトミック出力とバッチのチェックポイントのテストモジュール
+"""
+
+import unittest
+import tempfile
+import os
+import shutil
+import threading
+
+from pypdf import PdfReader
+
+from pdf_merger import PDFMerger
+from utils.atomic_output import FSYNC_POLICIES, atomic_output
+from utils.checkpoint import BatchCheckpoint
+from benchmarks.corpus import make_pdf
+
+class TestAtomicOutput(unittest.TestCase):
+    """atomic_outputのテスト"""
+
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_path = os.path.join(self.temp_dir, "out.pdf")
+
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_commit_replaces_output(self):
+        """正常終了時に出力を置き換え、一時ファイルを残さないテスト"""
+        for policy in FSYNC_POLICIES:
+            with self.subTest(policy=policy):
+                with atomic_output(self.output_path, fsync=policy) as file:
+                    file.write(policy.encode())
+                    # 書き出し中は一時ファイルにのみ書き込む
+                    self.assertEqual(len([name for name in os.listdir(self.temp_dir) if name.endswith(".tmp")]), 1)
+
+                with open(self.output_path, 'rb') as file:
+                    self.assertEqual(file.read(), policy.encode())
+                self.assertEqual(os.listdir(self.temp_dir), ["out.pdf"])
+
+    def test_failure_keeps_previous_output(self):
+        """例外で抜けた場合に既存の出力を変更しないテスト"""
+        with open(self.output_path, 'wb') as file:
+            file.write(b"previous")
+
+        with self.assertRaises(RuntimeError):
+            with atomic_output(self.output_path) as file:
+                file.write(b"partial")
+                raise RuntimeError("中断")
+
+        with open(self.output_path, 'rb') as file:
+            self.assertEqual(file.read(), b"previous")
+        self.assertEqual(os.listdir(self.temp_dir), ["out.pdf"])
+
+    def test_unknown_policy(self):
+        """未知のfsyncの方針でValueErrorになるテスト"""
+        with self.assertRaises(ValueError):
+            atomic_output(self.output_path, fsync="always")
+        with self.assertRaises(ValueError):
+            PDFMerger(fsync="always")
+
+    def test_cancelled_merge_keeps_previous_output(self):
+        """書き出し中にキャンセルしても既存の結合結果が残るテスト"""
+        pdf_files = [make_pdf(os.path.join(self.temp_dir, f"{i}.pdf"), 3, payload_bytes=40000, seed=i)
+                     for i in range(3)]
+        self.assertTrue(PDFMerger().merge_pdfs(pdf_files[:1], self.output_path))
+
+        for streaming in (False, True):
+            with self.subTest(streaming=streaming):
+                cancel_event = threading.Event()
+
+                def on_progress(event):
+                    if event.phase == 'write' and event.bytes_written > 0:
+                        cancel_event.set()
+
+                result = PDFMerger(streaming=streaming).merge_pdfs(
+                    pdf_files, self.output_path, progress_callback=on_progress, cancel_event=cancel_event)
+
+                self.assertFalse(result)
+                self.assertEqual(len(PdfReader(self.output_path).pages), 3)
+                self.assertEqual(sorted(os.listdir(self.temp_dir)), ["0.pdf", "1.pdf", "2.pdf", "out.pdf"])
+
+class TestBatchCheckpoint(unittest.TestCase):
+    """merge_batchのチェックポイントのテスト"""
+
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.checkpoint_path = os.path.join(self.temp_dir, "progress.json")
+        self.jobs = []
+        for name in ("a", "b"):
+            inputs = [make_pdf(os.path.join(self.temp_dir, name, f"{i}.pdf"), 2, seed=i) for i in range(2)]
+            self.jobs.append((inputs, os.path.join(self.temp_dir, "out", f"{name}.pdf")))
+
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _run(self, merger=None):
+        merger = merger or PDFMerger(fsync="none")
+        return merger.merge_batch(self.jobs, max_workers=1, checkpoint=self.checkpoint_path)
+
+    def test_rerun_skips_up_to_date_outputs(self):
+        """再実行時に最新の出力を省略するテスト"""
+        first = self._run()
+        second = self._run()
+
+        self.assertEqual([result.skipped for result in first], [False, False])
+        self.assertEqual([result.skipped for result in second], [True, True])
+        self.assertTrue(all(result.success for result in second))
+        self.assertEqual([result.page_count for result in second], [4, 4])
+
+    def test_changes_invalidate_entries(self):
+        """入力・出力・設定の変更で再実行するテスト"""
+        self._run()
+
+        # 入力の変更はそのジョブだけを再実行する
+        make_pdf(self.jobs[0][0][0], 3)
+        stat = os.stat(self.jobs[0][0][0])
+        os.utime(self.jobs[0][0][0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertEqual([result.skipped for result in self._run()], [False, True])
+
+        # 出力の削除
+        os.remove(self.jobs[1][1])
+        self.assertEqual([result.skipped for result in self._run()], [True, False])
+
+        # 出力内容に影響する設定の変更
+        self.assertEqual([result.skipped for result in self._run(PDFMerger(profile="compact"))], [False, False])
+
+    def test_corrupt_checkpoint_is_ignored(self):
+        """壊れたチェックポイントは無視して最初から実行するテスト"""
+        with open(self.checkpoint_path, 'w', encoding='utf-8') as file:
+            file.write("{broken")
+
+        self.assertEqual(len(BatchCheckpoint(self.checkpoint_path)._entries), 0)
+        self.assertEqual([result.skipped for result in self._run()], [False, False])
+        self.assertEqual([result.skipped for result in self._run()], [True, True])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+ベンチマークスイートと合成コーパスのテストモジュール
+"""
+
+import unittest
+import tempfile
+import io
+import json
+import os
+import shutil
+from unittest import mock
+
+from pypdf import PdfReader
+
+from pdf_merger import PDFMerger
+from benchmarks import suite
+from benchmarks.corpus import make_deep_tree_pdf, make_font_pdf, make_scan_pdf
+
+class TestCorpus(unittest.TestCase):
+    """合成コーパス生成のテスト"""
+
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_deep_tree(self):
+        """深いページツリーのページ数・順序・深さのテスト"""
+        file_path = make_deep_tree_pdf(os.path.join(self.temp_dir, "deep.pdf"), 100, fanout=2)
+        reader = PdfReader(file_path)
+
+        self.assertEqual(len(reader.pages), 100)
+        self.assertIn(b"(Page 100 seed 0)", reader.pages[99].get_contents().get_data())
+        node, depth = reader.trailer["/Root"]["/Pages"], 0
+        while "/Kids" in node:
+            node, depth = node["/Kids"][0].get_object(), depth + 1
+        self.assertEqual(depth, 7)
+        self.assertEqual(PDFMerger().get_pdf_info(file_path)['page_count'], 100)
+
+    def test_deterministic_content(self):
+        """同じシードで同じ内容を生成するテスト"""
+        for factory in (make_scan_pdf, make_font_pdf):
+            with self.subTest(factory=factory.__name__):
+                first = factory(os.path.join(self.temp_dir, "a.pdf"), 2, seed=3)
+                second = factory(os.path.join(self.temp_dir, "b.pdf"), 2, seed=3)
+                self.assertEqual([page.get_contents().get_data() for page in PdfReader(first).pages],
+                                 [page.get_contents().get_data() for page in PdfReader(second).pages])
+
+    def test_shared_fonts_are_deduplicated(self):
+        """フォントを共有する文書群の重複排除テスト"""
+        pdf_files = [make_font_pdf(os.path.join(self.temp_dir, f"{i}.pdf"), 2, font_bytes=16 * 1024, seed=i)
+                     for i in range(3)]
+        merger = PDFMerger(deduplicate=True, fsync="none")
+        self.assertTrue(merger.merge_pdfs(pdf_files, os.path.join(self.temp_dir, "out.pdf")))
+
+        self.assertEqual(merger.dedup_stats.duplicates, 2)
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """ベンチマークスイートのテスト"""
+
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.metrics = {'p50_ms': 10.0, 'peak_memory': 4 * 1024 * 1024}
+
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_compare_budget(self):
+        """許容範囲・揺らぎの範囲内の増加は性能低下とみなさないテスト"""
+        baseline = {'tiny': {'merge_pdfs': self.metrics}}
+        within = {'tiny': {'merge_pdfs': {'p50_ms': 12.0, 'peak_memory': 4 * 1024 * 1024 + 100000}}}
+        slower = {'tiny': {'merge_pdfs': {'p50_ms': 13.0, 'peak_memory': 6 * 1024 * 1024}},
+                  'deep': {'merge_pdfs': self.metrics}}
+
+        self.assertEqual(suite.compare(within, baseline, 0.25, 0.25), [])
+        regressions = suite.compare(slower, baseline, 0.25, 0.25)
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(all(regression.startswith("tiny/merge_pdfs") for regression in regressions))
+        # 揺らぎとみなす下限以下の増加は無視する
+        self.assertEqual(suite.compare(slower, baseline, 0.25, 1.0, min_delta_ms=5.0), [])
+
+    def test_run_suite(self):
+        """計測結果の形式テスト"""
+        spec = suite.CorpusSpec("mini", "テスト用", lambda directory: [
+            make_font_pdf(os.path.join(directory, f"{i}.pdf"), 2, font_bytes=1024, seed=i) for i in range(3)
+        ])
+        results = suite.run_suite([spec], repeat=2, operations=["get_pdf_info", "merge_pdfs"], log=lambda _: None)
+
+        self.assertEqual(set(results['mini']), {"get_pdf_info", "merge_pdfs"})
+        info = results['mini']['get_pdf_info']
+        self.assertEqual(info['calls'], 6)
+        self.assertLessEqual(info['p50_ms'], info['p95_ms'])
+        self.assertLessEqual(info['p95_ms'], info['p99_ms'])
+        self.assertEqual(results['mini']['merge_pdfs']['calls'], 2)
+        self.assertGreater(results['mini']['merge_pdfs']['pages_per_s'], 0)
+        self.assertGreater(results['mini']['merge_pdfs']['peak_memory'], 0)
+
+    def test_main_fails_on_regression(self):
+        """ベースラインより遅い場合に終了コード1を返すテスト"""
+        baseline_path = os.path.join(self.temp_dir, "baseline.json")
+        argv = ["--quick", "--corpus", "scans", "--operation", "validate_many", "--repeat", "1"]
+        with mock.patch("sys.stdout", new_callable=io.StringIO):
+            self.assertEqual(suite.main(argv + ["--save-baseline", baseline_path]), 0)
+
+        with open(baseline_path, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        data['results']['scans']['validate_many']['p50_ms'] = 0.001
+        with open(baseline_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file)
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            exit_code = suite.main(argv + ["--baseline", baseline_path, "--min-delta-ms", "0"])
+        self.assertEqual(exit_code, 1)
+        self.assertIn("REGRESSION scans/validate_many", stdout.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
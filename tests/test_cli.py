@@ -0,0 +1,251 @@
+"""
+コマンドラインエントリーポイントのテストモジュール
+"""
+
+import unittest
+import tempfile
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest import mock
+
+from pypdf import PdfReader
+
+import cli
+from tests.test_pdf_merger import make_pdf
+
+PROJECT_DIR = str(Path(__file__).resolve().parent.parent)
+
+# 起動時間の上限（秒）。インタープリタ自体の起動を含めた値
+STARTUP_BUDGET = 0.5
+
+GUI_MODULES = ("tkinter", "_tkinter", "customtkinter", "tkinterdnd2")
+
+class TestCLI(unittest.TestCase):
+    """cliモジュールのテスト"""
+    
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _run_python(self, code: str) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=PROJECT_DIR, capture_output=True, text=True, check=True
+        )
+    
+    def test_no_gui_modules_imported(self):
+        """CLIの実行でTk関連モジュールを読み込まないテスト"""
+        first = make_pdf(os.path.join(self.temp_dir, "a.pdf"))
+        output_path = os.path.join(self.temp_dir, "merged.pdf")
+        result = self._run_python(
+            "import sys, cli\n"
+            f"cli.main(['merge', '-o', {output_path!r}, {first!r}])\n"
+            f"print(sorted(m for m in sys.modules if m.split('.')[0] in {GUI_MODULES!r}))"
+        )
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "[]")
+    
+    def test_startup_time(self):
+        """--helpの起動時間が予算内に収まるテスト"""
+        # ディスクキャッシュを温めるため一度実行してから計測
+        command = [sys.executable, "cli.py", "--help"]
+        subprocess.run(command, cwd=PROJECT_DIR, capture_output=True, check=True)
+        
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            subprocess.run(command, cwd=PROJECT_DIR, capture_output=True, check=True)
+            timings.append(time.perf_counter() - start)
+        
+        self.assertLess(min(timings), STARTUP_BUDGET)
+    
+    def test_help_does_not_import_pypdf(self):
+        """cliモジュールの読み込みでpypdfを読み込まないテスト"""
+        result = self._run_python("import sys, cli; print('pypdf' in sys.modules)")
+        self.assertEqual(result.stdout.strip(), "False")
+    
+    def test_merge_with_glob(self):
+        """globパターンを含むmergeサブコマンドのテスト"""
+        make_pdf(os.path.join(self.temp_dir, "b.pdf"), 2)
+        make_pdf(os.path.join(self.temp_dir, "a.pdf"), 1)
+        output_path = os.path.join(self.temp_dir, "out", "merged.pdf")
+        
+        exit_code = cli.main(["merge", "-o", output_path, os.path.join(self.temp_dir, "*.pdf")])
+        
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(len(PdfReader(output_path).pages), 3)
+    
+    def test_merge_with_page_ranges(self):
+        """ページ範囲付きの入力指定によるmergeサブコマンドのテスト"""
+        make_pdf(os.path.join(self.temp_dir, "a.pdf"), 4)
+        make_pdf(os.path.join(self.temp_dir, "b.pdf"), 4)
+        output_path = os.path.join(self.temp_dir, "out", "merged.pdf")
+        
+        exit_code = cli.main(["merge", "-o", output_path, os.path.join(self.temp_dir, "*.pdf:1-2"),
+                              os.path.join(self.temp_dir, "a.pdf:-1")])
+        
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(len(PdfReader(output_path).pages), 5)
+    
+    def test_merge_with_downsample(self):
+        """--downsampleで画像を縮小し、入力ごとの削減量を表示するテスト"""
+        from tests.test_image_downsample import make_scan_pdf
+        
+        file_path = make_scan_pdf(os.path.join(self.temp_dir, "scan.pdf"), 600)
+        output_path = os.path.join(self.temp_dir, "merged.pdf")
+        
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            exit_code = cli.main(["merge", "-o", output_path, file_path, "--downsample", "150"])
+        
+        self.assertEqual(exit_code, 0)
+        self.assertIn("画像: scan.pdf: 1/1個を再エンコード", stdout.getvalue())
+        image = PdfReader(output_path).pages[0]['/Resources']['/XObject']['/Im0']
+        self.assertEqual(image['/Width'], 150)
+    
+    def test_merge_missing_input(self):
+        """存在しない入力を指定した場合の終了コードテスト"""
+        output_path = os.path.join(self.temp_dir, "merged.pdf")
+        exit_code = cli.main(["merge", "-o", output_path, os.path.join(self.temp_dir, "none.pdf")])
+        self.assertEqual(exit_code, 1)
+    
+    def test_validate_reports_all_bad_inputs(self):
+        """--validate指定時、全ての不正な入力を表示して出力を作成しないテスト"""
+        valid = make_pdf(os.path.join(self.temp_dir, "a.pdf"), 2)
+        output_path = os.path.join(self.temp_dir, "merged.pdf")
+        argv = ["merge", "--validate", "-o", output_path, valid, os.path.join(self.temp_dir, "none.pdf"),
+                f"{valid}:5", valid]
+        
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            exit_code = cli.main(argv)
+        
+        self.assertEqual(exit_code, 1)
+        self.assertFalse(os.path.exists(output_path))
+        self.assertIn("[missing]", stdout.getvalue())
+        self.assertIn("[invalid_range]", stdout.getvalue())
+        self.assertIn("2/3 ファイル", stdout.getvalue())
+    
+    def test_merge_stats_json(self):
+        """--stats-json指定時、計測結果をJSON Linesで追記するテスト"""
+        first = make_pdf(os.path.join(self.temp_dir, "a.pdf"), 2)
+        stats_path = os.path.join(self.temp_dir, "stats.jsonl")
+        for name in ("x", "y"):
+            output_path = os.path.join(self.temp_dir, f"{name}.pdf")
+            self.assertEqual(cli.main(["merge", "--stats-json", stats_path, "-o", output_path, first, first]), 0)
+        
+        with open(stats_path, 'r', encoding='utf-8') as file:
+            records = [json.loads(line) for line in file]
+        self.assertEqual([record['page_count'] for record in records], [4, 4])
+        self.assertIn('serialize', records[0]['phases'])
+    
+    def test_merge_split(self):
+        """--max-pages指定時、出力を分けて一覧を表示するテスト"""
+        first = make_pdf(os.path.join(self.temp_dir, "a.pdf"), 3)
+        output_path = os.path.join(self.temp_dir, "merged.pdf")
+        
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            exit_code = cli.main(["merge", "--max-pages", "4", "--split-on-file-boundary", "-o", output_path,
+                                  first, first, first])
+        
+        self.assertEqual(exit_code, 0)
+        self.assertIn("3ファイルに分けて結合しました", stdout.getvalue())
+        self.assertEqual([len(PdfReader(os.path.join(self.temp_dir, f"merged_{number:03d}.pdf")).pages)
+                          for number in (1, 2, 3)], [3, 3, 3])
+        self.assertEqual(cli.main(["merge", "--split-on-file-boundary", "-o", output_path, first]), 1)
+    
+    def test_batch_manifest(self):
+        """マニフェストによるbatchサブコマンドのテスト"""
+        for name in ("x", "y"):
+            os.makedirs(os.path.join(self.temp_dir, name))
+            make_pdf(os.path.join(self.temp_dir, name, "1.pdf"))
+            make_pdf(os.path.join(self.temp_dir, name, "2.pdf"))
+        manifest_path = os.path.join(self.temp_dir, "jobs.json")
+        with open(manifest_path, 'w', encoding='utf-8') as file:
+            json.dump({"jobs": [
+                {"output": "out/x.pdf", "inputs": ["x/*.pdf"]},
+                {"output": "out/y.pdf", "inputs": ["y/2.pdf", "y/1.pdf"]},
+            ]}, file)
+        
+        exit_code = cli.main(["batch", "--manifest", manifest_path])
+        
+        self.assertEqual(exit_code, 0)
+        for name in ("x", "y"):
+            self.assertEqual(len(PdfReader(os.path.join(self.temp_dir, "out", f"{name}.pdf")).pages), 2)
+    
+    def test_batch_each_dir(self):
+        """ディレクトリごとのbatchサブコマンドのテスト"""
+        for name in ("customer_a", "customer_b"):
+            os.makedirs(os.path.join(self.temp_dir, "in", name))
+            make_pdf(os.path.join(self.temp_dir, "in", name, "1.pdf"), 2)
+        output_dir = os.path.join(self.temp_dir, "merged")
+        
+        exit_code = cli.main([
+            "batch", "--each-dir", os.path.join(self.temp_dir, "in", "*"), "--output-dir", output_dir
+        ])
+        
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(sorted(os.listdir(output_dir)), ["customer_a.pdf", "customer_b.pdf"])
+    
+    def test_batch_checkpoint_skips_completed_jobs(self):
+        """--checkpoint指定時、再実行で完了済みのジョブを省略するテスト"""
+        for name in ("customer_a", "customer_b"):
+            os.makedirs(os.path.join(self.temp_dir, "in", name))
+            make_pdf(os.path.join(self.temp_dir, "in", name, "1.pdf"), 2)
+        argv = [
+            "batch", "--each-dir", os.path.join(self.temp_dir, "in", "*"), "-j", "1",
+            "--output-dir", os.path.join(self.temp_dir, "merged"),
+            "--checkpoint", os.path.join(self.temp_dir, "progress.json"), "--fsync", "none"
+        ]
+        self.assertEqual(cli.main(argv), 0)
+        
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            self.assertEqual(cli.main(argv), 0)
+        
+        self.assertEqual(stdout.getvalue().count("SKIP"), 2)
+        self.assertIn("2件は省略", stdout.getvalue())
+    
+    def test_watch_once(self):
+        """watch --onceでフォルダごとに自然順で結合するテスト"""
+        batch_dir = os.path.join(self.temp_dir, "scans", "batch_1")
+        os.makedirs(batch_dir)
+        for name, pages in (("p10.pdf", 3), ("p2.pdf", 2), ("p1.pdf", 1)):
+            make_pdf(os.path.join(batch_dir, name), pages)
+        output_dir = os.path.join(self.temp_dir, "scans", "merged")
+        
+        exit_code = cli.main([
+            "watch", os.path.join(self.temp_dir, "scans"), "--output-dir", output_dir, "--once",
+            "--polling", "--fsync", "none"
+        ])
+        
+        self.assertEqual(exit_code, 0)
+        self.assertEqual([name for name in os.listdir(output_dir) if name.endswith(".pdf")], ["batch_1.pdf"])
+        reader = PdfReader(os.path.join(output_dir, "batch_1.pdf"))
+        self.assertEqual(len(reader.pages), 6)
+    
+    def test_watch_once_reports_failure(self):
+        """watch --onceで結合に失敗したフォルダがある場合に終了コード1を返すテスト"""
+        for name in ("good", "broken"):
+            os.makedirs(os.path.join(self.temp_dir, "scans", name))
+        make_pdf(os.path.join(self.temp_dir, "scans", "good", "1.pdf"))
+        with open(os.path.join(self.temp_dir, "scans", "broken", "1.pdf"), "wb") as f:
+            f.write(b"not a pdf")
+        
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            exit_code = cli.main([
+                "watch", os.path.join(self.temp_dir, "scans"), "--output-dir", os.path.join(self.temp_dir, "merged"),
+                "--once", "--polling", "--fsync", "none"
+            ])
+        
+        self.assertEqual(exit_code, 1)
+        self.assertIn("完了: 1/2 フォルダ成功", stdout.getvalue())
+
+if __name__ == '__main__':
+    unittest.main()
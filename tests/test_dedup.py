@@ -0,0 +1,82 @@
+"""
+共有リソース重複排除のテストモジュール
+"""
+
+import unittest
+import tempfile
+import os
+import shutil
+
+from pypdf import PdfReader
+
+from pdf_merger import PDFMerger
+from benchmarks.corpus import make_pdf
+
+class TestDeduplication(unittest.TestCase):
+    """deduplicateオプションのテスト"""
+    
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.pdf_files = [
+            make_pdf(os.path.join(self.temp_dir, f"{index}.pdf"), page_count=2, seed=index,
+                     shared_resource_bytes=32 * 1024)
+            for index in range(4)
+        ]
+    
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def merge(self, streaming: bool, deduplicate: bool):
+        """結合して出力パスとPDFMergerを返す"""
+        output_path = os.path.join(self.temp_dir, f"merged_{streaming}_{deduplicate}.pdf")
+        merger = PDFMerger(streaming=streaming, deduplicate=deduplicate)
+        self.assertTrue(merger.merge_pdfs(self.pdf_files, output_path))
+        return output_path, merger
+    
+    def logo_ids(self, output_path: str) -> set:
+        """各ページが参照する共有画像のオブジェクト番号"""
+        reader = PdfReader(output_path)
+        return {page['/Resources']['/XObject'].raw_get('/Logo').idnum for page in reader.pages}
+    
+    def test_shared_streams_written_once(self):
+        """同一内容の画像が1つにまとめられ、削減量が報告されるテスト"""
+        for streaming in (False, True):
+            plain_path, plain = self.merge(streaming, deduplicate=False)
+            dedup_path, merger = self.merge(streaming, deduplicate=True)
+            
+            self.assertIsNone(plain.dedup_stats)
+            self.assertEqual(len(self.logo_ids(plain_path)), len(self.pdf_files))
+            self.assertEqual(len(self.logo_ids(dedup_path)), 1)
+            
+            stats = merger.dedup_stats
+            self.assertEqual(stats.duplicates, len(self.pdf_files) - 1)
+            self.assertGreater(stats.bytes_saved, 3 * 32 * 1024 * 0.9)
+            self.assertGreaterEqual(stats.elapsed, 0.0)
+            self.assertLess(os.path.getsize(dedup_path), os.path.getsize(plain_path) - stats.bytes_saved * 0.9)
+    
+    def test_page_contents_preserved(self):
+        """重複排除しても各ページの内容が変わらないテスト"""
+        for streaming in (False, True):
+            plain_path, _ = self.merge(streaming, deduplicate=False)
+            dedup_path, _ = self.merge(streaming, deduplicate=True)
+            
+            plain_pages = PdfReader(plain_path).pages
+            dedup_pages = PdfReader(dedup_path).pages
+            self.assertEqual(len(plain_pages), len(dedup_pages))
+            for plain_page, dedup_page in zip(plain_pages, dedup_pages):
+                self.assertEqual(plain_page.get_contents().get_data(), dedup_page.get_contents().get_data())
+                self.assertEqual(plain_page['/Resources']['/XObject']['/Logo'].get_data(),
+                                 dedup_page['/Resources']['/XObject']['/Logo'].get_data())
+    
+    def test_batch_reports_bytes_saved(self):
+        """バッチ結合の結果に削減量が含まれるテスト"""
+        jobs = [(self.pdf_files, os.path.join(self.temp_dir, "out", "job.pdf"))]
+        results = PDFMerger(deduplicate=True).merge_batch(jobs, max_workers=1)
+        
+        self.assertTrue(results[0].success)
+        self.assertGreater(results[0].bytes_saved, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+ファイルリストモデルのテストモジュール
+"""
+
+import unittest
+import tempfile
+import os
+import shutil
+
+from gui.file_list_model import PDFFileListModel
+
+class TestPDFFileListModel(unittest.TestCase):
+    """PDFFileListModelクラスのテスト"""
+    
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.model = PDFFileListModel()
+        self.paths = []
+        for name in ("a.pdf", "b.pdf", "c.pdf"):
+            file_path = os.path.join(self.temp_dir, name)
+            with open(file_path, 'wb') as file:
+                file.write(b"%PDF-1.4\n")
+            self.paths.append(file_path)
+    
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def add(self, file_path):
+        """ファイル情報を追加"""
+        return self.model.append({'file_path': file_path, 'page_count': 1})
+    
+    def test_duplicate_path(self):
+        """同じパスを二重に追加しないテスト"""
+        self.assertTrue(self.add(self.paths[0]))
+        self.assertFalse(self.add(self.paths[0]))
+        self.assertTrue(self.model.contains(self.paths[0]))
+        self.assertFalse(self.model.contains(self.paths[1]))
+        self.assertEqual(len(self.model), 1)
+    
+    def test_relative_path(self):
+        """相対パスと絶対パスを同一と判定するテスト"""
+        self.add(self.paths[0])
+        cwd = os.getcwd()
+        try:
+            os.chdir(self.temp_dir)
+            self.assertTrue(self.model.contains("a.pdf"))
+            self.assertTrue(self.model.contains(os.path.join(".", "sub", "..", "a.pdf")))
+        finally:
+            os.chdir(cwd)
+    
+    @unittest.skipUnless(hasattr(os, "symlink"), "シンボリックリンク非対応")
+    def test_symlink(self):
+        """シンボリックリンク経由のパスを同一と判定するテスト"""
+        link_path = os.path.join(self.temp_dir, "link.pdf")
+        try:
+            os.symlink(self.paths[0], link_path)
+        except OSError:
+            self.skipTest("シンボリックリンクを作成できません")
+        
+        self.add(link_path)
+        self.assertTrue(self.model.contains(self.paths[0]))
+    
+    @unittest.skipUnless(hasattr(os, "link"), "ハードリンク非対応")
+    def test_hardlink(self):
+        """ハードリンクを同一と判定するテスト"""
+        link_path = os.path.join(self.temp_dir, "hard.pdf")
+        try:
+            os.link(self.paths[0], link_path)
+        except OSError:
+            self.skipTest("ハードリンクを作成できません")
+        
+        self.add(self.paths[0])
+        self.assertTrue(self.model.contains(link_path))
+        self.assertFalse(PDFFileListModel(use_file_identity=False).contains(link_path))
+    
+    def test_case_insensitive_on_windows(self):
+        """Windowsでは大文字小文字の違いを同一と判定するテスト"""
+        self.add(self.paths[0])
+        upper_path = os.path.join(self.temp_dir, "A.PDF")
+        self.assertEqual(self.model.contains(upper_path),
+                         os.path.normcase("A") == "a" or os.path.exists(upper_path))
+    
+    def test_index_follows_remove_move_clear(self):
+        """削除・並べ替え・全削除に索引が追従するテスト"""
+        for file_path in self.paths:
+            self.add(file_path)
+        
+        self.model.swap(0, 2)
+        self.assertEqual([info['file_path'] for info in self.model],
+                         [self.paths[2], self.paths[1], self.paths[0]])
+        
+        removed = self.model.pop(0)
+        self.assertEqual(removed['file_path'], self.paths[2])
+        self.assertFalse(self.model.contains(self.paths[2]))
+        self.assertTrue(self.model.contains(self.paths[0]))
+        self.assertTrue(self.add(self.paths[2]))
+        
+        self.model.clear()
+        self.assertEqual(len(self.model), 0)
+        for file_path in self.paths:
+            self.assertFalse(self.model.contains(file_path))
+    
+    def test_reserve_and_release(self):
+        """読み込み中の予約で二重投入を防ぎ、解除・追加で状態が切り替わるテスト"""
+        self.assertTrue(self.model.reserve(self.paths[0]))
+        self.assertFalse(self.model.reserve(self.paths[0]))
+        self.assertTrue(self.model.contains(self.paths[0]))
+        self.assertEqual(len(self.model), 0)
+        
+        # 予約済みのファイルは追加できる
+        self.assertTrue(self.add(self.paths[0]))
+        self.assertEqual(len(self.model), 1)
+        
+        # 読み込みに失敗した予約は解除される
+        self.assertTrue(self.model.reserve(self.paths[1]))
+        self.model.release(self.paths[1])
+        self.assertFalse(self.model.contains(self.paths[1]))
+        
+        # 全削除しても読み込み中の予約は残る
+        self.model.reserve(self.paths[2])
+        self.model.clear()
+        self.assertTrue(self.model.contains(self.paths[2]))
+        self.model.release_all()
+        self.assertFalse(self.model.contains(self.paths[2]))
+
+if __name__ == '__main__':
+    unittest.main()
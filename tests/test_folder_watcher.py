@@ -0,0 +1,223 @@
+"""
+フォルダ監視のテストモジュール
+"""
+
+import unittest
+import tempfile
+import os
+import shutil
+import time
+
+from utils.folder_watcher import FolderWatcher, natural_sort_key
+
+class FakeClock:
+    """テスト用の時計（advanceで進める）"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+class TestNaturalSortKey(unittest.TestCase):
+    """natural_sort_keyのテスト"""
+
+    def test_order(self):
+        """数字の部分を数値として並べるテスト"""
+        names = ["scan10.pdf", "scan2.pdf", "Scan1.pdf", "scan1a.pdf", "cover.pdf", "scan002.pdf"]
+        self.assertEqual(sorted(names, key=natural_sort_key),
+                         ["cover.pdf", "Scan1.pdf", "scan1a.pdf", "scan002.pdf", "scan2.pdf", "scan10.pdf"])
+
+class TestFolderWatcher(unittest.TestCase):
+    """FolderWatcherのテスト（ポーリング）"""
+
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.root = os.path.join(self.temp_dir, "scans")
+        os.makedirs(self.root)
+        self.clock = FakeClock()
+        self.merged = []
+        self.result = True
+
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _merge_folder(self, folder, pdf_files):
+        self.merged.append((os.path.basename(folder), [os.path.basename(path) for path in pdf_files]))
+        return self.result
+
+    def _watcher(self, **kwargs) -> FolderWatcher:
+        watcher = FolderWatcher(self.root, self._merge_folder, quiet_seconds=10, clock=self.clock,
+                                **{"use_inotify": False, **kwargs})
+        self.addCleanup(watcher.close)
+        return watcher
+
+    def _write(self, folder: str, name: str, data: bytes = b"%PDF-1.4\n") -> str:
+        directory = os.path.join(self.root, folder)
+        os.makedirs(directory, exist_ok=True)
+        file_path = os.path.join(directory, name)
+        with open(file_path, "ab") as f:
+            f.write(data)
+        return file_path
+
+    def _bump_mtime(self, folder: str) -> None:
+        """フォルダの更新時刻を確実に変える（タイムスタンプの粒度が粗いファイルシステム向け）"""
+        directory = os.path.join(self.root, folder)
+        stat = os.stat(directory)
+        os.utime(directory, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_merge_after_quiet_period(self):
+        """変更が止まってから結合し、ファイルを自然順に渡すテスト"""
+        for name in ("p10.pdf", "p2.pdf", "p1.pdf", "notes.txt", ".p3.pdf"):
+            self._write("batch_a", name)
+        self._write("batch_b", "x.pdf")
+        os.makedirs(os.path.join(self.root, "empty"))
+        watcher = self._watcher()
+
+        self.assertEqual(watcher.poll_once(), ([], []))
+        self.clock.advance(9)
+        self.assertEqual(watcher.poll_once(), ([], []))
+        self.clock.advance(1)
+        watcher.poll_once()
+
+        self.assertEqual(self.merged, [("batch_a", ["p1.pdf", "p2.pdf", "p10.pdf"]), ("batch_b", ["x.pdf"])])
+        self.clock.advance(60)
+        self.assertEqual(watcher.poll_once(), ([], []))
+        self.assertEqual(len(self.merged), 2)
+
+    def test_rescans_only_changed_folders(self):
+        """変更のないフォルダを読み直さず、変更のあったフォルダだけを再度結合するテスト"""
+        for index in range(50):
+            self._write(f"batch_{index}", "1.pdf")
+        watcher = self._watcher()
+        watcher.poll_once()
+        self.clock.advance(10)
+        watcher.poll_once()
+        self.assertEqual(len(self.merged), 50)
+
+        scanned = watcher.folders_scanned
+        for _ in range(5):
+            self.clock.advance(10)
+            watcher.poll_once()
+        self.assertEqual(watcher.folders_scanned, scanned)
+
+        self._write("batch_7", "2.pdf")
+        self._bump_mtime("batch_7")
+        watcher.poll_once()
+        self.assertEqual(watcher.folders_scanned, scanned + 1)
+        self.clock.advance(10)
+        watcher.poll_once()
+        self.assertEqual(self.merged[-1], ("batch_7", ["1.pdf", "2.pdf"]))
+        self.assertEqual(len(self.merged), 51)
+
+    def test_waits_for_growing_file(self):
+        """書き込み中のファイルが大きくなっている間は結合しないテスト"""
+        self._write("batch", "1.pdf")
+        watcher = self._watcher()
+        watcher.poll_once()
+
+        # 既存のファイルへの追記ではフォルダの更新時刻は変わらない
+        self.clock.advance(8)
+        self._write("batch", "1.pdf", b"more data")
+        watcher.poll_once()
+        self.clock.advance(8)
+        watcher.poll_once()
+        self.assertEqual(self.merged, [])
+
+        self.clock.advance(2)
+        watcher.poll_once()
+        self.assertEqual(self.merged, [("batch", ["1.pdf"])])
+
+    def test_folders_added_and_removed(self):
+        """追加されたフォルダを監視し、削除されたフォルダと除外したフォルダを監視しないテスト"""
+        output_dir = os.path.join(self.root, "merged")
+        os.makedirs(output_dir)
+        with open(os.path.join(output_dir, "old.pdf"), "wb") as f:
+            f.write(b"%PDF-1.4\n")
+        self._write("batch_a", "1.pdf")
+        watcher = self._watcher(exclude=[output_dir])
+        watcher.poll_once()
+
+        self._write("batch_b", "1.pdf")
+        shutil.rmtree(os.path.join(self.root, "batch_a"))
+        os.utime(self.root, ns=(0, os.stat(self.root).st_mtime_ns + 1_000_000_000))
+        watcher.poll_once()
+        self.assertEqual(sorted(os.path.basename(folder) for folder in watcher.folders), ["batch_b"])
+
+        self.clock.advance(10)
+        watcher.poll_once()
+        self.assertEqual(self.merged, [("batch_b", ["1.pdf"])])
+
+    def test_failed_merge_retried_with_backoff(self):
+        """結合に失敗したフォルダを間隔を延ばしながら再試行し、成功した後は結合しないテスト"""
+        self._write("batch", "1.pdf")
+        batch = os.path.join(self.root, "batch")
+        watcher = self._watcher(retry_seconds=30, max_retry_seconds=45)
+        self.result = False
+        watcher.poll_once()
+        self.clock.advance(10)
+        self.assertEqual(watcher.poll_once(), ([], [batch]))
+
+        # 1回目の失敗から30秒後、2回目の失敗から45秒後（上限）に再試行する
+        self.clock.advance(29)
+        self.assertEqual(watcher.poll_once(), ([], []))
+        self.clock.advance(1)
+        self.assertEqual(watcher.poll_once(), ([], [batch]))
+        self.clock.advance(44)
+        self.assertEqual(watcher.poll_once(), ([], []))
+        self.result = True
+        self.clock.advance(1)
+        self.assertEqual(watcher.poll_once(), ([batch], []))
+
+        self.clock.advance(600)
+        self.assertEqual(watcher.poll_once(), ([], []))
+        self.assertEqual(len(self.merged), 3)
+
+    def test_change_after_failure_merges_after_quiet_period(self):
+        """失敗後に内容が変わった場合は再試行の間隔ではなく変更が落ち着いた時点で結合するテスト"""
+        self._write("batch", "1.pdf")
+        watcher = self._watcher(retry_seconds=300)
+        self.result = False
+        watcher.poll_once()
+        self.clock.advance(10)
+        watcher.poll_once()
+
+        self.result = True
+        self._write("batch", "2.pdf")
+        self._bump_mtime("batch")
+        watcher.poll_once()
+        self.clock.advance(10)
+        watcher.poll_once()
+        self.assertEqual(self.merged[-1], ("batch", ["1.pdf", "2.pdf"]))
+
+    def test_inotify(self):
+        """inotifyで変更のあったフォルダだけを読み直すテスト"""
+        self._write("batch_a", "1.pdf")
+        self._write("batch_b", "1.pdf")
+        watcher = self._watcher(use_inotify=True)
+        if watcher.mode != "inotify":
+            self.skipTest("inotifyを使用できません")
+        watcher.poll_once()
+        self.clock.advance(10)
+        watcher.poll_once()
+        self.assertEqual(len(self.merged), 2)
+        scanned = watcher.folders_scanned
+
+        self._write("batch_a", "2.pdf")
+        self._write("batch_c", "1.pdf")
+        # イベントが届くまで待つ
+        time.sleep(0.05)
+        watcher.poll_once()
+        self.clock.advance(10)
+        watcher.poll_once()
+
+        self.assertEqual(sorted(self.merged[2:]), [("batch_a", ["1.pdf", "2.pdf"]), ("batch_c", ["1.pdf"])])
+        self.assertLessEqual(watcher.folders_scanned - scanned, 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+画像ダウンサンプリングのテストモジュール
+"""
+
+import unittest
+import tempfile
+import os
+import shutil
+import zlib
+from io import BytesIO
+
+from PIL import Image
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject, NumberObject, StreamObject
+
+from pdf_merger import PDFMerger
+from utils.image_downsample import ImageDownsampleOptions
+
+def make_scan_pdf(file_path: str, pixels: int, dct: bool = False, image_mask: bool = False) -> str:
+    """1インチ四方のページ全体にpixels x pixelsのRGB画像を描画したPDFを作成（解像度はpixels dpi）"""
+    image = Image.effect_noise((pixels, pixels), 32).convert("RGB")
+    writer = PdfWriter()
+    page = writer.add_blank_page(width=72, height=72)
+    
+    xobject = StreamObject()
+    if dct:
+        buffer = BytesIO()
+        image.save(buffer, format="JPEG", quality=95)
+        xobject._data = buffer.getvalue()
+        xobject[NameObject("/Filter")] = NameObject("/DCTDecode")
+    else:
+        xobject._data = zlib.compress(image.tobytes())
+        xobject[NameObject("/Filter")] = NameObject("/FlateDecode")
+    xobject.update({
+        NameObject("/Type"): NameObject("/XObject"),
+        NameObject("/Subtype"): NameObject("/Image"),
+        NameObject("/Width"): NumberObject(pixels),
+        NameObject("/Height"): NumberObject(pixels),
+        NameObject("/ColorSpace"): NameObject("/DeviceRGB"),
+        NameObject("/BitsPerComponent"): NumberObject(8),
+    })
+    if image_mask:
+        xobject[NameObject("/Mask")] = NumberObject(0)
+    
+    page[NameObject("/Resources")] = DictionaryObject({
+        NameObject("/XObject"): DictionaryObject({NameObject("/Im0"): writer._add_object(xobject)})
+    })
+    content = DecodedStreamObject()
+    content.set_data(b"q 72 0 0 72 0 0 cm /Im0 Do Q")
+    page.replace_contents(content)
+    
+    with open(file_path, 'wb') as file:
+        writer.write(file)
+    return file_path
+
+class TestImageDownsample(unittest.TestCase):
+    """image_optionsによる画像の再エンコードのテスト"""
+    
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_path = os.path.join(self.temp_dir, "merged.pdf")
+    
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def merged_image(self, page_index: int = 0):
+        """結合結果のページの画像XObject"""
+        page = PdfReader(self.output_path).pages[page_index]
+        return page['/Resources']['/XObject']['/Im0'].get_object()
+    
+    def test_downsample_above_target_dpi(self):
+        """目標解像度を超える画像が縮小・JPEG化され、入力ごとの削減量が報告されるテスト"""
+        flate = make_scan_pdf(os.path.join(self.temp_dir, "flate.pdf"), 600)
+        dct = make_scan_pdf(os.path.join(self.temp_dir, "dct.pdf"), 600, dct=True)
+        merger = PDFMerger(image_options=ImageDownsampleOptions(target_dpi=150, max_workers=2))
+        
+        self.assertTrue(merger.merge_pdfs([flate, dct], self.output_path))
+        
+        for page_index in range(2):
+            image = self.merged_image(page_index)
+            self.assertEqual((image['/Width'], image['/Height']), (150, 150))
+            self.assertEqual(image['/Filter'], '/DCTDecode')
+        self.assertEqual([stats.file_path for stats in merger.image_stats], [flate, dct])
+        for stats in merger.image_stats:
+            self.assertEqual((stats.images_found, stats.images_reencoded), (1, 1))
+            self.assertGreater(stats.bytes_saved, 0)
+            self.assertLess(stats.bytes_after, stats.bytes_before)
+    
+    def test_grayscale_in_process(self):
+        """グレースケール指定と同一プロセスでの実行のテスト"""
+        file_path = make_scan_pdf(os.path.join(self.temp_dir, "a.pdf"), 300)
+        merger = PDFMerger(streaming=True, image_options=ImageDownsampleOptions(
+            target_dpi=100, grayscale=True, max_workers=1))
+        
+        self.assertTrue(merger.merge_pdfs([file_path], self.output_path))
+        
+        image = self.merged_image()
+        self.assertEqual(image['/ColorSpace'], '/DeviceGray')
+        self.assertEqual(image['/Width'], 100)
+    
+    def test_low_resolution_and_masked_images_unchanged(self):
+        """目標解像度以下の画像とマスク付き画像は再エンコードしないテスト"""
+        low = make_scan_pdf(os.path.join(self.temp_dir, "low.pdf"), 100)
+        masked = make_scan_pdf(os.path.join(self.temp_dir, "masked.pdf"), 600, image_mask=True)
+        merger = PDFMerger(image_options=ImageDownsampleOptions(target_dpi=150, max_workers=1))
+        
+        self.assertTrue(merger.merge_pdfs([low, masked], self.output_path))
+        
+        self.assertEqual(self.merged_image(0)['/Width'], 100)
+        self.assertEqual(self.merged_image(1)['/Width'], 600)
+        self.assertEqual([stats.images_found for stats in merger.image_stats], [0, 0])
+    
+    def test_size_threshold(self):
+        """解像度が目標以下でもサイズの閾値を超える画像は再エンコードするテスト"""
+        file_path = make_scan_pdf(os.path.join(self.temp_dir, "a.pdf"), 120)
+        merger = PDFMerger(image_options=ImageDownsampleOptions(
+            target_dpi=150, max_image_bytes=1024, max_workers=1))
+        
+        self.assertTrue(merger.merge_pdfs([file_path], self.output_path))
+        
+        image = self.merged_image()
+        self.assertEqual(image['/Width'], 120)
+        self.assertEqual(image['/Filter'], '/DCTDecode')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+増分結合のテストモジュール
+"""
+
+import unittest
+import tempfile
+import os
+import shutil
+
+from pypdf import PdfReader
+
+from pdf_merger import PDFMerger
+from utils.merge_manifest import MergeManifest, manifest_path
+from benchmarks.corpus import make_pdf
+
+def page_contents(file_path: str) -> list:
+    """各ページのコンテンツストリームの内容"""
+    return [page.get_contents().get_data() for page in PdfReader(file_path).pages]
+
+class TestIncrementalMerge(unittest.TestCase):
+    """PDFMerger(incremental=True)のテスト"""
+
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_path = os.path.join(self.temp_dir, "out.pdf")
+        self.pdf_files = [make_pdf(os.path.join(self.temp_dir, f"{i}.pdf"), i + 1, seed=i) for i in range(4)]
+
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _merge(self, pdf_files, output_path=None, **kwargs):
+        merger = PDFMerger(incremental=True, fsync="none", **kwargs)
+        self.assertTrue(merger.merge_pdfs(pdf_files, output_path or self.output_path))
+
+    def _read_output(self) -> bytes:
+        with open(self.output_path, 'rb') as file:
+            return file.read()
+
+    def test_appends_new_inputs(self):
+        """末尾に追加した入力のページだけを追記するテスト"""
+        for streaming in (False, True):
+            with self.subTest(streaming=streaming):
+                self._merge(self.pdf_files[:2], streaming=streaming)
+                previous = self._read_output()
+                self._merge(self.pdf_files[:3], streaming=streaming)
+                self._merge(self.pdf_files, streaming=streaming)
+
+                # 前回の出力は変更されず、その後ろに増分更新が続く
+                self.assertTrue(self._read_output().startswith(previous))
+                self.assertEqual(self._read_output().count(b"%%EOF"), 3)
+
+                rebuilt = os.path.join(self.temp_dir, "rebuilt.pdf")
+                self.assertTrue(PDFMerger(streaming=streaming).merge_pdfs(self.pdf_files, rebuilt))
+                self.assertEqual(page_contents(self.output_path), page_contents(rebuilt))
+
+                reader = PdfReader(self.output_path)
+                self.assertEqual(len(reader.pages), 10)
+                self.assertIn("総ページ数: 10", reader.metadata["/Subject"])
+                self.assertEqual(MergeManifest.load(self.output_path).page_count, 10)
+
+                os.remove(self.output_path)
+                os.remove(manifest_path(self.output_path))
+
+    def test_unchanged_inputs_keep_output(self):
+        """入力に変更がない場合は出力を書き換えないテスト"""
+        self._merge(self.pdf_files)
+        stat = os.stat(self.output_path)
+        self._merge(self.pdf_files)
+
+        self.assertEqual(os.stat(self.output_path).st_mtime_ns, stat.st_mtime_ns)
+        self.assertEqual(len(PdfReader(self.output_path).pages), 10)
+
+    def test_changed_prefix_rebuilds(self):
+        """途中の入力・順序・設定が変わった場合は全体を結合し直すテスト"""
+        self._merge(self.pdf_files[:2])
+
+        # 既存の入力の内容の変更
+        make_pdf(self.pdf_files[0], 2, seed=9)
+        self._merge(self.pdf_files)
+        self.assertEqual(self._read_output().count(b"%%EOF"), 1)
+        self.assertEqual(len(PdfReader(self.output_path).pages), 11)
+
+        # 順序の変更
+        self._merge(list(reversed(self.pdf_files)))
+        self.assertEqual(self._read_output().count(b"%%EOF"), 1)
+
+        # 出力内容に影響する設定の変更
+        self._merge(list(reversed(self.pdf_files)) + [self.pdf_files[0]], profile="compact")
+        self.assertEqual(self._read_output().count(b"%%EOF"), 1)
+        self.assertEqual(len(PdfReader(self.output_path).pages), 13)
+
+    def test_touched_input_still_appends(self):
+        """更新時刻だけが変わった入力は変更なしとみなすテスト"""
+        self._merge(self.pdf_files[:2])
+        stat = os.stat(self.pdf_files[0])
+        os.utime(self.pdf_files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self._merge(self.pdf_files)
+        self.assertEqual(self._read_output().count(b"%%EOF"), 2)
+        self.assertEqual(len(PdfReader(self.output_path).pages), 10)
+
+    def test_modified_output_rebuilds(self):
+        """前回の結合後に出力ファイルが変更された場合は結合し直すテスト"""
+        self._merge(self.pdf_files[:2])
+        PDFMerger().merge_pdfs(self.pdf_files[:1], self.output_path)
+
+        self._merge(self.pdf_files)
+        self.assertEqual(self._read_output().count(b"%%EOF"), 1)
+        self.assertEqual(len(PdfReader(self.output_path).pages), 10)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+入力ソースのテストモジュール
+"""
+
+import unittest
+import tempfile
+import os
+import shutil
+import mmap
+
+from pypdf import PdfReader
+
+from pdf_merger import PDFMerger
+from utils.input_source import open_input
+from benchmarks.corpus import make_pdf
+
+class TestInputSource(unittest.TestCase):
+    """open_inputとPDFMergerのuse_mmapのテスト"""
+
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.pdf_files = [make_pdf(os.path.join(self.temp_dir, f"{i}.pdf"), 3, payload_bytes=512, seed=i)
+                          for i in range(3)]
+
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_mmap_stream(self):
+        """既定ではメモリマップしたストリームをPdfReaderで読めるテスト"""
+        with open_input(self.pdf_files[0], prefetch=True) as source:
+            self.assertTrue(source.is_mapped)
+            self.assertIsInstance(source.stream, mmap.mmap)
+            self.assertEqual(len(PdfReader(source.stream).pages), 3)
+
+        with self.assertRaises(ValueError):
+            source.stream
+
+    def test_buffered_fallback(self):
+        """use_mmap=Falseと空のファイルではバッファ付きファイルを使うテスト"""
+        with open_input(self.pdf_files[0], use_mmap=False) as source:
+            self.assertFalse(source.is_mapped)
+            self.assertEqual(len(PdfReader(source.stream).pages), 3)
+
+        empty_path = os.path.join(self.temp_dir, "empty.pdf")
+        open(empty_path, 'wb').close()
+        with open_input(empty_path) as source:
+            self.assertFalse(source.is_mapped)
+            self.assertEqual(source.stream.read(), b"")
+
+    def test_merge_output_independent_of_source(self):
+        """メモリマップの有無で検証・情報取得・結合の結果が変わらないテスト"""
+        outputs = []
+        for use_mmap in (True, False):
+            merger = PDFMerger(use_mmap=use_mmap, fast_info=False)
+            self.assertTrue(all(merger.validate_pdf_file(file_path) for file_path in self.pdf_files))
+            self.assertEqual(merger.get_pdf_info(self.pdf_files[0])['page_count'], 3)
+
+            output_path = os.path.join(self.temp_dir, f"merged_{use_mmap}.pdf")
+            self.assertTrue(merger.merge_pdfs(self.pdf_files, output_path))
+            reader = PdfReader(output_path)
+            outputs.append([page.extract_text() for page in reader.pages])
+
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual(len(outputs[0]), 9)
+
+if __name__ == '__main__':
+    unittest.main()
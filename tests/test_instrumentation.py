@@ -0,0 +1,139 @@
+"""
+結合処理の計測のテストモジュール
+"""
+
+import unittest
+import tempfile
+import io
+import json
+import os
+import pstats
+import shutil
+import tracemalloc
+
+from pdf_merger import MergeJob, PDFMerger
+from utils.instrumentation import CProfileHook, JsonLinesHook, MergeHooks, TracemallocHook
+from benchmarks.corpus import make_pdf
+
+class RecordingHook(MergeHooks):
+    """呼ばれたフックを記録するテスト用フック"""
+
+    def __init__(self):
+        self.events = []
+
+    def on_merge_start(self, output_path, input_count):
+        self.events.append(('start', input_count))
+
+    def on_phase(self, phase, elapsed, file_path):
+        self.events.append(('phase', phase))
+
+    def on_merge_end(self, stats):
+        self.events.append(('end', stats))
+
+class TestMergeStats(unittest.TestCase):
+    """PDFMerger.merge_statsと計測フックのテスト"""
+
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_path = os.path.join(self.temp_dir, "out.pdf")
+        self.pdf_files = [make_pdf(os.path.join(self.temp_dir, f"{i}.pdf"), 2, payload_bytes=2000, seed=i)
+                          for i in range(3)]
+
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_stats_after_merge(self):
+        """フェーズ別の時間・バイト数・ページ数を記録するテスト"""
+        input_bytes = sum(os.path.getsize(file_path) for file_path in self.pdf_files)
+        for streaming in (False, True):
+            with self.subTest(streaming=streaming):
+                merger = PDFMerger(streaming=streaming, deduplicate=True, fsync="none")
+                self.assertTrue(merger.merge_pdfs(self.pdf_files, self.output_path))
+
+                stats = merger.merge_stats
+                self.assertEqual(stats.page_count, 6)
+                self.assertEqual(stats.input_count, 3)
+                self.assertEqual(stats.bytes_read, input_bytes)
+                self.assertEqual(stats.bytes_written, os.path.getsize(self.output_path))
+                self.assertIsNone(stats.error)
+                expected = {"open", "parse", "copy", "metadata", "serialize"} | ({"dedup"} if not streaming else set())
+                self.assertEqual(set(stats.phases), expected)
+                self.assertLessEqual(sum(stats.phases.values()), stats.elapsed)
+                if stats.peak_rss is not None:
+                    self.assertGreater(stats.peak_rss, 0)
+
+    def test_hooks_receive_events(self):
+        """フックが開始・フェーズ・終了の順に呼ばれ、失敗時もon_merge_endが呼ばれるテスト"""
+        hook = RecordingHook()
+        merger = PDFMerger(hooks=[hook], fsync="none")
+        self.assertTrue(merger.merge_pdfs(self.pdf_files, self.output_path))
+
+        self.assertEqual(hook.events[0], ('start', 3))
+        self.assertEqual(hook.events[-1], ('end', merger.merge_stats))
+        self.assertEqual([event[1] for event in hook.events if event[0] == 'phase'].count('copy'), 3)
+
+        hook.events.clear()
+        missing = os.path.join(self.temp_dir, "missing.pdf")
+        self.assertFalse(merger.merge_pdfs(self.pdf_files + [missing], self.output_path))
+        stats = hook.events[-1][1]
+        self.assertIn("missing.pdf", stats.error)
+        self.assertEqual(stats.page_count, 6)
+
+    def test_info_outside_merge_not_recorded(self):
+        """結合中に別のスレッドから呼ばれるget_pdf_info・検証が結合の計測に記録されないテスト"""
+        hook = RecordingHook()
+        merger = PDFMerger(hooks=[hook], fast_info=False, fsync="none")
+        open_pdf = merger._open_pdf
+
+        def open_during_merge(file_path, *args, **kwargs):
+            # 結合の計測中（入力を開く時点）に情報の取得・検証を行う
+            if kwargs.get('recorder') is None:
+                self.assertIsNotNone(merger.get_pdf_info(self.pdf_files[2]))
+                self.assertTrue(merger.validate_pdf_file(self.pdf_files[0]))
+            return open_pdf(file_path, *args, **kwargs)
+
+        merger._open_pdf = open_during_merge
+        self.assertTrue(merger.merge_pdfs(self.pdf_files, self.output_path))
+
+        input_bytes = sum(os.path.getsize(file_path) for file_path in self.pdf_files)
+        self.assertEqual(merger.merge_stats.bytes_read, input_bytes)
+        self.assertEqual([event[1] for event in hook.events if event[0] == 'phase'].count('parse'), 3)
+
+    def test_json_lines_hook(self):
+        """JSON Lines形式の出力テスト"""
+        stream = io.StringIO()
+        merger = PDFMerger(hooks=[JsonLinesHook(stream, phase_events=True)], fsync="none")
+        self.assertTrue(merger.merge_pdfs(self.pdf_files, self.output_path))
+
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(records[-1]['event'], 'merge')
+        self.assertEqual(records[-1]['page_count'], 6)
+        self.assertTrue(all(record['event'] == 'phase' for record in records[:-1]))
+        self.assertIn(self.pdf_files[0], {record['file_path'] for record in records[:-1]})
+
+    def test_profiling_hooks(self):
+        """cProfile・tracemallocのフックのテスト"""
+        profile_path = os.path.join(self.temp_dir, "merge.prof")
+        tracing = TracemallocHook()
+        merger = PDFMerger(hooks=[CProfileHook(profile_path), tracing], fsync="none")
+        self.assertTrue(merger.merge_pdfs(self.pdf_files, self.output_path))
+
+        self.assertGreater(merger.merge_stats.peak_traced, 0)
+        self.assertIsNotNone(tracing.snapshot)
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertGreater(pstats.Stats(profile_path).total_calls, 0)
+
+    def test_batch_results_carry_stats(self):
+        """バッチ結合の結果に計測結果が含まれ、on_merge_endが呼ばれるテスト"""
+        hook = RecordingHook()
+        jobs = [MergeJob(self.pdf_files[:index + 1], os.path.join(self.temp_dir, f"b{index}.pdf"))
+                for index in range(2)]
+        results = PDFMerger(hooks=[hook], fsync="none").merge_batch(jobs, max_workers=1)
+
+        self.assertEqual([result.stats.page_count for result in results], [2, 4])
+        self.assertEqual([event[1] for event in hook.events], [result.stats for result in results])
+
+if __name__ == '__main__':
+    unittest.main()
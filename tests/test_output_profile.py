@@ -0,0 +1,88 @@
+"""
+出力プロファイルのテストモジュール
+"""
+
+import unittest
+import tempfile
+import os
+import shutil
+
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import DecodedStreamObject
+
+from pdf_merger import PDFMerger
+from utils.output_profile import OUTPUT_PROFILES, get_output_profile
+
+def make_text_pdf(file_path: str, page_count: int, seed: int) -> str:
+    """未圧縮で圧縮しやすいコンテンツストリームを持つPDFを作成"""
+    writer = PdfWriter()
+    for page_num in range(page_count):
+        page = writer.add_blank_page(width=612, height=792)
+        content = DecodedStreamObject()
+        lines = [f"BT /F1 10 Tf 72 {720 - line * 12} Td (file {seed} page {page_num} line {line}) Tj ET"
+                 for line in range(50)]
+        content.set_data("\n".join(lines).encode())
+        page.replace_contents(content)
+    with open(file_path, 'wb') as file:
+        writer.write(file)
+    return file_path
+
+class TestOutputProfile(unittest.TestCase):
+    """PDFMergerの出力プロファイルのテスト"""
+    
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.pdf_files = [make_text_pdf(os.path.join(self.temp_dir, f"{i}.pdf"), 3, i) for i in range(3)]
+    
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def merge(self, profile: str, streaming: bool = False) -> str:
+        """指定したプロファイルで結合して出力パスを返す"""
+        output_path = os.path.join(self.temp_dir, f"merged_{profile}_{streaming}.pdf")
+        self.assertTrue(PDFMerger(profile=profile, streaming=streaming).merge_pdfs(self.pdf_files, output_path))
+        return output_path
+    
+    def test_profiles_preserve_contents(self):
+        """どのプロファイルでもページ内容とメタデータが変わらないテスト"""
+        expected = [page.get_contents().get_data() for path in self.pdf_files for page in PdfReader(path).pages]
+        for profile in OUTPUT_PROFILES:
+            reader = PdfReader(self.merge(profile), strict=True)
+            self.assertEqual([page.get_contents().get_data() for page in reader.pages], expected, profile)
+            self.assertEqual(reader.metadata['/Title'], 'PDF結合ファイル')
+    
+    def test_compact_uses_object_streams(self):
+        """compactでオブジェクトストリーム・相互参照ストリームを使い、fastより小さくなるテスト"""
+        fast_path = self.merge("fast")
+        compact_path = self.merge("compact")
+        
+        with open(compact_path, 'rb') as file:
+            data = file.read()
+        self.assertIn(b"/Type /ObjStm", data)
+        self.assertIn(b"/Type /XRef", data)
+        self.assertNotIn(b"\nxref\n", data)
+        self.assertLess(os.path.getsize(compact_path), os.path.getsize(fast_path) / 2)
+    
+    def test_fast_keeps_streams_unchanged(self):
+        """fastでは再圧縮しないテスト（逐次書き出しでも同様）"""
+        for streaming in (False, True):
+            with open(self.merge("fast", streaming), 'rb') as file:
+                data = file.read()
+            self.assertNotIn(b"/FlateDecode", data)
+            self.assertNotIn(b"/ObjStm", data)
+    
+    def test_archive_not_larger_than_compact(self):
+        """archiveの出力がcompact以下のサイズになるテスト"""
+        self.assertLessEqual(os.path.getsize(self.merge("archive")), os.path.getsize(self.merge("compact")))
+    
+    def test_unknown_profile(self):
+        """未知のプロファイル名で例外を送出するテスト"""
+        with self.assertRaises(ValueError):
+            get_output_profile("tiny")
+        with self.assertRaises(ValueError):
+            PDFMerger(profile="tiny")
+
+if __name__ == '__main__':
+    unittest.main()
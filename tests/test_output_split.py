@@ -0,0 +1,136 @@
+"""
+分割出力のテストモジュール
+"""
+
+import unittest
+import tempfile
+import os
+import shutil
+
+from pypdf import PdfReader
+
+from pdf_merger import MergeJob, PDFMerger
+from utils.output_split import SplitOptions, split_output_path
+from utils.page_range import PageSelection
+from benchmarks.corpus import make_pdf
+
+def page_contents(file_path: str) -> list:
+    """各ページのコンテンツストリームの内容"""
+    return [page.get_contents().get_data() for page in PdfReader(file_path).pages]
+
+class TestSplitOptions(unittest.TestCase):
+    """SplitOptionsのテスト"""
+
+    def test_validation(self):
+        """上限の指定が不正な場合のテスト"""
+        with self.assertRaises(ValueError):
+            SplitOptions()
+        with self.assertRaises(ValueError):
+            SplitOptions(max_pages=0)
+        with self.assertRaises(ValueError):
+            PDFMerger(incremental=True, split_options=SplitOptions(max_pages=1))
+
+    def test_plan(self):
+        """ページの振り分けのテスト"""
+        options = SplitOptions(max_pages=3)
+        self.assertEqual(options.plan(range(5), 10, 0, 0), [[0, 1, 2], [3, 4]])
+        self.assertEqual(options.plan(range(5), 10, 2, 20), [[0], [1, 2, 3], [4]])
+        self.assertEqual(options.plan(range(2), 10, 3, 30), [[], [0, 1]])
+
+        by_bytes = SplitOptions(max_bytes=100)
+        self.assertEqual(by_bytes.plan(range(4), 40, 0, 0), [[0, 1], [2, 3]])
+        # 1ページで上限を超える場合も空の出力ファイルは作らない
+        self.assertEqual(by_bytes.plan(range(2), 500, 0, 0), [[0], [1]])
+
+        boundaries = SplitOptions(max_pages=3, file_boundaries=True)
+        self.assertEqual(boundaries.plan(range(5), 10, 0, 0), [[0, 1, 2, 3, 4]])
+        self.assertEqual(boundaries.plan(range(2), 10, 2, 20), [[], [0, 1]])
+        self.assertEqual(boundaries.plan(range(1), 10, 2, 20), [[0]])
+
+    def test_split_output_path(self):
+        """出力ファイル名のテスト"""
+        self.assertEqual(split_output_path(os.path.join("dir", "out.pdf"), 1), os.path.join("dir", "out_001.pdf"))
+        self.assertEqual(split_output_path("out.pdf", 1234), "out_1234.pdf")
+
+class TestSplitMerge(unittest.TestCase):
+    """PDFMerger(split_options=...)のテスト"""
+
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_path = os.path.join(self.temp_dir, "out.pdf")
+        self.pdf_files = [make_pdf(os.path.join(self.temp_dir, f"{i}.pdf"), 4, payload_bytes=4000, seed=i)
+                          for i in range(3)]
+        self.expected = [content for file_path in self.pdf_files for content in page_contents(file_path)]
+
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _merge(self, options: SplitOptions, pdf_files=None, **kwargs) -> PDFMerger:
+        merger = PDFMerger(split_options=options, fsync="none", **kwargs)
+        self.assertTrue(merger.merge_pdfs(pdf_files or self.pdf_files, self.output_path))
+        self.assertFalse(os.path.exists(self.output_path))
+        return merger
+
+    def _shard_pages(self, merger: PDFMerger) -> list:
+        return [len(PdfReader(output_file, strict=True).pages) for output_file in merger.output_files]
+
+    def test_split_by_pages(self):
+        """ページ数の上限で分割し、ページ順序を保つテスト"""
+        for profile in ("fast", "compact"):
+            with self.subTest(profile=profile):
+                merger = self._merge(SplitOptions(max_pages=5), profile=profile, deduplicate=True)
+                self.assertEqual(merger.output_files, [split_output_path(self.output_path, number)
+                                                       for number in (1, 2, 3)])
+                self.assertEqual(self._shard_pages(merger), [5, 5, 2])
+                self.assertEqual([content for output_file in merger.output_files
+                                  for content in page_contents(output_file)], self.expected)
+                self.assertEqual(merger.merge_stats.page_count, 12)
+
+    def test_split_on_file_boundaries(self):
+        """入力ファイルの途中では分割しないテスト"""
+        merger = self._merge(SplitOptions(max_pages=5, file_boundaries=True))
+        self.assertEqual(self._shard_pages(merger), [4, 4, 4])
+
+        selections = [PageSelection(self.pdf_files[0], "1-2"), PageSelection(self.pdf_files[1], "1-2"),
+                      self.pdf_files[2]]
+        merger = self._merge(SplitOptions(max_pages=5, file_boundaries=True), selections)
+        self.assertEqual(self._shard_pages(merger), [4, 4])
+
+    def test_split_by_bytes(self):
+        """推定バイト数の上限で分割するテスト"""
+        page_bytes = os.path.getsize(self.pdf_files[0]) / 4
+        merger = self._merge(SplitOptions(max_bytes=int(page_bytes * 3.5)))
+        self.assertEqual(sum(self._shard_pages(merger)), 12)
+        self.assertGreater(len(merger.output_files), 3)
+        for output_file in merger.output_files:
+            self.assertLessEqual(os.path.getsize(output_file), page_bytes * 3.5 * 1.2)
+
+    def test_stale_shards_and_failure(self):
+        """古い分割出力を削除し、失敗時は既存の分割出力を変更しないテスト"""
+        merger = self._merge(SplitOptions(max_pages=2))
+        self.assertEqual(len(merger.output_files), 6)
+
+        merger = self._merge(SplitOptions(max_pages=5))
+        self.assertEqual(len(merger.output_files), 3)
+        self.assertFalse(os.path.exists(split_output_path(self.output_path, 4)))
+
+        before = [page_contents(output_file) for output_file in merger.output_files]
+        missing = os.path.join(self.temp_dir, "missing.pdf")
+        merger = PDFMerger(split_options=SplitOptions(max_pages=1), fsync="none")
+        self.assertFalse(merger.merge_pdfs(self.pdf_files + [missing], self.output_path))
+        self.assertEqual([page_contents(split_output_path(self.output_path, number)) for number in (1, 2, 3)],
+                         before)
+        self.assertFalse(os.path.exists(split_output_path(self.output_path, 4)))
+        self.assertEqual([name for name in os.listdir(self.temp_dir) if name.endswith(".tmp")], [])
+
+    def test_batch(self):
+        """バッチ結合でも分割出力するテスト"""
+        jobs = [MergeJob(self.pdf_files, self.output_path)]
+        results = PDFMerger(split_options=SplitOptions(max_pages=8), fsync="none").merge_batch(jobs, max_workers=1)
+        self.assertTrue(results[0].success)
+        self.assertEqual(results[0].output_files, [split_output_path(self.output_path, number) for number in (1, 2)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+ページ範囲指定のテストモジュール
+"""
+
+import unittest
+import tempfile
+import os
+import shutil
+
+from utils.page_range import (
+    PageRangeError,
+    PageSelection,
+    parse_page_spec,
+    resolve_page_ranges,
+    split_page_spec,
+)
+
+class TestPageRange(unittest.TestCase):
+    """ページ範囲の解釈のテスト"""
+    
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_resolve_page_ranges(self):
+        """単一ページ・範囲・末尾からの指定のテスト"""
+        self.assertEqual(resolve_page_ranges("1-3,7", 10), [0, 1, 2, 6])
+        self.assertEqual(resolve_page_ranges("-1", 10), [9])
+        self.assertEqual(resolve_page_ranges("8-", 10), [7, 8, 9])
+        self.assertEqual(resolve_page_ranges("-3--1", 10), [7, 8, 9])
+        self.assertEqual(resolve_page_ranges("3-1", 10), [2, 1, 0])
+        self.assertEqual(resolve_page_ranges(" 2 , 2 ", 10), [1, 1])
+    
+    def test_resolve_page_ranges_invalid(self):
+        """不正な範囲の指定で例外を送出するテスト"""
+        for text in ("", "a", "1-3;5", "0", "11", "-11", "1-11", ","):
+            with self.assertRaises(PageRangeError, msg=text):
+                resolve_page_ranges(text, 10)
+    
+    def test_split_page_spec(self):
+        """入力指定をファイルパスとページ範囲に分割するテスト"""
+        self.assertEqual(split_page_spec("a.pdf:1-3,7"), ("a.pdf", "1-3,7"))
+        self.assertEqual(split_page_spec("b.pdf:-1"), ("b.pdf", "-1"))
+        self.assertEqual(split_page_spec("c.pdf"), ("c.pdf", None))
+        self.assertEqual(split_page_spec("scans/*.pdf:1"), ("scans/*.pdf", "1"))
+    
+    def test_split_page_spec_windows_drive(self):
+        """Windowsのドライブ文字をページ範囲と誤認しないテスト"""
+        self.assertEqual(split_page_spec("C:\\docs\\a.pdf"), ("C:\\docs\\a.pdf", None))
+        self.assertEqual(split_page_spec("C:\\docs\\a.pdf:2-4"), ("C:\\docs\\a.pdf", "2-4"))
+        self.assertEqual(split_page_spec("C:1"), ("C:1", None))
+    
+    def test_split_page_spec_existing_file(self):
+        """":"を含む既存のファイル名はそのままパスとして扱うテスト"""
+        file_path = os.path.join(self.temp_dir, "report:2")
+        open(file_path, 'wb').close()
+        self.assertEqual(split_page_spec(file_path), (file_path, None))
+    
+    def test_parse_page_spec(self):
+        """PageSelectionへの変換と全ページ指定のテスト"""
+        selection = parse_page_spec("a.pdf:2,-1")
+        self.assertEqual(selection, PageSelection("a.pdf", "2,-1"))
+        self.assertEqual(selection.resolve(5), [1, 4])
+        self.assertEqual(str(selection), "a.pdf:2,-1")
+        self.assertEqual(PageSelection("a.pdf").resolve(3), [0, 1, 2])
+
+if __name__ == '__main__':
+    unittest.main()
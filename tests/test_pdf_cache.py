@@ -0,0 +1,158 @@
+"""
+PDF情報キャッシュのテストモジュール
+"""
+
+import unittest
+import tempfile
+import os
+import shutil
+from unittest import mock
+
+from pypdf import PdfReader
+
+import pdf_merger
+from pdf_merger import PDFMerger
+from utils.pdf_cache import PDFInfoCache
+from tests.test_pdf_merger import make_pdf
+
+class TestPDFInfoCache(unittest.TestCase):
+    """PDFInfoCacheクラスのテスト"""
+    
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = PDFInfoCache(os.path.join(self.temp_dir, "cache", "info.sqlite3"), max_entries=3)
+        # キャッシュは文書全体を解析する場合に使うため、簡易解析を無効にして検証する
+        self.merger = PDFMerger(cache=self.cache, fast_info=False)
+    
+    def tearDown(self):
+        """テスト後処理"""
+        self.cache.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_get_pdf_info_uses_cache(self):
+        """2回目のget_pdf_infoで再解析しないテスト"""
+        file_path = make_pdf(os.path.join(self.temp_dir, "a.pdf"), 3)
+        
+        first = self.merger.get_pdf_info(file_path)
+        with mock.patch.object(pdf_merger, "PdfReader", wraps=PdfReader) as reader_mock:
+            second = self.merger.get_pdf_info(file_path)
+        
+        self.assertEqual(reader_mock.call_count, 0)
+        self.assertEqual(first, second)
+        self.assertEqual(second['page_count'], 3)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertEqual(self.cache.hit_rate, 0.5)
+    
+    def test_fast_info_bypasses_cache(self):
+        """簡易解析できるファイルではキャッシュを参照せず、文書全体を解析するファイルのみキャッシュするテスト"""
+        file_path = make_pdf(os.path.join(self.temp_dir, "a.pdf"), 3)
+        merger = PDFMerger(cache=self.cache)
+        
+        self.assertEqual(merger.get_pdf_info(file_path)['page_count'], 3)
+        self.assertEqual((self.cache.hits, self.cache.misses, len(self.cache)), (0, 0, 0))
+        
+        with mock.patch.object(pdf_merger, "probe_pdf", side_effect=pdf_merger.PDFProbeError("unsupported")):
+            merger.get_pdf_info(file_path)
+            with mock.patch.object(pdf_merger, "PdfReader", wraps=PdfReader) as reader_mock:
+                self.assertEqual(merger.get_pdf_info(file_path)['page_count'], 3)
+        
+        self.assertEqual(reader_mock.call_count, 0)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+    
+    def test_cache_persists_across_instances(self):
+        """キャッシュがDBファイルに永続化されるテスト"""
+        file_path = make_pdf(os.path.join(self.temp_dir, "a.pdf"), 2)
+        self.merger.get_pdf_info(file_path)
+        
+        other = PDFInfoCache(self.cache.db_path)
+        try:
+            self.assertEqual(other.get(other.fingerprint(file_path))['page_count'], 2)
+        finally:
+            other.close()
+    
+    def test_modified_file_invalidates_entry(self):
+        """ファイル変更時にエントリが無効化されるテスト"""
+        file_path = make_pdf(os.path.join(self.temp_dir, "a.pdf"), 2)
+        self.merger.get_pdf_info(file_path)
+        
+        make_pdf(file_path, 5)
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        self.assertEqual(self.merger.get_pdf_info(file_path)['page_count'], 5)
+        self.assertEqual(self.cache.hits, 0)
+    
+    def test_content_hash_detects_rewrite_with_same_mtime(self):
+        """内容ハッシュ有効時、更新時刻を保った書き換えを検出するテスト"""
+        cache = PDFInfoCache(os.path.join(self.temp_dir, "hashed.sqlite3"), hash_content=True)
+        try:
+            file_path = make_pdf(os.path.join(self.temp_dir, "a.pdf"), 2)
+            key = cache.fingerprint(file_path)
+            cache.put(key, 2, {})
+            
+            with open(file_path, 'r+b') as file:
+                file.seek(-1, os.SEEK_END)
+                file.write(b" ")
+            os.utime(file_path, ns=(key.mtime_ns, key.mtime_ns))
+            
+            self.assertIsNone(cache.get(cache.fingerprint(file_path)))
+        finally:
+            cache.close()
+    
+    def test_lru_eviction(self):
+        """最大エントリ数を超えると最終参照の古いものから削除されるテスト"""
+        file_paths = [make_pdf(os.path.join(self.temp_dir, f"{i}.pdf")) for i in range(4)]
+        keys = [self.cache.fingerprint(file_path) for file_path in file_paths]
+        
+        for key in keys[:3]:
+            self.cache.put(key, 1, {})
+        # 最初のエントリを参照して最新にする
+        self.assertIsNotNone(self.cache.get(keys[0]))
+        self.cache.put(keys[3], 1, {})
+        
+        self.assertEqual(len(self.cache), 3)
+        self.assertIsNotNone(self.cache.get(keys[0]))
+        self.assertIsNone(self.cache.get(keys[1]))
+    
+    def test_hit_access_time_survives_reopen(self):
+        """ヒット時の最終参照時刻がclose後に開き直したDBに保存されているテスト"""
+        file_path = make_pdf(os.path.join(self.temp_dir, "a.pdf"))
+        key = self.cache.fingerprint(file_path)
+        with mock.patch("utils.pdf_cache.time.time", return_value=1000.0):
+            self.cache.put(key, 1, {})
+        with mock.patch("utils.pdf_cache.time.time", return_value=2000.0):
+            self.assertIsNotNone(self.cache.get(key))
+        self.cache.close()
+        
+        cache = PDFInfoCache(self.cache.db_path)
+        try:
+            row = cache._connection.execute("SELECT last_access FROM pdf_info WHERE path = ?", (key.path,)).fetchone()
+            self.assertEqual(row[0], 2000.0)
+        finally:
+            cache.close()
+    
+    def test_hits_do_not_write(self):
+        """ヒットではDBに書き込まず、最終参照時刻はclose時に書き戻すテスト"""
+        file_paths = [make_pdf(os.path.join(self.temp_dir, f"{i}.pdf")) for i in range(4)]
+        keys = [self.cache.fingerprint(file_path) for file_path in file_paths]
+        for key in keys[:3]:
+            self.cache.put(key, 1, {})
+        
+        changes = self.cache._connection.total_changes
+        for _ in range(10):
+            self.assertIsNotNone(self.cache.get(keys[0]))
+        self.assertEqual(self.cache._connection.total_changes, changes)
+        
+        # 書き戻した最終参照時刻は次回の起動時のLRUにも反映される
+        self.cache.close()
+        cache = PDFInfoCache(self.cache.db_path, max_entries=3)
+        try:
+            cache.put(keys[3], 1, {})
+            self.assertIsNotNone(cache.get(keys[0]))
+            self.assertIsNone(cache.get(keys[1]))
+        finally:
+            cache.close()
+
+if __name__ == '__main__':
+    unittest.main()
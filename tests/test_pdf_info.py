@@ -0,0 +1,94 @@
+"""
+PDFファイル情報のテストモジュール
+"""
+
+import unittest
+import tempfile
+import gc
+import os
+import shutil
+import tracemalloc
+
+from pypdf import PdfReader, PdfWriter
+
+from pdf_merger import PDFMerger
+from utils.pdf_info import PDFInfo, compact_metadata
+from benchmarks.corpus import make_pdf
+
+class TestPDFInfo(unittest.TestCase):
+    """PDFInfoとget_pdf_infoの戻り値のテスト"""
+
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+        writer = PdfWriter(clone_from=make_pdf(os.path.join(self.temp_dir, "plain.pdf"), 3))
+        writer.add_metadata({'/Title': 'タイトル', '/Author': '著者', '/Custom': 'x' * 100})
+        self.file_path = os.path.join(self.temp_dir, "a.pdf")
+        writer.write(self.file_path)
+
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_dict_compatible(self):
+        """従来の辞書と同じ形式で参照・変更できるテスト"""
+        info = PDFMerger().get_pdf_info(self.file_path)
+        self.assertIsInstance(info, PDFInfo)
+        self.assertEqual(info['file_name'], "a.pdf")
+        self.assertEqual(info['page_count'], 3)
+        self.assertEqual(info['file_size'], os.path.getsize(self.file_path))
+        self.assertNotIn('page_range', info)
+        self.assertIsNone(info.get('page_range'))
+
+        info['page_range'] = "1-3"
+        self.assertEqual(info.get('page_range'), "1-3")
+        self.assertEqual(info.pop('page_range', None), "1-3")
+        self.assertIsNone(info.pop('page_range', None))
+        self.assertEqual(info, {'file_path': self.file_path, 'file_name': "a.pdf", 'page_count': 3,
+                                'file_size': info.file_size, 'metadata': info.metadata})
+        with self.assertRaises(KeyError):
+            info['file_name'] = "b.pdf"
+
+    def test_metadata_whitelist(self):
+        """必要な文書情報のキーだけを文字列で保持するテスト"""
+        for fast_info in (True, False):
+            with self.subTest(fast_info=fast_info):
+                metadata = PDFMerger(fast_info=fast_info).get_pdf_info(self.file_path).metadata
+                self.assertEqual(metadata['/Title'], 'タイトル')
+                self.assertEqual(metadata['/Author'], '著者')
+                self.assertNotIn('/Custom', metadata)
+                self.assertTrue(all(type(value) is str for value in metadata.values()))
+
+        self.assertEqual(compact_metadata(PdfReader(self.file_path).metadata)['/Title'], 'タイトル')
+        self.assertEqual(compact_metadata(None), {})
+
+    def test_memory_stays_flat(self):
+        """5,000件のファイル情報を保持しても解析した文書がメモリに残らないテスト"""
+        file_paths = []
+        for index in range(5000):
+            file_path = os.path.join(self.temp_dir, f"{index}.pdf")
+            os.link(self.file_path, file_path)
+            file_paths.append(file_path)
+
+        # 文書全体の解析はtracemalloc下では遅いため件数を減らす
+        for fast_info, file_count in ((True, 5000), (False, 500)):
+            with self.subTest(fast_info=fast_info):
+                merger = PDFMerger(fast_info=fast_info)
+                gc.collect()
+                tracemalloc.start()
+                try:
+                    before = tracemalloc.get_traced_memory()[0]
+                    infos = [merger.get_pdf_info(file_path) for file_path in file_paths[:file_count]]
+                    gc.collect()
+                    retained = tracemalloc.get_traced_memory()[0] - before
+                finally:
+                    tracemalloc.stop()
+
+                self.assertTrue(all(info['page_count'] == 3 for info in infos))
+                # 1件あたりは数百バイト程度（readerを保持すると1件あたり数KB以上になる）
+                self.assertLess(retained / file_count, 2048)
+                self.assertFalse(any(isinstance(obj, PdfReader) for obj in gc.get_objects()))
+                del infos
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,10 +4,32 @@ PDF結合機能のテストモジュール
 
 import unittest
 import tempfile
+import threading
 import os
+import shutil
+import tracemalloc
 from pathlib import Path
+from unittest import mock
 
-from pdf_merger import PDFMerger, PDFMergerError
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import DecodedStreamObject
+
+import pdf_merger
+from pdf_merger import MergeJob, MergeProgress, PDFMerger, PDFMergerError
+from utils.page_range import PageSelection
+
+def make_pdf(file_path: str, page_count: int = 1, payload_bytes: int = 0) -> str:
+    """テスト用のPDFファイルを作成"""
+    writer = PdfWriter()
+    for page_num in range(page_count):
+        page = writer.add_blank_page(width=612, height=792)
+        if payload_bytes:
+            content = DecodedStreamObject()
+            content.set_data(b"% " + os.urandom(payload_bytes // 2).hex().encode() + b"\n")
+            page.replace_contents(content)
+    with open(file_path, 'wb') as file:
+        writer.write(file)
+    return file_path
 
 class TestPDFMerger(unittest.TestCase):
     """PDFMergerクラスのテスト"""
@@ -17,6 +39,10 @@ class TestPDFMerger(unittest.TestCase):
         self.merger = PDFMerger()
         self.temp_dir = tempfile.mkdtemp()
     
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
     def test_initialization(self):
         """初期化テスト"""
         self.assertIsNotNone(self.merger.writer)
@@ -24,6 +50,361 @@ class TestPDFMerger(unittest.TestCase):
     def test_validate_pdf_file_not_pdf(self):
         """PDFでないファイルの検証テスト"""
         self.assertFalse(self.merger.validate_pdf_file("test.txt"))
+    
+    def test_merge_pdfs_page_count(self):
+        """結合後の総ページ数テスト"""
+        first = make_pdf(os.path.join(self.temp_dir, "a.pdf"), 2)
+        second = make_pdf(os.path.join(self.temp_dir, "b.pdf"), 3)
+        output_path = os.path.join(self.temp_dir, "out", "merged.pdf")
+        
+        self.assertTrue(self.merger.merge_pdfs([first, second], output_path))
+        self.assertEqual(len(PdfReader(output_path).pages), 5)
+    
+    def test_merge_pdfs_parses_each_input_once(self):
+        """結合時に各入力を一度だけ解析するテスト"""
+        pdf_files = [make_pdf(os.path.join(self.temp_dir, f"{i}.pdf"), 2) for i in range(3)]
+        output_path = os.path.join(self.temp_dir, "merged.pdf")
+        
+        with mock.patch.object(pdf_merger, "PdfReader", wraps=PdfReader) as reader_mock:
+            self.assertTrue(self.merger.merge_pdfs(pdf_files, output_path))
+        
+        self.assertEqual(reader_mock.call_count, len(pdf_files))
+    
+    def test_merge_pdfs_missing_file(self):
+        """存在しないファイルを含む結合の失敗テスト"""
+        first = make_pdf(os.path.join(self.temp_dir, "a.pdf"))
+        missing = os.path.join(self.temp_dir, "missing.pdf")
+        output_path = os.path.join(self.temp_dir, "merged.pdf")
+        
+        self.assertFalse(self.merger.merge_pdfs([first, missing], output_path))
+    
+    def test_merge_page_specs(self):
+        """ページ範囲指定で選択したページだけを指定順に結合するテスト"""
+        first = make_pdf(os.path.join(self.temp_dir, "a.pdf"), 5, payload_bytes=64)
+        second = make_pdf(os.path.join(self.temp_dir, "b.pdf"), 3, payload_bytes=64)
+        output_path = os.path.join(self.temp_dir, "merged.pdf")
+        
+        for streaming in (False, True):
+            merger = PDFMerger(streaming=streaming)
+            self.assertTrue(merger.merge_page_specs([f"{first}:1-2,5", f"{second}:-1"], output_path))
+            
+            expected = [PdfReader(first).pages[i] for i in (0, 1, 4)] + [PdfReader(second).pages[2]]
+            merged = PdfReader(output_path).pages
+            self.assertEqual([page.extract_text() for page in merged], [page.extract_text() for page in expected])
+            self.assertEqual([page.get_contents().get_data() for page in merged],
+                             [page.get_contents().get_data() for page in expected])
+    
+    def test_merge_page_range_out_of_bounds(self):
+        """ページ数を超える範囲の指定で結合が失敗するテスト"""
+        first = make_pdf(os.path.join(self.temp_dir, "a.pdf"), 2)
+        output_path = os.path.join(self.temp_dir, "merged.pdf")
+        
+        self.assertFalse(self.merger.merge_pdfs([PageSelection(first, "3")], output_path))
+        self.assertFalse(os.path.exists(output_path))
+    
+    def test_get_pdf_info(self):
+        """PDFファイル情報取得テスト"""
+        file_path = make_pdf(os.path.join(self.temp_dir, "info.pdf"), 4)
+        
+        info = self.merger.get_pdf_info(file_path)
+        
+        self.assertEqual(info['page_count'], 4)
+        self.assertEqual(info['file_name'], "info.pdf")
+        self.assertEqual(info['file_size'], Path(file_path).stat().st_size)
+
+class TestStreamingMerge(unittest.TestCase):
+    """ストリーミング書き出しモードのテスト"""
+    
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_path = os.path.join(self.temp_dir, "merged.pdf")
+    
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _peak_memory(self, merger: PDFMerger, pdf_files) -> int:
+        """結合処理中のピークメモリ（バイト）を計測"""
+        tracemalloc.start()
+        try:
+            self.assertTrue(merger.merge_pdfs(pdf_files, self.output_path))
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    
+    def test_streaming_merge_output(self):
+        """ストリーミング結合の出力内容テスト"""
+        first = make_pdf(os.path.join(self.temp_dir, "a.pdf"), 2, payload_bytes=1000)
+        second = make_pdf(os.path.join(self.temp_dir, "b.pdf"), 3, payload_bytes=1000)
+        
+        self.assertTrue(PDFMerger(streaming=True).merge_pdfs([first, second], self.output_path))
+        
+        reader = PdfReader(self.output_path, strict=True)
+        self.assertEqual(len(reader.pages), 5)
+        self.assertEqual(reader.metadata.title, "PDF結合ファイル")
+        with open(second, 'rb') as file:
+            expected = PdfReader(file).pages[0].get_contents().get_data()
+        self.assertEqual(reader.pages[2].get_contents().get_data(), expected)
+    
+    def test_streaming_merge_failure_removes_output(self):
+        """ストリーミング結合失敗時に書きかけの出力を残さないテスト"""
+        first = make_pdf(os.path.join(self.temp_dir, "a.pdf"))
+        missing = os.path.join(self.temp_dir, "missing.pdf")
+        
+        self.assertFalse(PDFMerger(streaming=True).merge_pdfs([first, missing], self.output_path))
+        self.assertFalse(os.path.exists(self.output_path))
+    
+    def test_streaming_peak_memory_bounded_by_largest_input(self):
+        """ストリーミング結合のピークメモリが入力数に比例しないことのテスト"""
+        pdf_files = [
+            make_pdf(os.path.join(self.temp_dir, f"{i}.pdf"), 4, payload_bytes=100_000)
+            for i in range(12)
+        ]
+        
+        single_peak = self._peak_memory(PDFMerger(streaming=True), pdf_files[:1])
+        streaming_peak = self._peak_memory(PDFMerger(streaming=True), pdf_files)
+        in_memory_peak = self._peak_memory(PDFMerger(), pdf_files)
+        
+        self.assertLess(streaming_peak, single_peak * 2)
+        self.assertLess(streaming_peak, in_memory_peak / 3)
+
+class TestMergeBatch(unittest.TestCase):
+    """バッチ結合APIのテスト"""
+    
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.first = make_pdf(os.path.join(self.temp_dir, "a.pdf"), 1)
+        self.second = make_pdf(os.path.join(self.temp_dir, "b.pdf"), 2)
+    
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _jobs(self):
+        return [
+            MergeJob([self.first, self.second], os.path.join(self.temp_dir, "ok1.pdf")),
+            ([self.first, os.path.join(self.temp_dir, "missing.pdf")], os.path.join(self.temp_dir, "ng.pdf")),
+            MergeJob([self.second], os.path.join(self.temp_dir, "ok2.pdf")),
+        ]
+    
+    def _assert_results(self, results):
+        self.assertEqual([result.success for result in results], [True, False, True])
+        self.assertEqual([result.page_count for result in results], [3, 0, 2])
+        self.assertIn("missing.pdf", results[1].error)
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, "ng.pdf")))
+        self.assertEqual(len(PdfReader(os.path.join(self.temp_dir, "ok2.pdf")).pages), 2)
+    
+    def test_merge_batch_sequential(self):
+        """同一プロセスでのバッチ結合と失敗の分離テスト"""
+        reported = []
+        results = PDFMerger().merge_batch(self._jobs(), max_workers=1, on_result=reported.append)
+        
+        self._assert_results(results)
+        self.assertEqual(len(reported), 3)
+    
+    def test_merge_batch_process_pool(self):
+        """プロセスプールでのバッチ結合と失敗の分離テスト"""
+        results = PDFMerger(streaming=True).merge_batch(self._jobs(), max_workers=2)
+        
+        self._assert_results(results)
+
+class TestValidateMany(unittest.TestCase):
+    """validate_manyのテスト"""
+    
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.valid = make_pdf(os.path.join(self.temp_dir, "ok.pdf"), 3)
+        self.encrypted = os.path.join(self.temp_dir, "locked.pdf")
+        writer = PdfWriter(clone_from=self.valid)
+        writer.encrypt(user_password="secret", owner_password="owner", algorithm="RC4-128")
+        writer.write(self.encrypted)
+        self.empty = os.path.join(self.temp_dir, "empty.pdf")
+        PdfWriter().write(self.empty)
+        self.broken = os.path.join(self.temp_dir, "broken.pdf")
+        with open(self.broken, 'wb') as file:
+            file.write(b"%PDF-1.7\n1 0 obj\n<< /Type /Catalog")
+        self.renamed = os.path.join(self.temp_dir, "photo.pdf")
+        with open(self.renamed, 'wb') as file:
+            file.write(b"\xff\xd8\xff\xe0 JFIF" + b"\x00" * 64)
+        self.text = os.path.join(self.temp_dir, "notes.txt")
+        Path(self.text).write_text("memo")
+        
+        self.inputs = [
+            self.valid, os.path.join(self.temp_dir, "missing.pdf"), self.text, self.renamed,
+            self.encrypted, self.empty, self.broken, PageSelection(self.valid, "2-5")
+        ]
+        self.expected = ['ok', 'missing', 'not_pdf', 'not_pdf', 'encrypted', 'no_pages', 'parse_error',
+                         'invalid_range']
+    
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_structured_results(self):
+        """失敗の種類ごとの結果を入力順に返すテスト"""
+        for max_workers in (1, 4):
+            with self.subTest(max_workers=max_workers):
+                results = PDFMerger().validate_many(self.inputs, max_workers=max_workers)
+                
+                self.assertEqual([result.status for result in results], self.expected)
+                self.assertTrue(results[0].ok)
+                self.assertEqual(results[0].page_count, 3)
+                self.assertIsNone(results[0].error)
+                self.assertTrue(all(result.error for result in results[1:]))
+                self.assertTrue(all(result.elapsed >= 0 for result in results))
+    
+    def test_process_pool(self):
+        """プロセスプールでの検証テスト"""
+        results = PDFMerger().validate_many(self.inputs, max_workers=2, use_processes=True)
+        
+        self.assertEqual([result.status for result in results], self.expected)
+    
+    def test_merge_reports_validation_status(self):
+        """結合時の入力エラーも同じ種類で送出されるテスト"""
+        merger = PDFMerger()
+        with self.assertRaises(pdf_merger.PDFValidationError) as context:
+            merger._merge([self.valid, self.encrypted], os.path.join(self.temp_dir, "out.pdf"))
+        
+        self.assertEqual(context.exception.status, 'encrypted')
+        self.assertFalse(merger.validate_pdf_file(self.encrypted))
+
+class TestReadAhead(unittest.TestCase):
+    """入力の先読みのテスト"""
+    
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_path = os.path.join(self.temp_dir, "merged.pdf")
+        # ページ数を変えて、出力のページ順序から入力順序を確認できるようにする
+        self.pdf_files = [
+            make_pdf(os.path.join(self.temp_dir, f"{i}.pdf"), i + 1, payload_bytes=100)
+            for i in range(6)
+        ]
+    
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _contents(self, file_path: str):
+        with open(file_path, 'rb') as file:
+            return [page.get_contents().get_data() for page in PdfReader(file).pages]
+    
+    def test_read_ahead_preserves_order(self):
+        """先読み有効時も入力順序どおりに結合されるテスト"""
+        expected = [data for file_path in self.pdf_files for data in self._contents(file_path)]
+        
+        for streaming in (False, True):
+            merger = PDFMerger(streaming=streaming, read_ahead=3)
+            self.assertTrue(merger.merge_pdfs(self.pdf_files, self.output_path))
+            self.assertEqual(self._contents(self.output_path), expected)
+    
+    def _track_open_files(self, merger: PDFMerger) -> dict:
+        """_open_pdfを差し替えて、開いているファイル数と最大同時数を記録する"""
+        counts = {'open': 0, 'max': 0}
+        original_open = merger._open_pdf
+        
+        def tracking_open(file_path, **kwargs):
+            opened = original_open(file_path, **kwargs)
+            original_close = opened.close
+            
+            def close():
+                if opened.reader is not None:
+                    counts['open'] -= 1
+                original_close()
+            
+            opened.close = close
+            counts['open'] += 1
+            counts['max'] = max(counts['max'], counts['open'])
+            return opened
+        
+        merger._open_pdf = tracking_open
+        return counts
+    
+    def test_read_ahead_bounds_open_files(self):
+        """同時に開くファイル数が read_ahead + 1 件に収まるテスト"""
+        merger = PDFMerger(read_ahead=2)
+        counts = self._track_open_files(merger)
+        
+        self.assertTrue(merger.merge_pdfs(self.pdf_files, self.output_path))
+        
+        self.assertLessEqual(counts['max'], 3)
+        self.assertEqual(counts['open'], 0)
+    
+    def test_read_ahead_failure_closes_pending(self):
+        """途中の入力が不正な場合に失敗し、先読み済みのファイルを閉じるテスト"""
+        pdf_files = self.pdf_files[:2] + [os.path.join(self.temp_dir, "missing.pdf")] + self.pdf_files[2:]
+        merger = PDFMerger(read_ahead=3)
+        counts = self._track_open_files(merger)
+        
+        self.assertFalse(merger.merge_pdfs(pdf_files, self.output_path))
+        self.assertEqual(counts['open'], 0)
+
+class TestMergeProgress(unittest.TestCase):
+    """進捗通知とキャンセルのテスト"""
+    
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_path = os.path.join(self.temp_dir, "merged.pdf")
+        self.pdf_files = [
+            make_pdf(os.path.join(self.temp_dir, f"{i}.pdf"), 3, payload_bytes=200_000)
+            for i in range(3)
+        ]
+    
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_progress_events(self):
+        """ページ・ファイル・書き出しバイト数の進捗が通知されるテスト"""
+        for streaming in (False, True):
+            events = []
+            merger = PDFMerger(streaming=streaming)
+            
+            self.assertTrue(merger.merge_pdfs(self.pdf_files, self.output_path, progress_callback=events.append))
+            
+            self.assertTrue(all(isinstance(event, MergeProgress) for event in events))
+            self.assertEqual(sorted({event.current_file for event in events if event.current_file}),
+                             sorted(self.pdf_files))
+            self.assertEqual([event.pages_copied for event in events if event.phase == 'copy'][-1], 9)
+            self.assertTrue(any(0 < event.bytes_written for event in events[:-1]))
+            self.assertEqual(events[-1].phase, 'done')
+            self.assertEqual(events[-1].file_index, 2)
+            self.assertEqual(events[-1].bytes_written, os.path.getsize(self.output_path))
+    
+    def test_cancel_during_copy(self):
+        """ページコピー中のキャンセルで結合を中止するテスト"""
+        for streaming in (False, True):
+            cancel_event = threading.Event()
+            
+            def on_progress(event):
+                if event.pages_copied >= 4:
+                    cancel_event.set()
+            
+            merger = PDFMerger(streaming=streaming)
+            result = merger.merge_pdfs(self.pdf_files, self.output_path,
+                                       progress_callback=on_progress, cancel_event=cancel_event)
+            
+            self.assertFalse(result)
+            self.assertFalse(os.path.exists(self.output_path))
+    
+    def test_cancel_during_write_removes_partial_output(self):
+        """書き出し中のキャンセルで書きかけの出力を削除するテスト"""
+        cancel_event = threading.Event()
+        
+        def on_progress(event):
+            if event.phase == 'write' and event.bytes_written > 0:
+                cancel_event.set()
+        
+        result = PDFMerger().merge_pdfs(self.pdf_files, self.output_path,
+                                        progress_callback=on_progress, cancel_event=cancel_event)
+        
+        self.assertFalse(result)
+        self.assertTrue(cancel_event.is_set())
+        self.assertFalse(os.path.exists(self.output_path))
 
 if __name__ == '__main__':
     unittest.main()
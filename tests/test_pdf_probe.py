@@ -0,0 +1,148 @@
+"""
+PDF簡易解析のテストモジュール
+"""
+
+import unittest
+import tempfile
+import os
+import shutil
+import zlib
+from unittest import mock
+
+from pypdf import PdfReader, PdfWriter
+
+import pdf_merger
+from pdf_merger import PDFMerger
+from utils.pdf_info import compact_metadata
+from utils.pdf_probe import PDFProbeError, probe_pdf
+from benchmarks.corpus import make_pdf
+
+def make_predictor_xref_pdf(file_path: str, page_count: int) -> str:
+    """PNG予測（Up）付きの相互参照ストリームを持つ最小限のPDFを作成"""
+    body = bytearray(b"%PDF-1.5\n")
+    offsets = []
+    for obj in (b"<< /Type /Catalog /Pages 2 0 R >>",
+                b"<< /Type /Pages /Kids [] /Count %d >>" % page_count):
+        offsets.append(len(body))
+        body += b"%d 0 obj\n" % (len(offsets)) + obj + b"\nendobj\n"
+    offsets.append(len(body))
+
+    rows = [bytes([0, 0, 0, 255])] + [bytes([1]) + offset.to_bytes(2, "big") + b"\x00" for offset in offsets]
+    encoded = bytearray()
+    previous = bytes(4)
+    for row in rows:
+        encoded += b"\x02" + bytes((value - upper) & 0xFF for value, upper in zip(row, previous))
+        previous = row
+    data = zlib.compress(bytes(encoded))
+
+    body += (b"3 0 obj\n<< /Type /XRef /Size 4 /W [1 2 1] /Root 1 0 R /Filter /FlateDecode "
+             b"/DecodeParms << /Predictor 12 /Columns 4 >> /Length %d >>\nstream\n" % len(data))
+    body += data + b"\nendstream\nendobj\n"
+    body += b"startxref\n%d\n%%%%EOF\n" % offsets[-1]
+    with open(file_path, 'wb') as file:
+        file.write(body)
+    return file_path
+
+class TestPDFProbe(unittest.TestCase):
+    """probe_pdfとget_pdf_infoの簡易解析のテスト"""
+
+    def setUp(self):
+        """テスト前処理"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_path = make_pdf(os.path.join(self.temp_dir, "a.pdf"), 7)
+
+    def tearDown(self):
+        """テスト後処理"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def assert_matches_full_parse(self, file_path: str):
+        """簡易解析の結果が文書全体の解析と一致することを確認"""
+        reader = PdfReader(file_path)
+        probe = probe_pdf(file_path)
+        self.assertEqual(probe.page_count, len(reader.pages))
+        self.assertEqual(compact_metadata(probe.metadata), compact_metadata(reader.metadata))
+
+    def test_xref_table(self):
+        """旧形式の相互参照表・文書情報辞書を読むテスト"""
+        writer = PdfWriter(clone_from=self.file_path)
+        writer.add_metadata({'/Title': '日本語タイトル', '/Author': 'A (b) \\ c', '/Trapped': '/False'})
+        meta_path = os.path.join(self.temp_dir, "meta.pdf")
+        writer.write(meta_path)
+
+        self.assert_matches_full_parse(self.file_path)
+        self.assert_matches_full_parse(meta_path)
+        self.assertEqual(probe_pdf(meta_path).metadata['/Title'], '日本語タイトル')
+
+    def test_object_streams(self):
+        """相互参照ストリーム・オブジェクトストリーム形式を読むテスト"""
+        output_path = os.path.join(self.temp_dir, "compact.pdf")
+        self.assertTrue(PDFMerger(profile="compact").merge_pdfs([self.file_path] * 2, output_path))
+
+        self.assert_matches_full_parse(output_path)
+        self.assertEqual(probe_pdf(output_path).page_count, 14)
+
+    def test_incremental_update(self):
+        """増分更新で/Infoが前のトレーラーにのみある場合のテスト"""
+        writer = PdfWriter(clone_from=self.file_path)
+        writer.add_metadata({'/Title': 'base'})
+        base_path = os.path.join(self.temp_dir, "base.pdf")
+        writer.write(base_path)
+
+        updated = PdfWriter(base_path, incremental=True)
+        updated.add_blank_page(100, 100)
+        updated_path = os.path.join(self.temp_dir, "updated.pdf")
+        updated.write(updated_path)
+
+        self.assert_matches_full_parse(updated_path)
+        self.assertEqual(probe_pdf(updated_path).page_count, 8)
+
+    def test_png_predictor(self):
+        """PNG予測付きの相互参照ストリームを読むテスト"""
+        file_path = make_predictor_xref_pdf(os.path.join(self.temp_dir, "predictor.pdf"), 4)
+        self.assertEqual(probe_pdf(file_path).page_count, 4)
+
+    def test_unsupported_files_raise(self):
+        """破損・暗号化・空のファイルでPDFProbeErrorになるテスト"""
+        encrypted = PdfWriter(clone_from=self.file_path)
+        encrypted.encrypt("secret")
+        encrypted_path = os.path.join(self.temp_dir, "encrypted.pdf")
+        encrypted.write(encrypted_path)
+
+        truncated_path = os.path.join(self.temp_dir, "truncated.pdf")
+        with open(self.file_path, 'rb') as source, open(truncated_path, 'wb') as target:
+            target.write(source.read()[:-100])
+
+        empty_path = os.path.join(self.temp_dir, "empty.pdf")
+        open(empty_path, 'wb').close()
+
+        for file_path in (encrypted_path, truncated_path, empty_path):
+            with self.subTest(file_path=file_path):
+                with self.assertRaises(PDFProbeError):
+                    probe_pdf(file_path)
+
+    def test_get_pdf_info_skips_full_parse(self):
+        """get_pdf_infoが簡易解析できるファイルではPdfReaderを生成しないテスト"""
+        merger = PDFMerger()
+        with mock.patch.object(pdf_merger, "PdfReader", wraps=PdfReader) as reader_mock:
+            info = merger.get_pdf_info(self.file_path)
+
+        self.assertEqual(reader_mock.call_count, 0)
+        self.assertEqual(info, PDFMerger(fast_info=False).get_pdf_info(self.file_path))
+        self.assertEqual(info['page_count'], 7)
+
+    def test_get_pdf_info_falls_back_for_damaged_file(self):
+        """startxrefが壊れたファイルは文書全体の解析で情報を取得するテスト"""
+        with open(self.file_path, 'rb') as file:
+            data = file.read()
+        damaged_path = os.path.join(self.temp_dir, "damaged.pdf")
+        with open(damaged_path, 'wb') as file:
+            file.write(data[:data.rfind(b"startxref")] + b"startxref\n12\n%%EOF\n")
+
+        with mock.patch.object(pdf_merger, "PdfReader", wraps=PdfReader) as reader_mock:
+            info = PDFMerger().get_pdf_info(damaged_path)
+
+        self.assertEqual(reader_mock.call_count, 1)
+        self.assertEqual(info['page_count'], 7)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+GUIの起動時間のテストモジュール
+-X importtimeで計測したモジュールの読み込み時間と、ウィンドウの初回描画までの時間を予算と比較する
+"""
+
+import unittest
+import importlib.util
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+PROJECT_DIR = str(Path(__file__).resolve().parent.parent)
+
+# 読み込み時間の上限（秒）。インタープリタ自体の起動は含まない
+GUI_SUPPORT_IMPORT_BUDGET = 0.2    # GUIが起動時に読み込む自前のモジュール（Tk・CustomTkinterを除く）
+GUI_IMPORT_BUDGET = 1.0            # gui.main_window（CustomTkinter・tkinterdnd2を含む）
+# プロセスの開始からウィンドウの初回描画までの上限（秒）
+FIRST_PAINT_BUDGET = 2.0
+
+# 起動時に読み込まないモジュール（最初に使う時点・初回描画の後に読み込む）
+DEFERRED_MODULES = ("pypdf", "sqlite3", "pdf_merger")
+
+HAS_GUI_DEPENDENCIES = all(importlib.util.find_spec(name) is not None
+                           for name in ("tkinter", "customtkinter", "tkinterdnd2"))
+HAS_DISPLAY = sys.platform in ("win32", "darwin") or bool(os.environ.get("DISPLAY"))
+
+def import_times(code: str, top_level_only: bool = False) -> Dict[str, float]:
+    """
+    -X importtimeでコードを実行し、読み込んだモジュールごとの累積の読み込み時間を取得
+
+    Args:
+        code (str): 実行するコード
+        top_level_only (bool): Trueの場合、codeから直接読み込んだモジュールのみ
+            （Falseの場合は依存して読み込まれたモジュールも含む）
+
+    Returns:
+        Dict[str, float]: モジュール名と読み込み時間（秒）
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=PROJECT_DIR, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # 依存して読み込まれたモジュールは階層に応じて字下げされる
+        if top_level_only and name.startswith("  "):
+            continue
+        times[name.strip()] = int(cumulative) / 1_000_000
+    return times
+
+def top_level_total(code: str, modules) -> float:
+    """指定したモジュールの読み込み時間の合計（秒）"""
+    times = import_times(code, top_level_only=True)
+    return sum(times[name] for name in modules if name in times)
+
+class TestStartup(unittest.TestCase):
+    """GUIの起動時の読み込みのテスト"""
+
+    def test_pdf_merger_does_not_configure_logging(self):
+        """pdf_mergerの読み込みでログ設定を変更しないテスト"""
+        result = subprocess.run(
+            [sys.executable, "-c", "import logging, pdf_merger; print(len(logging.getLogger().handlers))"],
+            cwd=PROJECT_DIR, capture_output=True, text=True, check=True
+        )
+        self.assertEqual(result.stdout.strip(), "0")
+
+    def test_gui_support_modules(self):
+        """GUIが起動時に読み込む自前のモジュールがpypdfなどを読み込まず、予算内に収まるテスト"""
+        modules = ("gui.file_list_model", "utils.output_profile", "utils.page_range")
+        code = "import tkinter; " + "; ".join(f"import {name}" for name in modules)
+        times = import_times(code)
+
+        for name in DEFERRED_MODULES:
+            self.assertNotIn(name, times)
+        # 計測のぶれを避けるため3回の最小値と比較
+        elapsed = min(top_level_total(code, modules) for _ in range(3))
+        self.assertLess(elapsed, GUI_SUPPORT_IMPORT_BUDGET)
+
+    @unittest.skipUnless(HAS_GUI_DEPENDENCIES, "CustomTkinter・tkinterdnd2がインストールされていません")
+    def test_gui_import_budget(self):
+        """gui.main_windowの読み込みがpypdfなどを読み込まず、予算内に収まるテスト"""
+        times = import_times("import gui.main_window")
+
+        for name in DEFERRED_MODULES:
+            self.assertNotIn(name, times)
+        elapsed = min(top_level_total("import gui.main_window", ["gui.main_window"]) for _ in range(3))
+        self.assertLess(elapsed, GUI_IMPORT_BUDGET)
+
+    @unittest.skipUnless(HAS_GUI_DEPENDENCIES and HAS_DISPLAY, "GUIを表示できる環境ではありません")
+    def test_first_paint_budget(self):
+        """ウィンドウの初回描画までpypdfを読み込まず、予算内に描画されるテスト"""
+        code = (
+            "import time; start = time.perf_counter()\n"
+            "import sys, customtkinter\n"
+            "from gui.main_window import PDFMergerApp\n"
+            "app = PDFMergerApp(); app.update()\n"
+            "print(time.perf_counter() - start, 'pypdf' in sys.modules)\n"
+            "app.destroy()\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_DIR,
+                                capture_output=True, text=True, check=True)
+        elapsed, pypdf_loaded = result.stdout.split()[-2:]
+
+        self.assertEqual(pypdf_loaded, "False")
+        self.assertLess(float(elapsed), FIRST_PAINT_BUDGET)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+アトミック出力モジュール
+出力を同じディレクトリの一時ファイルに書き出し、完了後にos.replaceで置き換える
+（書き出し中の異常終了・キャンセルでも、既存の出力ファイルは元の内容のまま残る）
+"""
+
+import os
+import secrets
+import shutil
+from pathlib import Path
+from typing import BinaryIO, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# fsyncの方針
+#   none:     fsyncしない（最速。OSの異常終了時は内容が失われる可能性がある）
+#   file:     置き換え前に一時ファイルの内容をfsyncする（置き換え後のファイルが不完全になることはない）
+#   file+dir: さらに置き換え後にディレクトリをfsyncし、置き換え自体を永続化する
+FSYNC_POLICIES = ("none", "file", "file+dir")
+DEFAULT_FSYNC = "file"
+
+class AtomicOutputFile:
+    """
+    出力ファイルへのアトミックな書き出し
+
+    with文で使用し、ブロックを正常に抜けた場合のみ出力ファイルを置き換える。
+    例外で抜けた場合は一時ファイルを削除し、出力ファイルは変更しない
+    """
+
+    def __init__(self, output_path: str, fsync: str = DEFAULT_FSYNC, copy_existing: bool = False):
+        """
+        Args:
+            output_path (str): 出力ファイルパス
+            fsync (str): fsyncの方針（none / file / file+dir）
+            copy_existing (bool): Trueの場合、既存の出力ファイルの内容を複製した一時ファイルの末尾から書き出す
+                （増分更新の追記用。複製はOSのファイルコピー機能を使うためデータはPythonを経由しない）
+
+        Raises:
+            ValueError: 未知のfsyncの方針の場合
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"未知のfsyncの方針です: {fsync} (指定可能: {', '.join(FSYNC_POLICIES)})")
+        self.output_path = str(output_path)
+        self.fsync = fsync
+        self.copy_existing = copy_existing
+        self.temp_path: Optional[str] = None
+        self._file: Optional[BinaryIO] = None
+
+    def __enter__(self) -> BinaryIO:
+        output = Path(self.output_path)
+        while True:
+            # 通常のopenと同じくumaskを適用した権限で作成するため、mkstempではなくO_EXCLで作成する
+            temp_path = output.with_name(f".{output.name}.{secrets.token_hex(4)}.tmp")
+            try:
+                fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+                break
+            except FileExistsError:
+                continue
+
+        self.temp_path = str(temp_path)
+        if not self.copy_existing:
+            self._file = os.fdopen(fd, 'wb')
+            return self._file
+
+        os.close(fd)
+        try:
+            shutil.copyfile(self.output_path, self.temp_path)
+            self._file = open(self.temp_path, 'ab')
+        except BaseException:
+            self.discard()
+            raise
+        return self._file
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+        return False
+
+    def commit(self) -> None:
+        """一時ファイルの内容で出力ファイルを置き換える"""
+        try:
+            self._file.flush()
+            if self.fsync != "none":
+                os.fsync(self._file.fileno())
+            self._file.close()
+
+            if os.path.exists(self.output_path):
+                # 上書きの場合は既存ファイルの権限を引き継ぐ
+                shutil.copymode(self.output_path, self.temp_path)
+            os.replace(self.temp_path, self.output_path)
+        except BaseException:
+            self.discard()
+            raise
+
+        if self.fsync == "file+dir":
+            _fsync_directory(str(Path(self.output_path).parent))
+
+    def discard(self) -> None:
+        """一時ファイルを削除（出力ファイルは変更しない）"""
+        if self._file is not None and not self._file.closed:
+            self._file.close()
+        if self.temp_path is not None:
+            Path(self.temp_path).unlink(missing_ok=True)
+
+def _fsync_directory(directory: str) -> None:
+    """ディレクトリエントリの変更を永続化（ディレクトリを開けないOSでは何もしない）"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError as e:
+        logger.debug(f"ディレクトリをfsyncできません: {directory}, 理由: {e}")
+        return
+    try:
+        os.fsync(fd)
+    except OSError as e:
+        logger.debug(f"ディレクトリをfsyncできません: {directory}, 理由: {e}")
+    finally:
+        os.close(fd)
+
+def atomic_output(output_path: str, fsync: str = DEFAULT_FSYNC, copy_existing: bool = False) -> AtomicOutputFile:
+    """
+    出力ファイルをアトミックに書き出すコンテキストマネージャーを作成
+
+    使用例:
+        with atomic_output("out.pdf") as file:
+            writer.write(file)
+
+    Args:
+        output_path (str): 出力ファイルパス
+        fsync (str): fsyncの方針（none / file / file+dir）
+        copy_existing (bool): Trueの場合、既存の出力ファイルの内容に続けて書き出す
+
+    Returns:
+        AtomicOutputFile: with文で一時ファイルのファイルオブジェクトを返すコンテキストマネージャー
+    """
+    return AtomicOutputFile(output_path, fsync, copy_existing)
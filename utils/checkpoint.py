@@ -0,0 +1,139 @@
+"""
+バッチ結合のチェックポイントモジュール
+完了したジョブの出力と、その時点の入力・設定のフィンガープリントをJSONに記録し、
+再実行時に最新の出力が揃っているジョブを省略できるようにする
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+import logging
+
+from utils.atomic_output import atomic_output
+from utils.page_range import PageSelection
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+def file_fingerprint(file_path: str) -> List[int]:
+    """
+    ファイルの状態を表すフィンガープリント
+
+    Args:
+        file_path (str): ファイルパス
+
+    Returns:
+        List[int]: [サイズ, 更新時刻（ナノ秒）]（JSONに保存するためリスト）
+
+    Raises:
+        OSError: ファイルが存在しない場合
+    """
+    stat = os.stat(file_path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+def inputs_fingerprint(pdf_files: List[Union[str, PageSelection]]) -> List[list]:
+    """
+    入力リストのフィンガープリント（順序・ページ範囲・各ファイルの状態）
+
+    Args:
+        pdf_files (List[str | PageSelection]): 入力ファイルのリスト
+
+    Returns:
+        List[list]: 入力ごとの [絶対パス, ページ範囲, サイズ, 更新時刻]
+
+    Raises:
+        OSError: 入力ファイルが存在しない場合
+    """
+    result = []
+    for item in pdf_files:
+        selection = item if isinstance(item, PageSelection) else PageSelection(item)
+        file_path = os.path.abspath(selection.file_path)
+        result.append([file_path, selection.pages, *file_fingerprint(file_path)])
+    return result
+
+class BatchCheckpoint:
+    """
+    バッチ結合のチェックポイント
+
+    出力ファイルごとに、完了時の入力のフィンガープリント・設定のキー・出力ファイルのフィンガープリントを保持する。
+    入力・設定・出力のいずれかが記録と異なる場合は最新でないとみなして再実行する。
+    記録は完了ごとにアトミックに書き出すため、途中で中断しても完了済みのジョブは失われない
+    """
+
+    def __init__(self, path: str, options_key: str = ""):
+        """
+        Args:
+            path (str): チェックポイントファイル（JSON）のパス
+            options_key (str): 出力内容に影響する設定を表すキー（異なる設定の記録は無視する）
+        """
+        self.path = str(path)
+        self.options_key = options_key
+        self._lock = threading.Lock()
+        self._entries: Dict[str, dict] = {}
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            if data.get('version') == CHECKPOINT_VERSION:
+                self._entries = dict(data.get('outputs', {}))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"チェックポイントを読み込めないため最初から実行します: {self.path}, 理由: {e}")
+
+    def completed_page_count(self, pdf_files: List[Union[str, PageSelection]], output_path: str) -> Optional[int]:
+        """
+        ジョブの出力が最新であればそのページ数を返す
+
+        Args:
+            pdf_files (List[str | PageSelection]): ジョブの入力ファイルのリスト
+            output_path (str): ジョブの出力ファイルパス
+
+        Returns:
+            Optional[int]: 最新の場合は出力のページ数、再実行が必要な場合はNone
+        """
+        entry = self._entries.get(os.path.abspath(output_path))
+        if entry is None or entry.get('options') != self.options_key:
+            return None
+        try:
+            if entry.get('output') != file_fingerprint(output_path):
+                return None
+            if entry.get('inputs') != inputs_fingerprint(pdf_files):
+                return None
+        except OSError:
+            return None
+        return entry.get('page_count')
+
+    def mark_complete(self, pdf_files: List[Union[str, PageSelection]], output_path: str,
+                      page_count: int) -> None:
+        """
+        ジョブの完了を記録して保存
+
+        Args:
+            pdf_files (List[str | PageSelection]): ジョブの入力ファイルのリスト
+            output_path (str): ジョブの出力ファイルパス
+            page_count (int): 出力のページ数
+        """
+        try:
+            entry = {
+                'inputs': inputs_fingerprint(pdf_files),
+                'options': self.options_key,
+                'output': file_fingerprint(output_path),
+                'page_count': page_count
+            }
+        except OSError as e:
+            logger.warning(f"チェックポイントに記録できません: {output_path}, 理由: {e}")
+            return
+
+        with self._lock:
+            self._entries[os.path.abspath(output_path)] = entry
+            self._save()
+
+    def _save(self) -> None:
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        data = {'version': CHECKPOINT_VERSION, 'outputs': self._entries}
+        with atomic_output(self.path) as file:
+            file.write(json.dumps(data, ensure_ascii=False, indent=1).encode('utf-8'))
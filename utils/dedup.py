@@ -0,0 +1,140 @@
+"""
+共有リソース重複排除モジュール
+入力間で同一内容のストリームオブジェクト（フォント・画像・フォームXObjectなど）を
+ハッシュ値で検出し、参照を1つの正規オブジェクトにまとめる
+"""
+
+import hashlib
+import time
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Any, Dict, Optional, Set, Tuple
+
+from pypdf import PdfWriter
+from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject, PdfObject, StreamObject
+
+from utils.stream_writer import serialize_object
+
+@dataclass
+class DedupStats:
+    """重複排除の結果"""
+    streams_seen: int = 0     # ハッシュを計算したストリーム数
+    duplicates: int = 0       # 既存のオブジェクトにまとめたストリーム数
+    bytes_saved: int = 0      # 出力から省いたバイト数
+    elapsed: float = 0.0      # ハッシュ計算と照合に要した時間（秒）
+
+class StreamDeduplicator:
+    """
+    ストリームオブジェクトの内容から正規オブジェクトを引く索引
+
+    キーはストリームを書き出した際のバイト列（辞書と内容。参照先の番号は正規化済み）の
+    ハッシュ値のため、辞書・フィルタ・データがすべて同じ場合だけ同一とみなす。
+    保持するのはハッシュ値と正規オブジェクトの対応のみで、ストリームの内容は保持しない。
+    """
+
+    def __init__(self):
+        self.stats = DedupStats()
+        self._index: Dict[bytes, Any] = {}
+
+    def lookup(self, body: bytes) -> Tuple[bytes, Optional[Any]]:
+        """
+        書き出し後のバイト列から既存の正規オブジェクトを検索
+
+        Args:
+            body (bytes): ストリームオブジェクトを書き出したバイト列
+
+        Returns:
+            Tuple[bytes, Optional[Any]]: (ハッシュ値, 既存の正規オブジェクト。初出の場合None)
+        """
+        start = time.perf_counter()
+        digest = hashlib.blake2b(body, digest_size=32).digest()
+        canonical = self._index.get(digest)
+
+        self.stats.streams_seen += 1
+        if canonical is not None:
+            self.stats.duplicates += 1
+            self.stats.bytes_saved += len(body)
+        self.stats.elapsed += time.perf_counter() - start
+        return digest, canonical
+
+    def register(self, digest: bytes, canonical: Any) -> None:
+        """
+        初出のストリームを正規オブジェクトとして登録
+
+        Args:
+            digest (bytes): lookupが返したハッシュ値
+            canonical (Any): 正規オブジェクト（出力内のオブジェクト番号など）
+        """
+        self._index[digest] = canonical
+
+    def clear(self) -> None:
+        """登録済みの正規オブジェクトを破棄（出力ファイルを切り替える場合に使う。statsは引き継ぐ）"""
+        self._index.clear()
+
+def deduplicate_streams(writer: PdfWriter, deduplicator: StreamDeduplicator) -> DedupStats:
+    """
+    PdfWriter内の同一内容のストリームを1つにまとめ、参照を付け替える
+
+    ストリームが別のストリームを参照する場合（画像の/SMaskなど）は参照先を先に正規化するため、
+    参照先が重複していた画像同士も同一と判定できる
+
+    Args:
+        writer (PdfWriter): 全ページを追加済みのライター
+        deduplicator (StreamDeduplicator): 正規オブジェクトの索引
+
+    Returns:
+        DedupStats: 重複排除の結果（deduplicator.statsと同じオブジェクト）
+    """
+    objects = writer._objects
+    canonical_ids: Dict[int, int] = {}
+    in_progress: Set[int] = set()
+
+    def canonical(reference: IndirectObject) -> int:
+        idnum = reference.idnum
+        if idnum in canonical_ids:
+            return canonical_ids[idnum]
+        obj = objects[idnum - 1] if 0 < idnum <= len(objects) else None
+        if not isinstance(obj, StreamObject) or idnum in in_progress:
+            return idnum
+
+        in_progress.add(idnum)
+        body = BytesIO()
+        serialize_object(obj, body, canonical)
+        in_progress.discard(idnum)
+
+        digest, existing = deduplicator.lookup(body.getvalue())
+        if existing is None:
+            deduplicator.register(digest, idnum)
+            existing = idnum
+        canonical_ids[idnum] = existing
+        return existing
+
+    for obj in list(objects):
+        if isinstance(obj, StreamObject) and obj.indirect_reference is not None:
+            canonical(obj.indirect_reference)
+
+    replaced = {idnum: target for idnum, target in canonical_ids.items() if idnum != target}
+    if replaced:
+        for obj in objects:
+            if obj is not None:
+                _replace_references(obj, replaced, writer)
+        for idnum in replaced:
+            objects[idnum - 1] = None
+
+    return deduplicator.stats
+
+def _replace_references(obj: PdfObject, replaced: Dict[int, int], writer: PdfWriter) -> None:
+    """辞書・配列内の重複オブジェクトへの参照を正規オブジェクトへの参照に置き換える"""
+    if isinstance(obj, DictionaryObject):
+        items = list(obj.items())
+    elif isinstance(obj, ArrayObject):
+        items = list(enumerate(obj))
+    else:
+        return
+
+    for key, value in items:
+        if isinstance(value, IndirectObject):
+            if value.idnum in replaced:
+                obj[key] = IndirectObject(replaced[value.idnum], 0, writer)
+        else:
+            _replace_references(value, replaced, writer)
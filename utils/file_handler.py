@@ -7,6 +7,7 @@ import os
 import subprocess
 import platform
 from pathlib import Path
+from typing import Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -46,3 +47,40 @@ class FileHandler:
         except Exception as e:
             logger.error(f"ファイルを開くのに失敗: {file_path}, エラー: {e}")
             return False
+    
+    @staticmethod
+    def normalize_path(file_path: str) -> str:
+        """
+        同じファイルを指すパスが同じ文字列になるよう正規化
+        
+        相対パス・シンボリックリンク・大文字小文字の違い（Windows）を解決する
+        
+        Args:
+            file_path (str): ファイルパス
+            
+        Returns:
+            str: 正規化したパス
+        """
+        return os.path.normcase(os.path.realpath(file_path))
+    
+    @staticmethod
+    def file_identity(file_path: str) -> Optional[Tuple[int, int]]:
+        """
+        ファイルの実体を表す (デバイス番号, inode番号) を取得
+        
+        ハードリンクやネットワークドライブの別名など、パスの正規化では
+        同一と判定できないファイルの重複検出に使う
+        
+        Args:
+            file_path (str): ファイルパス
+            
+        Returns:
+            Optional[Tuple[int, int]]: 取得できない場合はNone
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        if not stat.st_ino:
+            return None
+        return stat.st_dev, stat.st_ino
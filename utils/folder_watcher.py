@@ -0,0 +1,414 @@
+"""
+フォルダ監視モジュール
+監視ルート直下のフォルダ（スキャナーのバッチごとの出力先など）を監視し、
+一定時間変更がなくなったフォルダのPDFを自然順に並べて結合処理に渡す
+
+変更の検出にはLinuxではinotifyを使い、使えない環境ではフォルダの更新時刻を比較するポーリングに切り替える。
+いずれの場合も内容を読み直すのは変更のあったフォルダ（と結合待ちのフォルダ）だけで、
+毎回ツリー全体を走査することはない。
+"""
+
+import os
+import re
+import struct
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 1フォルダ内のPDFの状態（ファイル名 -> (サイズ, 更新時刻ns)）
+FolderSnapshot = Dict[str, Tuple[int, int]]
+
+# 結合に失敗したフォルダを再試行するまでの秒数（失敗するごとに倍にし、上限で頭打ちにする）
+RETRY_SECONDS = 30.0
+MAX_RETRY_SECONDS = 900.0
+
+_DIGITS = re.compile(r"(\d+)")
+
+def natural_sort_key(name: str) -> tuple:
+    """
+    自然順（scan2.pdf < scan10.pdf）で並べるためのキー
+
+    数字の部分を数値として比較し、それ以外の部分は大文字小文字を区別せずに比較する
+
+    Args:
+        name (str): ファイル名
+
+    Returns:
+        tuple: ソートキー
+    """
+    parts = _DIGITS.split(name.casefold())
+    # 数字と文字列が同じ位置で比較されないよう (種別, 値) の組にする
+    return tuple((0, int(part), part) if index % 2 else (1, part, "")
+                 for index, part in enumerate(parts) if part), name
+
+def scan_folder(directory: str) -> FolderSnapshot:
+    """
+    フォルダ直下のPDFファイルのサイズと更新時刻を取得
+
+    隠しファイル（.で始まる名前）と拡張子が.pdf以外のファイル（書き込み中の一時ファイルなど）は含めない
+
+    Args:
+        directory (str): フォルダパス
+
+    Returns:
+        FolderSnapshot: ファイル名とその (サイズ, 更新時刻ns)
+    """
+    snapshot = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.name.lower().endswith(".pdf"):
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            snapshot[entry.name] = (stat.st_size, stat.st_mtime_ns)
+    return snapshot
+
+class _Inotify:
+    """ctypes経由のinotify（Linuxのみ）"""
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+
+    # ルート: フォルダの追加・削除のみ / 監視フォルダ: 内容の変更
+    ROOT_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+    FOLDER_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+                   | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self):
+        import ctypes
+        import ctypes.util
+
+        self._ctypes = ctypes
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            self._raise_errno("inotify_init1")
+
+    def _raise_errno(self, what: str) -> None:
+        errno = self._ctypes.get_errno()
+        raise OSError(errno, f"{what}: {os.strerror(errno)}")
+
+    def add_watch(self, path: str, mask: int) -> int:
+        """監視を追加して監視番号を返す（上限に達した場合などはOSError）"""
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            self._raise_errno(f"inotify_add_watch({path})")
+        return wd
+
+    def remove_watch(self, wd: int) -> None:
+        """監視を解除（既に解除されている場合は何もしない）"""
+        self._libc.inotify_rm_watch(self.fd, wd)
+
+    def read_events(self) -> List[Tuple[int, int]]:
+        """
+        溜まっているイベントを全て読み出す（ブロックしない）
+
+        Returns:
+            List[Tuple[int, int]]: (監視番号, イベントの種類) のリスト
+        """
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, name_length = self._EVENT.unpack_from(data, offset)
+                events.append((wd, mask))
+                offset += self._EVENT.size + name_length
+        return events
+
+    def close(self) -> None:
+        """inotifyを閉じる（全ての監視が解除される）"""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+@dataclass
+class _FolderState:
+    """監視フォルダの状態"""
+    dir_mtime_ns: Optional[int] = None          # 前回確認したフォルダ自体の更新時刻（ポーリング用）
+    snapshot: Optional[FolderSnapshot] = None   # 前回読み込んだ内容
+    changed_at: float = 0.0                     # 内容の変化を最後に検出した時刻
+    merged: Optional[FolderSnapshot] = None     # 最後に結合に成功した内容
+    failures: int = 0                           # 現在の内容で続けて結合に失敗した回数
+    retry_at: float = 0.0                       # 失敗後、次に結合を試みる時刻
+    wd: Optional[int] = None                    # inotifyの監視番号
+
+    @property
+    def pending(self) -> bool:
+        """結合していない変更があるか"""
+        return bool(self.snapshot) and self.snapshot != self.merged
+
+class PollResult(NamedTuple):
+    """poll_once()で結合処理に渡したフォルダ"""
+    merged: List[str]   # 結合に成功したフォルダ
+    failed: List[str]   # 結合に失敗したフォルダ（retry_seconds後から間隔を延ばしながら再試行する）
+
+class FolderWatcher:
+    """
+    監視ルート直下のフォルダを監視し、変更が落ち着いたフォルダを結合処理に渡す
+
+    各フォルダは内容（PDFのファイル名・サイズ・更新時刻）が quiet_seconds の間変化しなかった時点で
+    1回だけ結合処理に渡し、その後に内容が変わった場合は再度渡す。結合に失敗した場合（出力先に一時的に
+    書き込めないなど）は、内容が変わらなくても retry_seconds から倍々に延ばした間隔で再試行する。
+    poll_once() で1回分の確認を行い、run() は poll_interval ごとにそれを繰り返す。
+    """
+
+    def __init__(self, root: str, merge_folder: Callable[[str, List[str]], bool],
+                 quiet_seconds: float = 10.0, poll_interval: float = 2.0, use_inotify: bool = True,
+                 exclude: Iterable[str] = (), clock: Callable[[], float] = time.monotonic,
+                 retry_seconds: float = RETRY_SECONDS, max_retry_seconds: float = MAX_RETRY_SECONDS):
+        """
+        初期化
+
+        Args:
+            root (str): 監視ルート（直下の各フォルダを監視する）
+            merge_folder (Callable[[str, List[str]], bool]): 結合処理。フォルダパスと
+                自然順に並べたPDFファイルのパスを受け取り、成功した場合Trueを返す
+            quiet_seconds (float): 結合するまでにフォルダの変更が止まっている必要がある秒数
+            poll_interval (float): run() で確認する間隔（秒）
+            use_inotify (bool): Trueの場合、使える環境ではinotifyで変更を検出する
+            exclude (Iterable[str]): 監視しないフォルダ（監視ルート内の出力先など）
+            clock (Callable[[], float]): 現在時刻（秒）を返す関数
+            retry_seconds (float): 結合に失敗したフォルダを最初に再試行するまでの秒数
+            max_retry_seconds (float): 再試行の間隔の上限（秒）
+
+        Raises:
+            NotADirectoryError: 監視ルートがディレクトリでない場合
+            ValueError: quiet_secondsが負の場合
+        """
+        if not os.path.isdir(root):
+            raise NotADirectoryError(f"監視ルートがディレクトリではありません: {root}")
+        if quiet_seconds < 0:
+            raise ValueError(f"quiet_secondsには0以上を指定してください: {quiet_seconds}")
+
+        self.root = os.path.abspath(root)
+        self.merge_folder = merge_folder
+        self.quiet_seconds = quiet_seconds
+        self.poll_interval = poll_interval
+        self.exclude = {os.path.normcase(os.path.abspath(path)) for path in exclude}
+        self.clock = clock
+        self.retry_seconds = retry_seconds
+        self.max_retry_seconds = max_retry_seconds
+        self.folders: Dict[str, _FolderState] = {}
+        # 読み込んだフォルダの延べ数（変更のないフォルダを読み直していないことの確認用）
+        self.folders_scanned = 0
+
+        self._root_mtime_ns: Optional[int] = None
+        self._root_dirty = True
+        self._dirty: Set[str] = set()
+        self._wd_to_folder: Dict[int, str] = {}
+        self._root_wd: Optional[int] = None
+        self._inotify: Optional[_Inotify] = None
+        if use_inotify and sys.platform.startswith("linux"):
+            try:
+                self._inotify = _Inotify()
+                self._root_wd = self._inotify.add_watch(self.root, _Inotify.ROOT_MASK)
+            except (OSError, AttributeError) as e:
+                logger.warning(f"inotifyを使用できないためポーリングで監視します: {e}")
+                self._close_inotify()
+
+    @property
+    def mode(self) -> str:
+        """変更の検出方式（"inotify" または "polling"）"""
+        return "inotify" if self._inotify is not None else "polling"
+
+    def close(self) -> None:
+        """inotifyを閉じる"""
+        self._close_inotify()
+
+    def _close_inotify(self) -> None:
+        if self._inotify is not None:
+            self._inotify.close()
+        self._inotify = None
+        self._root_wd = None
+        self._wd_to_folder.clear()
+        for state in self.folders.values():
+            state.wd = None
+
+    def _fall_back_to_polling(self, error: OSError) -> None:
+        """inotifyの監視を追加できない場合（監視数の上限など）にポーリングへ切り替える"""
+        logger.warning(f"inotifyの監視を追加できないためポーリングに切り替えます: {error}")
+        self._close_inotify()
+        self._root_dirty = True
+        self._dirty.update(self.folders)
+
+    def _list_folders(self) -> Set[str]:
+        folders = set()
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") or not entry.is_dir():
+                    continue
+                if os.path.normcase(entry.path) in self.exclude:
+                    continue
+                folders.add(entry.path)
+        return folders
+
+    def _refresh_folders(self) -> None:
+        """監視ルート直下のフォルダの一覧を読み直し、追加・削除されたフォルダを反映"""
+        self._root_dirty = False
+        current = self._list_folders()
+        for folder in set(self.folders) - current:
+            state = self.folders.pop(folder)
+            self._dirty.discard(folder)
+            if state.wd is not None and self._inotify is not None:
+                self._wd_to_folder.pop(state.wd, None)
+                self._inotify.remove_watch(state.wd)
+            logger.info(f"監視フォルダが削除されました: {folder}")
+
+        for folder in sorted(current - set(self.folders)):
+            state = _FolderState()
+            self.folders[folder] = state
+            self._dirty.add(folder)
+            if self._inotify is not None:
+                try:
+                    state.wd = self._inotify.add_watch(folder, _Inotify.FOLDER_MASK)
+                except FileNotFoundError:
+                    continue
+                except OSError as e:
+                    self._fall_back_to_polling(e)
+                    continue
+                self._wd_to_folder[state.wd] = folder
+
+    def _collect_inotify_changes(self) -> None:
+        """inotifyのイベントから変更のあったフォルダを記録"""
+        for wd, mask in self._inotify.read_events():
+            if mask & _Inotify.IN_Q_OVERFLOW:
+                # イベントが溢れた場合はどのフォルダが変わったか分からないため全て読み直す
+                self._root_dirty = True
+                self._dirty.update(self.folders)
+            elif wd == self._root_wd:
+                self._root_dirty = True
+            elif wd in self._wd_to_folder:
+                if mask & (_Inotify.IN_DELETE_SELF | _Inotify.IN_MOVE_SELF | _Inotify.IN_IGNORED):
+                    self._root_dirty = True
+                self._dirty.add(self._wd_to_folder[wd])
+
+    def _collect_polling_changes(self) -> None:
+        """フォルダ自体の更新時刻を比較して変更のあったフォルダを記録"""
+        try:
+            root_mtime_ns = os.stat(self.root).st_mtime_ns
+        except FileNotFoundError:
+            root_mtime_ns = None
+        if root_mtime_ns != self._root_mtime_ns:
+            self._root_mtime_ns = root_mtime_ns
+            self._root_dirty = True
+
+        for folder, state in self.folders.items():
+            try:
+                mtime_ns = os.stat(folder).st_mtime_ns
+            except FileNotFoundError:
+                self._root_dirty = True
+                continue
+            # ファイルの追加・削除・名前の変更はフォルダの更新時刻で分かるが、既存のファイルへの
+            # 書き込みは分からないため、結合待ちのフォルダは毎回読み直して書き込みの完了を待つ
+            if mtime_ns != state.dir_mtime_ns or state.pending:
+                self._dirty.add(folder)
+
+    def poll_once(self) -> PollResult:
+        """
+        変更を確認し、変更が落ち着いたフォルダを結合処理に渡す
+
+        Returns:
+            PollResult: 結合に成功・失敗したフォルダ
+        """
+        if self._inotify is not None:
+            self._collect_inotify_changes()
+        else:
+            self._collect_polling_changes()
+        if self._root_dirty:
+            self._refresh_folders()
+
+        now = self.clock()
+        dirty, self._dirty = self._dirty, set()
+        for folder in dirty:
+            state = self.folders.get(folder)
+            if state is None:
+                continue
+            try:
+                if self._inotify is None:
+                    # 読み込み中の変更を次回検出できるよう、更新時刻は読み込む前に記録する
+                    state.dir_mtime_ns = os.stat(folder).st_mtime_ns
+                snapshot = scan_folder(folder)
+            except (FileNotFoundError, NotADirectoryError):
+                self._root_dirty = True
+                continue
+            except OSError as e:
+                logger.warning(f"フォルダを読み込めません: {folder}, エラー: {e}")
+                continue
+            self.folders_scanned += 1
+            if snapshot != state.snapshot:
+                state.snapshot = snapshot
+                state.changed_at = now
+                # 内容が変わった場合は失敗の回数を数え直し、変更が落ち着いた時点で結合する
+                state.failures = 0
+                state.retry_at = 0.0
+
+        ready = [folder for folder, state in self.folders.items()
+                 if state.pending and now - state.changed_at >= self.quiet_seconds and now >= state.retry_at]
+        result = PollResult([], [])
+        for folder in sorted(ready, key=natural_sort_key):
+            if self._merge(folder, self.folders[folder], now):
+                result.merged.append(folder)
+            else:
+                result.failed.append(folder)
+        return result
+
+    def _merge(self, folder: str, state: _FolderState, now: float) -> bool:
+        snapshot = state.snapshot
+        pdf_files = [os.path.join(folder, name) for name in sorted(snapshot, key=natural_sort_key)]
+        try:
+            success = self.merge_folder(folder, pdf_files)
+            error = ""
+        except Exception as e:
+            success = False
+            error = f", エラー: {e}"
+
+        if success:
+            state.merged = snapshot
+            state.failures = 0
+            state.retry_at = 0.0
+            return True
+
+        state.failures += 1
+        delay = min(self.max_retry_seconds, self.retry_seconds * 2 ** min(state.failures - 1, 32))
+        state.retry_at = now + delay
+        logger.error(f"フォルダの結合に失敗しました（{delay:.0f}秒後に再試行）: {folder}{error}")
+        return False
+
+    def run(self, stop_event: Optional[threading.Event] = None) -> None:
+        """
+        stop_eventが設定されるまで poll_interval ごとに poll_once() を繰り返す
+
+        Args:
+            stop_event (Optional[threading.Event]): 終了を指示するイベント（Noneの場合は中断されるまで続ける）
+        """
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            self.poll_once()
+            stop_event.wait(self.poll_interval)
@@ -0,0 +1,204 @@
+"""
+画像ダウンサンプリングモジュール
+スキャン文書などに埋め込まれた高解像度のラスター画像を、目標解像度のJPEGに再エンコードする
+（Pillowでの再エンコードはプロセスプールで画像ごとに並列実行する）
+"""
+
+import zlib
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from pypdf.generic import ArrayObject, NameObject, NumberObject, StreamObject
+
+# 再エンコードできる色空間と成分数
+_COLOR_SPACES = {"/DeviceGray": 1, "/DeviceRGB": 3}
+
+@dataclass(frozen=True)
+class ImageDownsampleOptions:
+    """画像の再エンコード設定"""
+    target_dpi: Optional[int] = 150         # これを超える解像度の画像を縮小する（Noneの場合は縮小しない）
+    max_image_bytes: Optional[int] = None   # これを超えるサイズの画像は解像度に関わらず再エンコードする
+    jpeg_quality: int = 75                  # JPEGの品質（1〜95）
+    grayscale: bool = False                 # 再エンコードする画像をグレースケールにする
+    max_workers: Optional[int] = None       # 再エンコードのワーカープロセス数（1の場合は同一プロセスで実行）
+
+@dataclass
+class ImageStats:
+    """入力1件分の画像再エンコードの結果"""
+    file_path: str
+    images_found: int = 0       # 再エンコードの対象となった画像数
+    images_reencoded: int = 0   # 再エンコードで小さくなり置き換えた画像数
+    bytes_before: int = 0       # 対象画像の元のサイズの合計
+    bytes_after: int = 0        # 対象画像の処理後のサイズの合計
+
+    @property
+    def bytes_saved(self) -> int:
+        """削減したバイト数"""
+        return self.bytes_before - self.bytes_after
+
+class ImageJob(NamedTuple):
+    """ワーカープロセスに渡す画像1件分の再エンコード依頼"""
+    data: bytes
+    filter: Optional[str]   # '/DCTDecode'、'/FlateDecode'、またはNone（未圧縮）
+    width: int
+    height: int
+    components: int         # 1: グレースケール / 3: RGB
+    scale: float            # 縮小率（1.0の場合は解像度を変えない）
+    jpeg_quality: int
+    grayscale: bool
+
+def reencode_image(job: ImageJob) -> Optional[Tuple[bytes, int, int, int]]:
+    """
+    画像を縮小してJPEGに再エンコード（ProcessPoolExecutorから呼ばれるためモジュールレベルに定義）
+
+    Args:
+        job (ImageJob): 再エンコード依頼
+
+    Returns:
+        Optional[Tuple[bytes, int, int, int]]: (JPEGデータ, 幅, 高さ, 成分数)。
+            元より小さくならない場合・デコードできない場合はNone
+    """
+    from PIL import Image
+
+    mode = "L" if job.components == 1 else "RGB"
+    width = max(1, round(job.width * job.scale))
+    height = max(1, round(job.height * job.scale))
+
+    try:
+        if job.filter == "/DCTDecode":
+            image = Image.open(BytesIO(job.data))
+            # JPEGはデコード時にDCT領域で縮小できるため、目標サイズ以上の範囲で先に縮小しておく
+            image.draft(mode, (width, height))
+        else:
+            raw = zlib.decompress(job.data) if job.filter == "/FlateDecode" else job.data
+            image = Image.frombytes(mode, (job.width, job.height), raw)
+
+        target_mode = "L" if job.grayscale else mode
+        if image.mode != target_mode:
+            image = image.convert(target_mode)
+        if image.size != (width, height):
+            image = image.resize((width, height), Image.LANCZOS)
+
+        output = BytesIO()
+        image.save(output, format="JPEG", quality=job.jpeg_quality, optimize=True)
+    except Exception:
+        return None
+
+    data = output.getvalue()
+    if len(data) >= len(job.data):
+        return None
+    return data, width, height, 1 if target_mode == "L" else 3
+
+def _image_job(image: StreamObject, dpi: float, options: ImageDownsampleOptions) -> Optional[ImageJob]:
+    """再エンコードの対象であれば依頼を作成（マスク・特殊な色空間などは対象外）"""
+    if image.get("/ImageMask") or "/Mask" in image or "/Decode" in image:
+        return None
+    if image.get("/BitsPerComponent") != 8:
+        return None
+
+    color_space = image.get("/ColorSpace")
+    if isinstance(color_space, ArrayObject) and len(color_space) == 2 and color_space[0] == "/ICCBased":
+        components = color_space[1].get_object().get("/N")
+    else:
+        components = _COLOR_SPACES.get(color_space)
+    if components not in (1, 3):
+        return None
+
+    filters = image.get("/Filter")
+    if isinstance(filters, ArrayObject) and len(filters) == 1:
+        filters = filters[0]
+    if filters not in (None, "/FlateDecode", "/DCTDecode"):
+        return None
+    decode_parms = image.get("/DecodeParms")
+    if filters == "/FlateDecode" and decode_parms and decode_parms.get_object().get("/Predictor", 1) > 1:
+        return None
+
+    data = image._data
+    scale = 1.0
+    if options.target_dpi and dpi > options.target_dpi:
+        scale = options.target_dpi / dpi
+    elif options.max_image_bytes is None or len(data) <= options.max_image_bytes:
+        return None
+
+    return ImageJob(data, filters, int(image["/Width"]), int(image["/Height"]), components,
+                    scale, options.jpeg_quality, options.grayscale)
+
+def _page_images(pages) -> Iterable[Tuple[StreamObject, float]]:
+    """
+    ページのリソースから画像XObjectと実効解像度を列挙（複数ページで共有される画像は1回のみ）
+
+    画像の描画サイズはコンテンツストリームを解析しないと分からないため、
+    スキャン文書を想定してページ全体に描画されるとみなした解像度を使う（小さく描画される画像は縮小しすぎない側に倒れる）
+    """
+    seen = set()
+    for page in pages:
+        resources = page.get("/Resources")
+        xobjects = resources.get_object().get("/XObject") if resources else None
+        if not xobjects:
+            continue
+        xobjects = xobjects.get_object()
+
+        box = page.mediabox
+        page_width = max(float(box.width), 1.0) / 72
+        page_height = max(float(box.height), 1.0) / 72
+
+        for name in xobjects:
+            image = xobjects[name].get_object()
+            if not isinstance(image, StreamObject) or image.get("/Subtype") != "/Image" or id(image) in seen:
+                continue
+            seen.add(id(image))
+            dpi = max(int(image["/Width"]) / page_width, int(image["/Height"]) / page_height)
+            yield image, dpi
+
+def downsample_images(file_path: str, pages, options: ImageDownsampleOptions,
+                      executor: Optional[Executor] = None) -> ImageStats:
+    """
+    入力のページが参照する画像を再エンコードし、readerが保持する画像オブジェクトを置き換える
+
+    置き換えはreader内のオブジェクトに対して行うため、入力ファイル自体は変更しない
+
+    Args:
+        file_path (str): 入力ファイルパス（結果の識別用）
+        pages: 入力のページ（PdfReader.pages）
+        options (ImageDownsampleOptions): 再エンコード設定
+        executor (Optional[Executor]): 再エンコードを実行するプロセスプール（Noneの場合は同一プロセスで実行）
+
+    Returns:
+        ImageStats: 入力1件分の結果
+    """
+    stats = ImageStats(file_path)
+    targets: List[Tuple[StreamObject, ImageJob]] = []
+    for image, dpi in _page_images(pages):
+        job = _image_job(image, dpi, options)
+        if job is not None:
+            targets.append((image, job))
+
+    jobs = [job for _, job in targets]
+    results = executor.map(reencode_image, jobs) if executor is not None else map(reencode_image, jobs)
+
+    for (image, job), result in zip(targets, results):
+        stats.images_found += 1
+        stats.bytes_before += len(job.data)
+        if result is None:
+            stats.bytes_after += len(job.data)
+            continue
+
+        data, width, height, components = result
+        image._data = data
+        if hasattr(image, "decoded_self"):
+            image.decoded_self = None
+        for key in ("/DecodeParms", "/Length"):
+            if key in image:
+                del image[key]
+        image[NameObject("/Filter")] = NameObject("/DCTDecode")
+        image[NameObject("/Width")] = NumberObject(width)
+        image[NameObject("/Height")] = NumberObject(height)
+        image[NameObject("/BitsPerComponent")] = NumberObject(8)
+        image[NameObject("/ColorSpace")] = NameObject("/DeviceGray" if components == 1 else "/DeviceRGB")
+
+        stats.images_reencoded += 1
+        stats.bytes_after += len(data)
+
+    return stats
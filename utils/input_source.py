@@ -0,0 +1,99 @@
+"""
+入力ソースモジュール
+PdfReaderに渡す入力ファイルのストリームを、メモリマップ（既定）またはバッファ付きファイルで提供する
+（メモリマップでは読み込みのたびのseek/readシステムコールがページフォールトに置き換わる）
+
+コピーせずに参照できるのは、メモリマップを直接読む簡易解析（utils.pdf_probe）だけで、
+相互参照ストリーム・オブジェクトストリームの内容をメモリマップのmemoryviewのスライスとして展開する。
+PdfReaderはread()で読んだ内容を毎回新しいbytesにコピーするため、結合・検証の読み込みはゼロコピーにならない
+"""
+
+import mmap
+import os
+import logging
+from typing import BinaryIO, Union
+
+logger = logging.getLogger(__name__)
+
+class InputSource:
+    """
+    1つの入力ファイルの読み込み元
+
+    streamはread/seek/tellを持つファイルライクオブジェクトで、そのままPdfReaderに渡せる。
+    メモリマップできないファイル（空のファイル、特殊なファイルシステム上のファイルなど）や
+    use_mmap=Falseの場合はバッファ付きファイルを使う。
+    メモリマップ中にファイルが切り詰められると読み込み時にプロセスが異常終了するため、
+    結合中に入力を書き換えない前提で使う
+    """
+
+    def __init__(self, file_path: str, use_mmap: bool = True, prefetch: bool = False):
+        """
+        Args:
+            file_path (str): 入力ファイルパス
+            use_mmap (bool): Trueの場合、メモリマップを試みる
+            prefetch (bool): Trueの場合、ファイル全体の先読みをカーネルに依頼する
+                （全ページを読む結合時に、低速なディスク上のファイルの読み込み待ちを減らす）
+        """
+        self.file_path = file_path
+        self._file = open(file_path, 'rb')
+        self._map = None
+
+        if use_mmap:
+            try:
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError) as e:
+                logger.debug(f"メモリマップできないため通常の読み込みを使用: {file_path}, 理由: {e}")
+
+        if self._map is not None and prefetch and hasattr(self._map, "madvise"):
+            try:
+                self._map.madvise(mmap.MADV_WILLNEED)
+            except (AttributeError, OSError):
+                pass
+
+    @property
+    def is_mapped(self) -> bool:
+        """メモリマップで読み込んでいるか"""
+        return self._map is not None
+
+    @property
+    def size(self) -> int:
+        """ファイルサイズ（バイト）"""
+        if self._map is not None:
+            return len(self._map)
+        return os.fstat(self.stream.fileno()).st_size
+
+    @property
+    def stream(self) -> Union[mmap.mmap, BinaryIO]:
+        """PdfReaderに渡すストリーム"""
+        if self._file is None:
+            raise ValueError(f"入力ソースは閉じられています: {self.file_path}")
+        return self._map if self._map is not None else self._file
+
+    def close(self) -> None:
+        """メモリマップとファイルを閉じる"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def open_input(file_path: str, use_mmap: bool = True, prefetch: bool = False) -> InputSource:
+    """
+    入力ファイルを開く
+
+    Args:
+        file_path (str): 入力ファイルパス
+        use_mmap (bool): Trueの場合、メモリマップを試みる（失敗時はバッファ付きファイル）
+        prefetch (bool): Trueの場合、ファイル全体の先読みをカーネルに依頼する
+
+    Returns:
+        InputSource: 入力ソース（呼び出し側でcloseする）
+    """
+    return InputSource(file_path, use_mmap=use_mmap, prefetch=prefetch)
@@ -0,0 +1,248 @@
+"""
+結合処理の計測モジュール
+フェーズごとの所要時間・入出力のバイト数・ピークメモリをMergeStatsに集計し、
+フック（MergeHooks）を通じてJSON Lines出力・cProfile・tracemallocなどへ渡す
+"""
+
+import cProfile
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import IO, Dict, Iterator, List, Optional, Union
+import logging
+
+try:
+    import resource
+except ImportError:  # Windowsにはresourceモジュールがない
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# 計測するフェーズ
+#   open:      入力ファイルを開く（メモリマップ）
+#   parse:     入力の解析（相互参照表・ページツリー）
+#   images:    画像の再エンコード
+#   copy:      ページのコピー（逐次書き出しではページのオブジェクトの書き出しを含む）
+#   dedup:     同一内容のストリームの共有（一括書き出しのみ。逐次書き出しではcopyに含まれる）
+#   metadata:  文書情報の更新
+#   serialize: 出力ファイルへの書き出し
+PHASES = ("open", "parse", "images", "copy", "dedup", "metadata", "serialize")
+
+@dataclass
+class MergeStats:
+    """1回の結合処理の計測結果"""
+    output_path: str
+    input_count: int = 0
+    page_count: int = 0
+    bytes_read: int = 0                   # 開いた入力ファイルのサイズの合計
+    bytes_written: int = 0                # 出力へ書き出したバイト数（増分結合では追記した分のみ）
+    elapsed: float = 0.0                  # 結合全体の経過時間（秒）
+    # フェーズごとの所要時間の合計（秒）。先読みのスレッドで並行して処理した時間も合計するため、
+    # 合計がelapsedを超えることがある。一時ファイルの同期・置き換えはどのフェーズにも含まない
+    phases: Dict[str, float] = field(default_factory=dict)
+    peak_rss: Optional[int] = None        # 結合終了時点のプロセスの最大常駐メモリ（バイト、取得できない場合None）
+    peak_traced: Optional[int] = None     # tracemallocで計測した結合中のピーク（トレース中の場合のみ、バイト）
+    error: Optional[str] = None           # 失敗・キャンセルした場合のエラー
+
+    def to_dict(self) -> dict:
+        """JSONに変換できる辞書"""
+        return asdict(self)
+
+class MergeHooks:
+    """
+    計測フックの基底クラス（必要なメソッドだけをオーバーライドする）
+
+    フックは結合処理のスレッドで呼ばれる。ただしon_phaseは先読み（read_ahead）を使う場合、
+    先読みのスレッドからも呼ばれる
+    """
+
+    def on_merge_start(self, output_path: str, input_count: int) -> None:
+        """結合の開始時に呼ばれる"""
+
+    def on_phase(self, phase: str, elapsed: float, file_path: Optional[str]) -> None:
+        """
+        フェーズの終了ごとに呼ばれる
+
+        Args:
+            phase (str): フェーズ名（PHASESのいずれか）
+            elapsed (float): 所要時間（秒）
+            file_path (Optional[str]): 処理した入力ファイル（入力に依らないフェーズではNone）
+        """
+
+    def on_merge_end(self, stats: MergeStats) -> None:
+        """結合の終了時（失敗・キャンセルを含む）に呼ばれる"""
+
+class JsonLinesHook(MergeHooks):
+    """
+    計測結果をJSON Lines形式で出力するフック
+
+    結合ごとに {"event": "merge", ...MergeStats} を1行出力する。
+    phase_events=Trueの場合はフェーズの終了ごとに {"event": "phase", ...} も出力する
+    """
+
+    def __init__(self, target: Union[str, IO[str]], phase_events: bool = False):
+        """
+        Args:
+            target (str | IO[str]): 出力先のファイルパス（追記）、またはテキストストリーム。"-" は標準出力
+            phase_events (bool): Trueの場合フェーズごとの行も出力する
+        """
+        self.target = target
+        self.phase_events = phase_events
+        self._lock = threading.Lock()
+
+    def on_phase(self, phase: str, elapsed: float, file_path: Optional[str]) -> None:
+        if self.phase_events:
+            self._write({'event': 'phase', 'phase': phase, 'elapsed': elapsed, 'file_path': file_path})
+
+    def on_merge_end(self, stats: MergeStats) -> None:
+        self._write({'event': 'merge', **stats.to_dict()})
+
+    def _write(self, record: dict) -> None:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            if self.target == "-":
+                sys.stdout.write(line)
+                sys.stdout.flush()
+            elif isinstance(self.target, str):
+                with open(self.target, 'a', encoding='utf-8') as file:
+                    file.write(line)
+            else:
+                self.target.write(line)
+                self.target.flush()
+
+class CProfileHook(MergeHooks):
+    """
+    結合処理をcProfileでプロファイルするフック
+
+    プロファイルするのは結合処理のスレッドのみ（先読み・画像の再エンコードのワーカーは対象外）。
+    結果はprofileに蓄積され、output_pathを指定した場合は結合ごとにpstats形式で保存する
+    """
+
+    def __init__(self, output_path: Optional[str] = None):
+        """
+        Args:
+            output_path (Optional[str]): プロファイル結果の保存先（pstats形式、結合ごとに上書き）
+        """
+        self.output_path = output_path
+        self.profile = cProfile.Profile()
+
+    def on_merge_start(self, output_path: str, input_count: int) -> None:
+        self.profile.enable()
+
+    def on_merge_end(self, stats: MergeStats) -> None:
+        self.profile.disable()
+        if self.output_path:
+            self.profile.dump_stats(self.output_path)
+
+class TracemallocHook(MergeHooks):
+    """
+    結合中にtracemallocでメモリ割り当てを追跡するフック
+
+    有効にするとMergeStats.peak_tracedに結合中のピークが記録され、結合終了時のスナップショットが
+    snapshotに残る。追跡中は割り当てが大幅に遅くなるため、計測時のみ使用する
+    """
+
+    def __init__(self, frames: int = 1):
+        """
+        Args:
+            frames (int): 割り当てごとに記録するスタックフレーム数
+        """
+        self.frames = frames
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self._started = False
+
+    def on_merge_start(self, output_path: str, input_count: int) -> None:
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start(self.frames)
+
+    def on_merge_end(self, stats: MergeStats) -> None:
+        if tracemalloc.is_tracing():
+            self.snapshot = tracemalloc.take_snapshot()
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+def peak_rss() -> Optional[int]:
+    """プロセスの最大常駐メモリ（バイト）。取得できないOSではNone"""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOSはバイト単位、Linuxなどはキロバイト単位
+    return usage if sys.platform == "darwin" else usage * 1024
+
+class StatsRecorder:
+    """
+    結合処理の計測値を集計し、フックへ通知する
+
+    phase()は複数のスレッドから同時に呼んでもよい
+    """
+
+    def __init__(self, output_path: str = "", input_count: int = 0, hooks: Optional[List[MergeHooks]] = None):
+        self.stats = MergeStats(output_path=output_path, input_count=input_count)
+        self.hooks = list(hooks or [])
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+
+    def start(self) -> None:
+        """結合の開始をフックへ通知し、計測を始める"""
+        for hook in self.hooks:
+            hook.on_merge_start(self.stats.output_path, self.stats.input_count)
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str, file_path: Optional[str] = None) -> Iterator[None]:
+        """
+        withブロックの所要時間をフェーズの時間に加算する
+
+        Args:
+            name (str): フェーズ名（PHASESのいずれか）
+            file_path (Optional[str]): 処理する入力ファイル
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.stats.phases[name] = self.stats.phases.get(name, 0.0) + elapsed
+            for hook in self.hooks:
+                hook.on_phase(name, elapsed, file_path)
+
+    def add_bytes_read(self, size: int) -> None:
+        with self._lock:
+            self.stats.bytes_read += size
+
+    def finish(self, page_count: int, bytes_written: int, error: Optional[str] = None) -> MergeStats:
+        """
+        計測を終えてフックへ通知する
+
+        Args:
+            page_count (int): 出力の総ページ数
+            bytes_written (int): 出力へ書き出したバイト数
+            error (Optional[str]): 失敗・キャンセルした場合のエラー
+
+        Returns:
+            MergeStats: 計測結果
+        """
+        stats = self.stats
+        stats.elapsed = time.perf_counter() - self._start
+        stats.page_count = page_count
+        stats.bytes_written = bytes_written
+        stats.error = error
+        stats.peak_rss = peak_rss()
+        if tracemalloc.is_tracing():
+            stats.peak_traced = tracemalloc.get_traced_memory()[1]
+
+        for hook in self.hooks:
+            try:
+                hook.on_merge_end(stats)
+            except Exception as e:
+                logger.warning(f"計測フックの実行に失敗: {type(hook).__name__}, エラー: {e}")
+        return stats
@@ -0,0 +1,165 @@
+"""
+結合マニフェストモジュール
+結合結果の隣に入力のフィンガープリント（パス・ページ範囲・サイズ・更新時刻・内容ハッシュ）を記録し、
+次回の結合で既存の入力が変わっていない先頭部分かを判定する（増分結合用）
+"""
+
+import hashlib
+import json
+import os
+from typing import List, Optional, Union
+import logging
+
+from utils.atomic_output import DEFAULT_FSYNC, atomic_output
+from utils.checkpoint import file_fingerprint
+from utils.page_range import PageSelection
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+MANIFEST_SUFFIX = ".merge.json"
+
+# 内容ハッシュを計算する際の読み込み単位
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+def manifest_path(output_path: str) -> str:
+    """結合結果に対応するマニフェストのパス（<出力ファイル名>.merge.json）"""
+    return str(output_path) + MANIFEST_SUFFIX
+
+def file_digest(file_path: str) -> str:
+    """
+    ファイル全体の内容ハッシュ
+
+    Args:
+        file_path (str): ファイルパス
+
+    Returns:
+        str: BLAKE2bの16進ダイジェスト
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with open(file_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class MergeManifest:
+    """
+    結合結果のマニフェスト
+
+    入力ごとの [絶対パス, ページ範囲, サイズ, 更新時刻, 内容ハッシュ] と、
+    出力内容に影響する設定のキー・出力ファイルのフィンガープリント・総ページ数を保持する。
+    入力の変更はまずサイズと更新時刻で判定し、異なる場合のみ内容ハッシュを計算して比較する
+    （更新時刻だけが変わったファイルは変更なしとみなす）
+    """
+
+    def __init__(self, inputs: List[list], options: str, output: List[int], page_count: int):
+        self.inputs = inputs
+        self.options = options
+        self.output = output
+        self.page_count = page_count
+
+    @classmethod
+    def load(cls, output_path: str) -> Optional["MergeManifest"]:
+        """
+        結合結果のマニフェストを読み込む
+
+        Args:
+            output_path (str): 結合結果のファイルパス
+
+        Returns:
+            Optional[MergeManifest]: マニフェスト（存在しない・読み込めない場合None）
+        """
+        try:
+            with open(manifest_path(output_path), 'r', encoding='utf-8') as file:
+                data = json.load(file)
+            if data.get('version') != MANIFEST_VERSION:
+                return None
+            return cls(data['inputs'], data['options'], data['output'], data['page_count'])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            logger.warning(f"結合マニフェストを読み込めません: {manifest_path(output_path)}, 理由: {e}")
+            return None
+
+    @classmethod
+    def record(cls, pdf_files: List[Union[str, PageSelection]], output_path: str, options: str,
+               page_count: int, previous: Optional["MergeManifest"] = None) -> "MergeManifest":
+        """
+        結合直後の入力・出力の状態からマニフェストを作成
+
+        Args:
+            pdf_files (List[str | PageSelection]): 結合した入力ファイルのリスト
+            output_path (str): 結合結果のファイルパス
+            options (str): 出力内容に影響する設定のキー
+            page_count (int): 結合結果の総ページ数
+            previous (Optional[MergeManifest]): 前回のマニフェスト（変更のない入力は内容ハッシュを再計算しない）
+
+        Returns:
+            MergeManifest: マニフェスト
+        """
+        known = {}
+        if previous is not None:
+            known = {(entry[0], entry[1], entry[2], entry[3]): entry[4] for entry in previous.inputs}
+
+        inputs = []
+        for item in pdf_files:
+            selection = item if isinstance(item, PageSelection) else PageSelection(item)
+            file_path = os.path.abspath(selection.file_path)
+            size, mtime_ns = file_fingerprint(file_path)
+            digest = known.get((file_path, selection.pages, size, mtime_ns)) or file_digest(file_path)
+            inputs.append([file_path, selection.pages, size, mtime_ns, digest])
+
+        return cls(inputs, options, file_fingerprint(output_path), page_count)
+
+    def save(self, output_path: str, fsync: str = DEFAULT_FSYNC) -> None:
+        """
+        マニフェストを結合結果の隣に保存
+
+        Args:
+            output_path (str): 結合結果のファイルパス
+            fsync (str): fsyncの方針（none / file / file+dir）
+        """
+        data = {
+            'version': MANIFEST_VERSION,
+            'options': self.options,
+            'output': self.output,
+            'page_count': self.page_count,
+            'inputs': self.inputs
+        }
+        with atomic_output(manifest_path(output_path), fsync) as file:
+            file.write(json.dumps(data, ensure_ascii=False, indent=1).encode('utf-8'))
+
+    def prefix_mismatch(self, pdf_files: List[Union[str, PageSelection]], output_path: str,
+                        options: str) -> Optional[str]:
+        """
+        記録した入力が、今回の入力の変更のない先頭部分かを判定
+
+        Args:
+            pdf_files (List[str | PageSelection]): 今回の入力ファイルのリスト
+            output_path (str): 結合結果のファイルパス
+            options (str): 今回の出力内容に影響する設定のキー
+
+        Returns:
+            Optional[str]: 先頭部分でない場合はその理由、先頭部分の場合None
+        """
+        if options != self.options:
+            return "出力設定が変更されています"
+        try:
+            if file_fingerprint(output_path) != self.output:
+                return "前回の結合後に出力ファイルが変更されています"
+        except OSError:
+            return "出力ファイルがありません"
+        if len(pdf_files) < len(self.inputs):
+            return "入力ファイルが減っています"
+
+        for item, entry in zip(pdf_files, self.inputs):
+            selection = item if isinstance(item, PageSelection) else PageSelection(item)
+            file_path = os.path.abspath(selection.file_path)
+            if [file_path, selection.pages] != entry[:2]:
+                return f"入力の順序またはページ範囲が変更されています: {selection}"
+            try:
+                if file_fingerprint(file_path) != entry[2:4] and file_digest(file_path) != entry[4]:
+                    return f"入力ファイルが変更されています: {selection.file_path}"
+            except OSError:
+                return f"入力ファイルがありません: {selection.file_path}"
+        return None
@@ -0,0 +1,69 @@
+"""
+出力プロファイルモジュール
+書き出し速度と出力サイズのどちらを優先するかを、圧縮・オブジェクトストリーム等の設定の組として定義する
+（pypdfに依存しないため、CLIの引数定義でも読み込める）
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Union
+
+@dataclass(frozen=True)
+class OutputProfile:
+    """出力ファイルの書き出し設定"""
+    name: str
+    description: str
+    compress_level: Optional[int] = None   # 未圧縮ストリームをFlate圧縮するレベル（Noneの場合は圧縮しない）
+    recompress: bool = False               # Flate圧縮済みのストリームもcompress_levelで圧縮し直す
+    object_streams: bool = False           # ストリーム以外のオブジェクトをオブジェクトストリームにまとめる
+    deduplicate: bool = False              # 入力間で同一内容のストリームを1つにまとめる
+
+    @property
+    def rewrites_output(self) -> bool:
+        """pypdfの書き出しでは対応できない変換を含むか（StreamingPdfWriterで書き出す必要がある）"""
+        return self.compress_level is not None or self.object_streams
+
+OUTPUT_PROFILES: Dict[str, OutputProfile] = {
+    profile.name: profile for profile in (
+        OutputProfile(
+            name="fast",
+            description="再圧縮なし（書き出しが最も速い）"
+        ),
+        OutputProfile(
+            name="compact",
+            description="未圧縮ストリームの圧縮・オブジェクトストリーム・未使用オブジェクトの削除",
+            compress_level=6,
+            object_streams=True
+        ),
+        OutputProfile(
+            name="archive",
+            description="最大圧縮・圧縮済みストリームの再圧縮・重複リソースの共有（サイズが最も小さい）",
+            compress_level=9,
+            recompress=True,
+            object_streams=True,
+            deduplicate=True
+        ),
+    )
+}
+
+DEFAULT_PROFILE = "fast"
+
+def get_output_profile(profile: Union[str, OutputProfile]) -> OutputProfile:
+    """
+    名前から出力プロファイルを取得
+
+    Args:
+        profile (str | OutputProfile): プロファイル名（fast / compact / archive）またはプロファイル
+
+    Returns:
+        OutputProfile: 出力プロファイル
+
+    Raises:
+        ValueError: 未知のプロファイル名の場合
+    """
+    if isinstance(profile, OutputProfile):
+        return profile
+    try:
+        return OUTPUT_PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"未知の出力プロファイルです: {profile} "
+                         f"(指定可能: {', '.join(OUTPUT_PROFILES)})") from None
@@ -0,0 +1,105 @@
+"""
+分割出力モジュール
+結合結果をページ数・推定バイト数の上限ごとに複数の出力ファイル（out_001.pdf, out_002.pdf, …）に分ける
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+@dataclass(frozen=True)
+class SplitOptions:
+    """分割出力の設定"""
+    max_pages: Optional[int] = None     # 1ファイルあたりの最大ページ数
+    max_bytes: Optional[int] = None     # 1ファイルあたりの推定バイト数の上限
+    file_boundaries: bool = False       # Trueの場合、入力ファイルの途中では分割しない
+
+    def __post_init__(self):
+        if self.max_pages is None and self.max_bytes is None:
+            raise ValueError("max_pagesとmax_bytesのいずれかを指定してください")
+        for name in ("max_pages", "max_bytes"):
+            value = getattr(self, name)
+            if value is not None and value < 1:
+                raise ValueError(f"{name}には1以上を指定してください: {value}")
+
+    def exceeds(self, page_count: int, size: float) -> bool:
+        """
+        ページ数・推定バイト数が上限を超えるか
+
+        Args:
+            page_count (int): 出力ファイルのページ数
+            size (float): 出力ファイルの推定バイト数
+
+        Returns:
+            bool: いずれかの上限を超える場合True
+        """
+        return ((self.max_pages is not None and page_count > self.max_pages)
+                or (self.max_bytes is not None and size > self.max_bytes))
+
+    def plan(self, indices: Sequence[int], page_bytes: float,
+             shard_pages: int, shard_bytes: float) -> List[List[int]]:
+        """
+        入力1件の結合するページを出力ファイルごとに振り分ける
+
+        1ページ（file_boundariesの場合は入力1件）だけで上限を超える場合も、空の出力ファイルは作らず
+        そのページを1つの出力ファイルに入れる
+
+        Args:
+            indices (Sequence[int]): 結合するページ番号（0始まり、順序通り）
+            page_bytes (float): 1ページあたりの推定バイト数
+            shard_pages (int): 現在の出力ファイルに追加済みのページ数
+            shard_bytes (float): 現在の出力ファイルの推定バイト数
+
+        Returns:
+            List[List[int]]: 先頭は現在の出力ファイルに追加するページ（空の場合は入力の前で切り替える）、
+                2番目以降は新しい出力ファイルを開始してから追加するページ
+        """
+        if self.file_boundaries:
+            if shard_pages and self.exceeds(shard_pages + len(indices), shard_bytes + page_bytes * len(indices)):
+                return [[], list(indices)]
+            return [list(indices)]
+
+        chunks: List[List[int]] = [[]]
+        for index in indices:
+            if shard_pages and self.exceeds(shard_pages + 1, shard_bytes + page_bytes):
+                chunks.append([])
+                shard_pages = 0
+                shard_bytes = 0.0
+            chunks[-1].append(index)
+            shard_pages += 1
+            shard_bytes += page_bytes
+        return chunks
+
+def split_output_path(output_path: str, number: int) -> str:
+    """
+    分割した出力ファイルのパス（out.pdf の1番目は out_001.pdf）
+
+    Args:
+        output_path (str): 分割前の出力ファイルパス
+        number (int): 出力ファイルの番号（1始まり）
+
+    Returns:
+        str: 分割した出力ファイルのパス
+    """
+    output = Path(output_path)
+    return str(output.with_name(f"{output.stem}_{number:03d}{output.suffix}"))
+
+def stale_split_outputs(output_path: str, count: int) -> List[str]:
+    """
+    前回の分割出力のうち、今回の出力ファイル数を超える番号のファイル
+
+    番号が連続して存在する範囲だけを返す（今回 count 件の場合は count+1 番から）
+
+    Args:
+        output_path (str): 分割前の出力ファイルパス
+        count (int): 今回の出力ファイル数
+
+    Returns:
+        List[str]: 残っている古い出力ファイルのパス
+    """
+    stale = []
+    number = count + 1
+    while Path(split_output_path(output_path, number)).exists():
+        stale.append(split_output_path(output_path, number))
+        number += 1
+    return stale
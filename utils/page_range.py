@@ -0,0 +1,132 @@
+"""
+ページ範囲指定モジュール
+"a.pdf:1-3,7" や "b.pdf:-1" のような入力指定を解釈し、結合するページを選択する
+（pypdfに依存しないため、CLIやGUIの入力検証でも読み込める）
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Tuple, Union
+
+# 1項目: "7"（7ページ目）、"-1"（最終ページ）、"1-3"、"5-"（5ページ目から最後まで）、"2--1" など
+_ITEM_PATTERN = r"\s*-?\d+(?:-(?:-?\d+)?)?\s*"
+_RANGES_RE = re.compile(rf"^{_ITEM_PATTERN}(?:,{_ITEM_PATTERN})*$")
+_ITEM_RE = re.compile(r"^(-?\d+)(?:(-)(-?\d+)?)?$")
+_DRIVE_RE = re.compile(r"^[A-Za-z]$")
+
+class PageRangeError(ValueError):
+    """ページ範囲の指定が不正な場合の例外"""
+    pass
+
+@dataclass
+class PageSelection:
+    """結合する入力ファイルと、そのうち結合するページの範囲"""
+    file_path: str
+    pages: Optional[str] = None   # "1-3,7" 形式の範囲（Noneの場合は全ページ）
+
+    def __str__(self) -> str:
+        return f"{self.file_path}:{self.pages}" if self.pages else self.file_path
+
+    def resolve(self, page_count: int) -> List[int]:
+        """
+        結合するページの番号を取得
+
+        Args:
+            page_count (int): 入力ファイルの総ページ数
+
+        Returns:
+            List[int]: 0始まりのページ番号のリスト（指定順序どおり）
+
+        Raises:
+            PageRangeError: 範囲の書式が不正、またはページ数を超える場合
+        """
+        if not self.pages:
+            return list(range(page_count))
+        return resolve_page_ranges(self.pages, page_count)
+
+def is_page_ranges(text: str) -> bool:
+    """
+    文字列がページ範囲の書式かチェック
+
+    Args:
+        text (str): "1-3,7" 形式の文字列
+
+    Returns:
+        bool: 書式が正しい場合True
+    """
+    return bool(_RANGES_RE.match(text))
+
+def resolve_page_ranges(text: str, page_count: int) -> List[int]:
+    """
+    ページ範囲の文字列を0始まりのページ番号のリストに変換
+
+    ページ番号は1始まりで、負の値は末尾から数える（-1が最終ページ）。
+    "a-b" は両端を含み、a > b の場合は逆順になる。"a-" は最終ページまで
+
+    Args:
+        text (str): "1-3,7" 形式の文字列
+        page_count (int): 入力ファイルの総ページ数
+
+    Returns:
+        List[int]: 0始まりのページ番号のリスト（指定順序どおり、重複可）
+
+    Raises:
+        PageRangeError: 範囲の書式が不正、またはページ数を超える場合
+    """
+    if not is_page_ranges(text):
+        raise PageRangeError(f"ページ範囲の書式が不正です: {text}")
+
+    def to_index(value: str) -> int:
+        number = int(value)
+        index = number - 1 if number > 0 else page_count + number
+        if number == 0 or not 0 <= index < page_count:
+            raise PageRangeError(f"ページ {number} は範囲外です (総ページ数: {page_count})")
+        return index
+
+    indices = []
+    for item in text.split(','):
+        start, dash, end = _ITEM_RE.match(item.strip()).groups()
+        first = to_index(start)
+        if not dash:
+            indices.append(first)
+            continue
+        last = to_index(end) if end else page_count - 1
+        step = 1 if last >= first else -1
+        indices.extend(range(first, last + step, step))
+
+    return indices
+
+def split_page_spec(spec: str) -> Tuple[str, Optional[str]]:
+    """
+    "path:ranges" 形式の入力指定をファイルパスとページ範囲に分割
+
+    最後の ":" 以降がページ範囲の書式の場合のみ分割する。
+    Windowsのドライブ文字（"C:\\a.pdf"）や、":" を含む既存のファイル名はそのままパスとして扱う
+
+    Args:
+        spec (str): 入力指定
+
+    Returns:
+        Tuple[str, Optional[str]]: (ファイルパス, ページ範囲またはNone)
+    """
+    path, separator, pages = spec.rpartition(':')
+    if not separator or not path or _DRIVE_RE.match(path) or not is_page_ranges(pages):
+        return spec, None
+    if os.path.exists(spec) and not os.path.exists(path):
+        return spec, None
+    return path, pages.replace(' ', '')
+
+def parse_page_spec(spec: Union[str, PageSelection]) -> PageSelection:
+    """
+    入力指定をPageSelectionに変換
+
+    Args:
+        spec (str | PageSelection): "a.pdf:1-3,7" 形式の入力指定
+
+    Returns:
+        PageSelection: ファイルパスとページ範囲
+    """
+    if isinstance(spec, PageSelection):
+        return spec
+    return PageSelection(*split_page_spec(spec))
@@ -0,0 +1,235 @@
+"""
+PDF情報キャッシュモジュール
+get_pdf_infoの結果をSQLiteに保存し、変更されていないファイルの再解析を省く
+"""
+
+import hashlib
+import json
+import os
+import platform
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+import logging
+
+from utils.file_handler import FileHandler
+
+logger = logging.getLogger(__name__)
+
+# 内容ハッシュ計算時に読み込む先頭・末尾のバイト数
+HASH_SAMPLE_SIZE = 64 * 1024
+# メモリに溜めた最終参照時刻をDBへ書き戻す件数（ヒットごとに書き込みのトランザクションを発行しない）
+ACCESS_FLUSH_THRESHOLD = 1000
+
+class CacheKey(NamedTuple):
+    """キャッシュのキー（ファイルの状態を表すフィンガープリント）"""
+    path: str
+    size: int
+    mtime_ns: int
+    content_hash: str
+
+class PDFInfoCache:
+    """
+    PDF情報の永続キャッシュ
+
+    解決済みパス・ファイルサイズ・更新時刻（と任意で内容ハッシュ）をキーに
+    ページ数とメタデータを保存する。ファイルが変更されていればそのエントリは無効となり、
+    エントリ数がmax_entriesを超えると最終参照が古いものから削除する（LRU）。
+    """
+
+    def __init__(self, db_path: Optional[str] = None, max_entries: int = 10000,
+                 hash_content: bool = False):
+        """
+        Args:
+            db_path (Optional[str]): キャッシュDBのパス（Noneの場合ユーザーキャッシュディレクトリ）
+            max_entries (int): 保持する最大エントリ数
+            hash_content (bool): Trueの場合、先頭・末尾の内容ハッシュもキーに含める
+                （更新時刻を保ったまま書き換えられたファイルも検出できる）
+        """
+        self.db_path = db_path or self.default_path()
+        self.max_entries = max_entries
+        self.hash_content = hash_content
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # DBに未反映の最終参照時刻（パス -> 時刻）。put・close時などにまとめて書き戻す
+        self._accessed: Dict[str, float] = {}
+
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.db_path, timeout=5.0, check_same_thread=False)
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pdf_info (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                content_hash TEXT NOT NULL,
+                page_count INTEGER NOT NULL,
+                metadata TEXT NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS pdf_info_last_access ON pdf_info (last_access)"
+        )
+        self._connection.commit()
+
+    @staticmethod
+    def default_path() -> str:
+        """OSごとのユーザーキャッシュディレクトリ内のDBパスを取得"""
+        system = platform.system()
+        if system == "Windows":
+            base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~/AppData/Local")
+        elif system == "Darwin":
+            base = os.path.expanduser("~/Library/Caches")
+        else:
+            base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        return os.path.join(base, "pdf-merger-tool", "pdf_info.sqlite3")
+
+    @property
+    def hit_rate(self) -> float:
+        """このセッションでのヒット率（0.0〜1.0）"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def fingerprint(self, file_path: str) -> CacheKey:
+        """
+        ファイルの現在の状態からキャッシュキーを作成
+
+        Args:
+            file_path (str): ファイルパス
+
+        Returns:
+            CacheKey: キャッシュキー
+        """
+        resolved = FileHandler.normalize_path(file_path)
+        stat = os.stat(resolved)
+        content_hash = self._sample_hash(resolved, stat.st_size) if self.hash_content else ""
+        return CacheKey(resolved, stat.st_size, stat.st_mtime_ns, content_hash)
+
+    def get(self, key: CacheKey) -> Optional[dict]:
+        """
+        キャッシュされたPDF情報を取得
+
+        Args:
+            key (CacheKey): fingerprintで作成したキー
+
+        Returns:
+            Optional[dict]: page_count, file_size, metadata を含む辞書、無い場合はNone
+        """
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT size, mtime_ns, content_hash, page_count, metadata FROM pdf_info WHERE path = ?",
+                    (key.path,)
+                ).fetchone()
+
+                if row is None:
+                    self.misses += 1
+                    return None
+
+                if tuple(row[:3]) != (key.size, key.mtime_ns, key.content_hash):
+                    # ファイルが変更されているためエントリを無効化
+                    self._connection.execute("DELETE FROM pdf_info WHERE path = ?", (key.path,))
+                    self._connection.commit()
+                    self._accessed.pop(key.path, None)
+                    self.misses += 1
+                    return None
+
+                self._accessed[key.path] = time.time()
+                if len(self._accessed) >= ACCESS_FLUSH_THRESHOLD:
+                    self._flush_access()
+                    self._connection.commit()
+                self.hits += 1
+
+            return {
+                'page_count': row[3],
+                'file_size': key.size,
+                'metadata': json.loads(row[4]),
+            }
+
+        except sqlite3.Error as e:
+            logger.warning(f"PDF情報キャッシュの読み込みに失敗: {e}")
+            return None
+
+    def put(self, key: CacheKey, page_count: int, metadata: dict) -> None:
+        """
+        PDF情報をキャッシュに保存
+
+        Args:
+            key (CacheKey): 解析前にfingerprintで作成したキー
+            page_count (int): ページ数
+            metadata (dict): 文字列のみからなるメタデータ
+        """
+        try:
+            with self._lock:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO pdf_info VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key.path, key.size, key.mtime_ns, key.content_hash, page_count,
+                     json.dumps(metadata, ensure_ascii=False), time.time())
+                )
+                self._accessed.pop(key.path, None)
+                # 最近参照したエントリを削除しないよう、削除の前に最終参照時刻を反映する
+                self._flush_access()
+                self._evict()
+                self._connection.commit()
+
+        except sqlite3.Error as e:
+            logger.warning(f"PDF情報キャッシュの保存に失敗: {e}")
+
+    def clear(self) -> None:
+        """全エントリを削除"""
+        with self._lock:
+            self._accessed.clear()
+            self._connection.execute("DELETE FROM pdf_info")
+            self._connection.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM pdf_info").fetchone()[0]
+
+    def close(self) -> None:
+        """最終参照時刻を書き戻してDB接続を閉じる"""
+        with self._lock:
+            try:
+                if self._accessed:
+                    self._flush_access()
+                    self._connection.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"PDF情報キャッシュの最終参照時刻の保存に失敗: {e}")
+            self._connection.close()
+        logger.info(f"PDF情報キャッシュ: ヒット {self.hits} / ミス {self.misses} "
+                    f"(ヒット率 {self.hit_rate:.1%})")
+
+    def _flush_access(self) -> None:
+        """メモリに溜めた最終参照時刻をDBに反映（コミットは呼び出し側で行う）"""
+        if self._accessed:
+            self._connection.executemany(
+                "UPDATE pdf_info SET last_access = ? WHERE path = ?",
+                [(accessed, path) for path, accessed in self._accessed.items()]
+            )
+            self._accessed.clear()
+
+    def _evict(self) -> None:
+        """最大エントリ数を超えた分を最終参照の古い順に削除"""
+        count = self._connection.execute("SELECT COUNT(*) FROM pdf_info").fetchone()[0]
+        if count > self.max_entries:
+            self._connection.execute(
+                "DELETE FROM pdf_info WHERE path IN "
+                "(SELECT path FROM pdf_info ORDER BY last_access ASC, rowid ASC LIMIT ?)",
+                (count - self.max_entries,)
+            )
+
+    @staticmethod
+    def _sample_hash(file_path: str, size: int) -> str:
+        """ファイル先頭・末尾のハッシュ値を計算"""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(file_path, 'rb') as file:
+            digest.update(file.read(HASH_SAMPLE_SIZE))
+            if size > HASH_SAMPLE_SIZE:
+                file.seek(max(HASH_SAMPLE_SIZE, size - HASH_SAMPLE_SIZE))
+                digest.update(file.read(HASH_SAMPLE_SIZE))
+        return digest.hexdigest()
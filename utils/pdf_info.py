@@ -0,0 +1,117 @@
+"""
+PDFファイル情報モジュール
+get_pdf_infoが返すファイル情報を、解析結果（PdfReader）を参照しない小さなレコードとして保持する
+（ファイルリストに数千件を並べてもメモリ使用量はファイル数に比例する分だけに収まる）
+"""
+
+import os
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+# ファイル情報に残す文書情報のキー（それ以外のキーは保持しない）
+METADATA_KEYS = ("/Title", "/Author", "/Subject", "/Keywords", "/Creator", "/Producer",
+                 "/CreationDate", "/ModDate")
+
+def compact_metadata(metadata: Optional[Mapping]) -> Dict[str, str]:
+    """
+    文書情報から必要なキーだけを文字列として複製
+
+    Args:
+        metadata (Optional[Mapping]): 文書情報（PdfReader.metadataや簡易解析の結果）
+
+    Returns:
+        Dict[str, str]: METADATA_KEYSのうち値のあるキーと、その値の文字列
+    """
+    if not metadata:
+        return {}
+    # キーはMETADATA_KEYSの文字列を共有し、値はstrで複製して元の辞書・readerへの参照を残さない
+    return {key: str(metadata[key]) for key in METADATA_KEYS if metadata.get(key) is not None}
+
+class PDFInfo:
+    """
+    PDFファイル1件の情報（get_pdf_infoの戻り値）
+
+    属性でアクセスするほか、従来の辞書と同じく info['page_count'] や info.get('page_range') でも
+    参照・変更できる。file_nameはfile_pathから求めるため保持しない
+    """
+
+    __slots__ = ("file_path", "page_count", "file_size", "metadata", "page_range")
+
+    # 辞書形式でアクセスできるキー
+    KEYS: Tuple[str, ...] = ("file_path", "file_name", "page_count", "file_size", "metadata", "page_range")
+
+    def __init__(self, file_path: str, page_count: int, file_size: int,
+                 metadata: Optional[Mapping] = None, page_range: Optional[str] = None):
+        """
+        Args:
+            file_path (str): PDFファイルパス
+            page_count (int): ページ数
+            file_size (int): ファイルサイズ（バイト）
+            metadata (Optional[Mapping]): 文書情報（METADATA_KEYSのキーだけを文字列で複製して保持）
+            page_range (Optional[str]): 結合するページ範囲（"1-3,7" 形式、Noneの場合は全ページ）
+        """
+        self.file_path = file_path
+        self.page_count = page_count
+        self.file_size = file_size
+        self.metadata = compact_metadata(metadata)
+        self.page_range = page_range
+
+    @property
+    def file_name(self) -> str:
+        """ファイル名"""
+        return os.path.basename(self.file_path)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """辞書に変換（page_rangeは指定がある場合のみ含む）"""
+        return {key: self[key] for key in self}
+
+    def _check_key(self, key: str) -> None:
+        if key not in self.KEYS:
+            raise KeyError(key)
+
+    def __getitem__(self, key: str) -> Any:
+        self._check_key(key)
+        value = getattr(self, key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key == "file_name":
+            raise KeyError(f"{key}はfile_pathから求めるため変更できません")
+        self._check_key(key)
+        setattr(self, key, value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def pop(self, key: str, *default: Any) -> Any:
+        """page_rangeの指定を取り除く（辞書のpopと同じく、指定がない場合はdefaultを返す）"""
+        if key != "page_range":
+            raise KeyError(f"{key}は取り除けません")
+        value = self.page_range
+        self.page_range = None
+        if value is None:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.KEYS and getattr(self, key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in self.KEYS if getattr(self, key) is not None)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PDFInfo):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return (f"PDFInfo(file_path={self.file_path!r}, page_count={self.page_count}, "
+                f"file_size={self.file_size}, page_range={self.page_range!r})")
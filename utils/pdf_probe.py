@@ -0,0 +1,586 @@
+"""
+PDF簡易解析モジュール
+ファイル末尾の相互参照情報から /Root → /Pages の /Count と文書情報辞書だけを読み、
+文書全体を読み込まずにページ数とメタデータを取得する
+（ファイルはメモリマップし、実際に参照する箇所だけを読むためファイルサイズに依存しない。
+メモリマップできない場合はファイル全体を読み込んで同じ解析を行う）
+"""
+
+import re
+import zlib
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from utils.input_source import open_input
+
+# startxrefを探すファイル末尾の範囲（仕様上は末尾1024バイト以内だが、末尾のゴミを許容する）
+TAIL_SIZE = 4096
+
+_WHITESPACE = b"\x00\t\n\x0c\r "
+_DELIMITERS = b"()<>[]{}/%"
+_XREF_ENTRY_RE = re.compile(rb"(\d{10}) (\d{5}) ([nf])")
+_OBJ_HEADER_RE = re.compile(rb"\s*(\d+)\s+(\d+)\s+obj")
+_ARRAY_TOKEN_RE = re.compile(rb"[\[\]()]")
+# ページ数だけが必要なため、ページ数に比例して大きくなる配列は要素を解析せずに読み飛ばす
+_SKIPPED_KEYS = frozenset(("/Kids",))
+_ESCAPES = {ord("n"): b"\n", ord("r"): b"\r", ord("t"): b"\t", ord("b"): b"\b", ord("f"): b"\f",
+            ord("("): b"(", ord(")"): b")", ord("\\"): b"\\"}
+
+class PDFProbeError(Exception):
+    """簡易解析できないPDF（破損・暗号化・未対応の形式）の場合の例外"""
+    pass
+
+class PDFProbe(NamedTuple):
+    """簡易解析の結果"""
+    page_count: int
+    metadata: Dict[str, str]
+
+class PDFAppendBase(NamedTuple):
+    """既存のPDFの末尾に増分更新を追記するために必要な情報"""
+    file_size: int
+    startxref: int                      # 最後の相互参照セクションの位置（追記する更新の/Prev）
+    next_id: int                        # トレーラーの/Size（追記するオブジェクトの最初の番号）
+    root_id: int
+    pages_id: int                       # ページツリーのルートのオブジェクト番号
+    kids: List[int]                     # ページツリーのルートの/Kids
+    page_count: int
+    info_id: Optional[int]              # 文書情報辞書のオブジェクト番号
+    document_id: Optional[List[bytes]]  # トレーラーの/ID
+
+class _Ref(NamedTuple):
+    """間接参照"""
+    num: int
+    gen: int
+
+class _Name(str):
+    """名前オブジェクト（文字列と区別するため）"""
+    pass
+
+class _Parser:
+    """PDFオブジェクトの最小限の構文解析器"""
+
+    def __init__(self, data, pos: int = 0, skip_keys: frozenset = _SKIPPED_KEYS):
+        self.data = data
+        self.pos = pos
+        self.skip_keys = skip_keys
+
+    def skip_whitespace(self) -> None:
+        data = self.data
+        size = len(data)
+        while self.pos < size:
+            char = data[self.pos]
+            if char in _WHITESPACE:
+                self.pos += 1
+            elif char == 0x25:  # '%' コメント
+                while self.pos < size and data[self.pos] not in b"\r\n":
+                    self.pos += 1
+            else:
+                break
+
+    def keyword(self) -> bytes:
+        """区切り文字までの通常文字の並びを読む"""
+        self.skip_whitespace()
+        start = self.pos
+        data = self.data
+        while self.pos < len(data) and data[self.pos] not in _WHITESPACE and data[self.pos] not in _DELIMITERS:
+            self.pos += 1
+        return data[start:self.pos]
+
+    def parse(self):
+        """現在位置のオブジェクトを1つ読む"""
+        self.skip_whitespace()
+        if self.pos >= len(self.data):
+            raise PDFProbeError("予期しないファイル終端です")
+        char = self.data[self.pos]
+
+        if char == 0x3C:  # '<'
+            if self.data[self.pos + 1] == 0x3C:
+                return self._dictionary()
+            return self._hex_string()
+        if char == 0x5B:  # '['
+            self.pos += 1
+            items = []
+            while True:
+                self.skip_whitespace()
+                if self.data[self.pos] == 0x5D:  # ']'
+                    self.pos += 1
+                    return items
+                items.append(self.parse())
+        if char == 0x28:  # '('
+            return self._literal_string()
+        if char == 0x2F:  # '/'
+            self.pos += 1
+            return self._name()
+
+        token = self.keyword()
+        if token == b"true":
+            return True
+        if token == b"false":
+            return False
+        if token == b"null":
+            return None
+        try:
+            number = int(token)
+        except ValueError:
+            try:
+                return float(token)
+            except ValueError:
+                raise PDFProbeError(f"解析できないトークンです: {token[:20]!r}") from None
+
+        # "num gen R" の間接参照か確認
+        saved = self.pos
+        generation = self.keyword()
+        if generation.isdigit() and self.keyword() == b"R":
+            return _Ref(number, int(generation))
+        self.pos = saved
+        return number
+
+    def _dictionary(self) -> dict:
+        self.pos += 2
+        result = {}
+        while True:
+            self.skip_whitespace()
+            if self.data[self.pos:self.pos + 2] == b">>":
+                self.pos += 2
+                return result
+            key = self.parse()
+            if not isinstance(key, _Name):
+                raise PDFProbeError("辞書のキーが名前ではありません")
+            self.skip_whitespace()
+            if key in self.skip_keys and self.data[self.pos] == 0x5B:
+                self._skip_array()
+                result[key] = None
+            else:
+                result[key] = self.parse()
+
+    def _skip_array(self) -> None:
+        """配列を要素を解析せずに読み飛ばす（括弧の対応と文字列内の括弧のみ考慮）"""
+        depth = 0
+        while True:
+            match = _ARRAY_TOKEN_RE.search(self.data, self.pos)
+            if match is None:
+                raise PDFProbeError("配列が閉じられていません")
+            token = match.group()
+            self.pos = match.start()
+            if token == b"(":
+                self._literal_string()
+                continue
+            self.pos += 1
+            if token == b"[":
+                depth += 1
+            elif token == b"]":
+                depth -= 1
+                if depth == 0:
+                    return
+            else:
+                raise PDFProbeError("配列内の括弧の対応が不正です")
+
+    def _name(self) -> _Name:
+        raw = self.keyword()
+        # "#xx" のエスケープを展開
+        if b"#" in raw:
+            raw = re.sub(rb"#([0-9A-Fa-f]{2})", lambda match: bytes([int(match.group(1), 16)]), raw)
+        return _Name("/" + raw.decode("utf-8", "surrogateescape"))
+
+    def _hex_string(self) -> bytes:
+        end = self.data.find(b">", self.pos)
+        if end < 0:
+            raise PDFProbeError("16進文字列が閉じられていません")
+        digits = re.sub(rb"\s", b"", self.data[self.pos + 1:end])
+        self.pos = end + 1
+        if len(digits) % 2:
+            digits += b"0"
+        return bytes.fromhex(digits.decode("ascii"))
+
+    def _literal_string(self) -> bytes:
+        data = self.data
+        self.pos += 1
+        depth = 1
+        out = bytearray()
+        while self.pos < len(data):
+            char = data[self.pos]
+            self.pos += 1
+            if char == 0x5C:  # '\'
+                escaped = data[self.pos]
+                self.pos += 1
+                if escaped in _ESCAPES:
+                    out += _ESCAPES[escaped]
+                elif 0x30 <= escaped <= 0x37:
+                    digits = bytes([escaped])
+                    while len(digits) < 3 and 0x30 <= data[self.pos] <= 0x37:
+                        digits += bytes([data[self.pos]])
+                        self.pos += 1
+                    out.append(int(digits, 8) & 0xFF)
+                elif escaped == 0x0D:
+                    if data[self.pos] == 0x0A:
+                        self.pos += 1
+                elif escaped != 0x0A:
+                    out.append(escaped)
+            elif char == 0x28:
+                depth += 1
+                out.append(char)
+            elif char == 0x29:
+                depth -= 1
+                if depth == 0:
+                    return bytes(out)
+                out.append(char)
+            else:
+                out.append(char)
+        raise PDFProbeError("文字列が閉じられていません")
+
+class _XRefSection(NamedTuple):
+    """相互参照セクション（エントリは参照時に1件ずつ読む）"""
+    subsections: List[Tuple[int, int, int]]   # (先頭のオブジェクト番号, 件数, 先頭エントリの位置)
+    data: Optional[bytes]                     # 相互参照ストリームの展開後のデータ（旧形式の表の場合None）
+    widths: Tuple[int, int, int]              # 各フィールドのバイト数（旧形式の表では未使用）
+
+class _Document:
+    """相互参照情報をたどってオブジェクトを取り出す"""
+
+    def __init__(self, data, skip_keys: frozenset = _SKIPPED_KEYS):
+        self.data = data
+        self.skip_keys = skip_keys
+        self.trailer: Optional[dict] = None
+        # 新しい更新から順に並べた相互参照セクション
+        self.sections: List[_XRefSection] = []
+        self._object_streams: Dict[int, Tuple[bytes, Dict[int, int]]] = {}
+
+        self.startxref = self._find_startxref()
+        visited = set()
+        offset: Optional[int] = self.startxref
+        while offset is not None:
+            if offset in visited or len(visited) > 64:
+                raise PDFProbeError("相互参照の連鎖が循環しています")
+            visited.add(offset)
+            offset = self._read_section(offset)
+
+        if self.trailer is None or "/Root" not in self.trailer:
+            raise PDFProbeError("トレーラーに/Rootがありません")
+        if "/Encrypt" in self.trailer:
+            raise PDFProbeError("暗号化されたPDFです")
+
+    def _find_startxref(self) -> int:
+        tail_start = max(0, len(self.data) - TAIL_SIZE)
+        position = self.data.rfind(b"startxref", tail_start)
+        if position < 0:
+            raise PDFProbeError("startxrefが見つかりません")
+        token = _Parser(self.data, position + len(b"startxref")).keyword()
+        if not token.isdigit():
+            raise PDFProbeError("startxrefの値が不正です")
+        return int(token)
+
+    def _read_section(self, offset: int) -> Optional[int]:
+        """相互参照セクションを1つ読み、前の更新のセクションの位置（/Prev）を返す"""
+        parser = _Parser(self.data, offset)
+        if parser.keyword() == b"xref":
+            trailer = self._read_table(parser)
+            if "/XRefStm" in trailer:
+                # 旧形式と相互参照ストリームの併用（ハイブリッド形式）
+                self._read_stream_section(trailer["/XRefStm"])
+        else:
+            trailer = self._read_stream_section(offset)
+
+        if self.trailer is None:
+            self.trailer = dict(trailer)
+        else:
+            # 増分更新のトレーラーで省略されたキー（/Infoなど）は前の更新の値を引き継ぐ
+            for key, value in trailer.items():
+                self.trailer.setdefault(key, value)
+        previous = trailer.get("/Prev")
+        return previous if isinstance(previous, int) else None
+
+    def _read_table(self, parser: _Parser) -> dict:
+        """旧形式の相互参照表（エントリは読まず、位置だけ記録）"""
+        subsections = []
+        while True:
+            token = parser.keyword()
+            if token == b"trailer":
+                break
+            count = parser.keyword()
+            if not (token.isdigit() and count.isdigit()):
+                raise PDFProbeError("相互参照表の書式が不正です")
+            parser.skip_whitespace()
+            # 各エントリは20バイト固定のため、エントリを読まずに読み飛ばせる
+            subsections.append((int(token), int(count), parser.pos))
+            parser.pos += int(count) * 20
+        self.sections.append(_XRefSection(subsections, None, (0, 0, 0)))
+
+        trailer = parser.parse()
+        if not isinstance(trailer, dict):
+            raise PDFProbeError("トレーラーが辞書ではありません")
+        return trailer
+
+    def _read_stream_section(self, offset: int) -> dict:
+        """相互参照ストリームを読み、各サブセクションの位置を記録"""
+        header, data = self._read_stream_at(offset)
+        if header.get("/Type") != "/XRef":
+            raise PDFProbeError("相互参照ストリームではありません")
+
+        widths = header.get("/W")
+        if not (isinstance(widths, list) and len(widths) == 3 and all(isinstance(w, int) for w in widths)):
+            raise PDFProbeError("相互参照ストリームの/Wが不正です")
+        index = header.get("/Index", [0, header.get("/Size", 0)])
+
+        subsections = []
+        row_size = sum(widths)
+        position = 0
+        for first, count in zip(index[0::2], index[1::2]):
+            subsections.append((first, count, position))
+            position += count * row_size
+        if position > len(data):
+            raise PDFProbeError("相互参照ストリームが短すぎます")
+        self.sections.append(_XRefSection(subsections, data, tuple(widths)))
+        return header
+
+    def _lookup(self, object_id: int) -> tuple:
+        """オブジェクトの相互参照エントリ (種類, 位置またはオブジェクトストリーム番号, 番号内の位置)"""
+        for section in self.sections:
+            for first, count, position in section.subsections:
+                if not first <= object_id < first + count:
+                    continue
+                if section.data is None:
+                    # 旧形式の表の各エントリは20バイト固定のため位置を直接計算できる
+                    entry_start = position + (object_id - first) * 20
+                    match = _XREF_ENTRY_RE.match(self.data[entry_start:entry_start + 18])
+                    if not match:
+                        raise PDFProbeError("相互参照表のエントリが不正です")
+                    return (1 if match.group(3) == b"n" else 0, int(match.group(1)), int(match.group(2)))
+
+                widths = section.widths
+                column = position + (object_id - first) * sum(widths)
+                fields = []
+                for width in widths:
+                    fields.append(int.from_bytes(section.data[column:column + width], "big"))
+                    column += width
+                return (fields[0] if widths[0] else 1, fields[1], fields[2])
+        raise PDFProbeError(f"オブジェクト {object_id} が相互参照にありません")
+
+    def resolve(self, value):
+        """間接参照であれば参照先のオブジェクトを返す"""
+        if not isinstance(value, _Ref):
+            return value
+        kind, field, index = self._lookup(value.num)
+        if kind == 1:
+            parser = self._object_parser(field, value.num)
+            return parser.parse()
+        if kind == 2:
+            data, offsets = self._object_stream(field)
+            if value.num not in offsets:
+                raise PDFProbeError(f"オブジェクト {value.num} がオブジェクトストリームにありません")
+            return _Parser(data, offsets[value.num], self.skip_keys).parse()
+        raise PDFProbeError(f"オブジェクト {value.num} は削除されています")
+
+    def _object_parser(self, offset: int, object_id: Optional[int] = None) -> _Parser:
+        match = _OBJ_HEADER_RE.match(self.data[offset:offset + 64])
+        if not match or (object_id is not None and int(match.group(1)) != object_id):
+            raise PDFProbeError(f"オブジェクトの位置が不正です: {offset}")
+        return _Parser(self.data, offset + match.end(), self.skip_keys)
+
+    def _read_stream_at(self, offset: int) -> Tuple[dict, bytes]:
+        """位置offsetのストリームオブジェクトの辞書と展開後のデータ"""
+        parser = self._object_parser(offset)
+        header = parser.parse()
+        if not isinstance(header, dict) or parser.keyword() != b"stream":
+            raise PDFProbeError("ストリームオブジェクトではありません")
+        # "stream" の直後はCRLFまたはLF
+        if self.data[parser.pos:parser.pos + 2] == b"\r\n":
+            parser.pos += 2
+        elif self.data[parser.pos:parser.pos + 1] == b"\n":
+            parser.pos += 1
+
+        length = self.resolve(header.get("/Length"))
+        if not isinstance(length, int):
+            raise PDFProbeError("ストリームの/Lengthが不正です")
+        # メモリマップの範囲をコピーせずに展開する
+        with memoryview(self.data) as view, view[parser.pos:parser.pos + length] as raw:
+            return header, self._decode(header, raw)
+
+    def _decode(self, header: dict, data: memoryview) -> bytes:
+        filters = header.get("/Filter")
+        if isinstance(filters, list) and len(filters) == 1:
+            filters = filters[0]
+        if filters is None:
+            return bytes(data)
+        if filters != "/FlateDecode":
+            raise PDFProbeError(f"未対応のフィルタです: {filters}")
+        try:
+            data = zlib.decompress(data)
+        except zlib.error as e:
+            raise PDFProbeError(f"ストリームを展開できません: {e}") from e
+
+        parms = self.resolve(header.get("/DecodeParms")) or {}
+        if isinstance(parms, list):
+            parms = parms[0] or {}
+        predictor = parms.get("/Predictor", 1)
+        if predictor >= 10:
+            return _png_unpredict(data, parms.get("/Columns", 1) * parms.get("/Colors", 1)
+                                  * parms.get("/BitsPerComponent", 8) // 8)
+        if predictor != 1:
+            raise PDFProbeError(f"未対応のPredictorです: {predictor}")
+        return data
+
+    def _object_stream(self, object_id: int) -> Tuple[bytes, Dict[int, int]]:
+        """オブジェクトストリームを展開し、格納されたオブジェクトの位置の一覧とともに返す"""
+        if object_id not in self._object_streams:
+            kind, offset, _ = self._lookup(object_id)
+            if kind != 1:
+                raise PDFProbeError("オブジェクトストリームの位置が不正です")
+            header, data = self._read_stream_at(offset)
+            first = header.get("/First")
+            count = header.get("/N")
+            if not isinstance(first, int) or not isinstance(count, int):
+                raise PDFProbeError("オブジェクトストリームの辞書が不正です")
+            parser = _Parser(data)
+            offsets = {}
+            for _ in range(count):
+                number, position = parser.keyword(), parser.keyword()
+                if not (number.isdigit() and position.isdigit()):
+                    raise PDFProbeError("オブジェクトストリームの見出しが不正です")
+                offsets[int(number)] = first + int(position)
+            self._object_streams[object_id] = (data, offsets)
+        return self._object_streams[object_id]
+
+def _png_unpredict(data: bytes, columns: int) -> bytes:
+    """PNG予測（Predictor 10〜15）を元に戻す"""
+    row_size = columns + 1
+    if columns <= 0 or len(data) % row_size:
+        raise PDFProbeError("PNG予測のデータ長が不正です")
+    output = bytearray()
+    previous = bytearray(columns)
+    for start in range(0, len(data), row_size):
+        kind = data[start]
+        row = bytearray(data[start + 1:start + row_size])
+        if kind == 1:
+            for i in range(1, columns):
+                row[i] = (row[i] + row[i - 1]) & 0xFF
+        elif kind == 2:
+            for i in range(columns):
+                row[i] = (row[i] + previous[i]) & 0xFF
+        elif kind == 3:
+            for i in range(columns):
+                left = row[i - 1] if i else 0
+                row[i] = (row[i] + (left + previous[i]) // 2) & 0xFF
+        elif kind == 4:
+            for i in range(columns):
+                left = row[i - 1] if i else 0
+                upper_left = previous[i - 1] if i else 0
+                estimate = left + previous[i] - upper_left
+                distances = (abs(estimate - left), abs(estimate - previous[i]), abs(estimate - upper_left))
+                nearest = (left, previous[i], upper_left)[distances.index(min(distances))]
+                row[i] = (row[i] + nearest) & 0xFF
+        elif kind != 0:
+            raise PDFProbeError(f"未対応のPNG予測の種類です: {kind}")
+        output += row
+        previous = row
+    return bytes(output)
+
+def _decode_text(value) -> str:
+    """文書情報辞書の値を文字列に変換（pypdfのstr()と同じ結果にならない値は未対応とする）"""
+    if isinstance(value, _Name):
+        return str(value)
+    if isinstance(value, bool) or not isinstance(value, (bytes, int)):
+        raise PDFProbeError("未対応のメタデータの値です")
+    if isinstance(value, int):
+        return str(value)
+    if value.startswith(b"\xfe\xff"):
+        return value[2:].decode("utf-16-be", "replace")
+    if value.startswith(b"\xef\xbb\xbf"):
+        return value[3:].decode("utf-8", "replace")
+    # PDFDocEncodingのうちLatin-1と異なる文字を含む場合は完全な解析に任せる
+    if any(0x18 <= byte <= 0x1F or 0x7F <= byte <= 0xA0 or byte == 0xAD for byte in value):
+        raise PDFProbeError("PDFDocEncoding固有の文字を含みます")
+    return value.decode("latin-1")
+
+def probe_pdf(file_path: str, use_mmap: bool = True) -> PDFProbe:
+    """
+    ページツリーを展開せずにページ数と文書情報を取得
+
+    Args:
+        file_path (str): PDFファイルパス
+        use_mmap (bool): Trueの場合、ファイルをメモリマップして必要な箇所だけを読む
+
+    Returns:
+        PDFProbe: ページ数（/Pagesの/Count）とメタデータ
+
+    Raises:
+        PDFProbeError: 破損・暗号化・未対応の形式などで簡易解析できない場合
+        OSError: ファイルを開けない場合
+    """
+    with open_input(file_path, use_mmap=use_mmap) as source:
+        data = source.stream if source.is_mapped else source.stream.read()
+        try:
+            document = _Document(data)
+            root = document.resolve(document.trailer["/Root"])
+            pages = document.resolve(root.get("/Pages")) if isinstance(root, dict) else None
+            page_count = document.resolve(pages.get("/Count")) if isinstance(pages, dict) else None
+            if not isinstance(page_count, int) or isinstance(page_count, bool) or page_count < 0:
+                raise PDFProbeError("/Pagesの/Countが不正です")
+
+            metadata = {}
+            info = document.resolve(document.trailer.get("/Info"))
+            if isinstance(info, dict):
+                for key, value in info.items():
+                    metadata[str(key)] = _decode_text(document.resolve(value))
+
+            return PDFProbe(page_count, metadata)
+        except (IndexError, KeyError, TypeError, ValueError, RecursionError) as e:
+            raise PDFProbeError(f"PDFの構造が不正です: {e}") from e
+
+def read_append_base(file_path: str, use_mmap: bool = True) -> PDFAppendBase:
+    """
+    増分更新で追記するために、既存のPDFの末尾の相互参照情報とページツリーのルートを読む
+
+    Args:
+        file_path (str): PDFファイルパス
+        use_mmap (bool): Trueの場合、ファイルをメモリマップして必要な箇所だけを読む
+
+    Returns:
+        PDFAppendBase: 追記に必要な情報
+
+    Raises:
+        PDFProbeError: 破損・暗号化・相互参照ストリーム形式など、旧形式の相互参照表で追記できない場合
+        OSError: ファイルを開けない場合
+    """
+    with open_input(file_path, use_mmap=use_mmap) as source:
+        data = source.stream if source.is_mapped else source.stream.read()
+        try:
+            document = _Document(data, skip_keys=frozenset())
+            if document.sections[0].data is not None:
+                raise PDFProbeError("相互参照ストリーム形式のPDFには追記できません")
+
+            trailer = document.trailer
+            root_ref = trailer["/Root"]
+            root = document.resolve(root_ref)
+            pages_ref = root.get("/Pages") if isinstance(root, dict) else None
+            pages = document.resolve(pages_ref)
+            if not isinstance(pages, dict):
+                raise PDFProbeError("ページツリーのルートが不正です")
+            # 追記ではページツリーのルートを/Kidsと/Countだけで書き直すため、継承属性などがある場合は追記しない
+            if set(pages) - {"/Type", "/Kids", "/Count"}:
+                raise PDFProbeError("ページツリーのルートに/Kids・/Count以外の属性があるPDFには追記できません")
+
+            kids = pages.get("/Kids")
+            page_count = document.resolve(pages.get("/Count"))
+            references = [root_ref, pages_ref] + (kids if isinstance(kids, list) else [])
+            if not isinstance(kids, list) or not all(isinstance(ref, _Ref) and ref.gen == 0 for ref in references):
+                raise PDFProbeError("世代番号が0でない参照を含むPDFには追記できません")
+            if not isinstance(page_count, int) or isinstance(page_count, bool):
+                raise PDFProbeError("/Pagesの/Countが不正です")
+
+            info_ref = trailer.get("/Info")
+            document_id = trailer.get("/ID")
+            if not (isinstance(document_id, list) and all(isinstance(part, bytes) for part in document_id)):
+                document_id = None
+
+            return PDFAppendBase(
+                file_size=len(data),
+                startxref=document.startxref,
+                next_id=trailer["/Size"],
+                root_id=root_ref.num,
+                pages_id=pages_ref.num,
+                kids=[ref.num for ref in kids],
+                page_count=page_count,
+                info_id=info_ref.num if isinstance(info_ref, _Ref) and info_ref.gen == 0 else None,
+                document_id=document_id
+            )
+        except (IndexError, KeyError, TypeError, ValueError, RecursionError) as e:
+            raise PDFProbeError(f"PDFの構造が不正です: {e}") from e
@@ -0,0 +1,427 @@
+"""
+ストリーミングPDF書き出しモジュール
+入力ごとにページオブジェクトを出力ファイルへ直接書き出し、
+結合結果全体をメモリに保持せずにPDFを生成する
+"""
+
+import zlib
+from collections import deque
+from io import BytesIO
+from typing import TYPE_CHECKING, BinaryIO, Deque, Dict, List, Optional, Set, Tuple
+
+from pypdf import PdfWriter
+from pypdf.generic import (
+    ArrayObject,
+    ByteStringObject,
+    DictionaryObject,
+    IndirectObject,
+    NameObject,
+    NumberObject,
+    PdfObject,
+    StreamObject,
+    create_string_object,
+)
+
+if TYPE_CHECKING:
+    from utils.dedup import StreamDeduplicator
+    from utils.pdf_probe import PDFAppendBase
+
+PDF_HEADER = b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n"
+
+# 1つのオブジェクトストリームにまとめる最大オブジェクト数
+OBJECTS_PER_STREAM = 200
+
+class StreamingPdfWriter:
+    """
+    ページを入力単位で逐次書き出すPDFライター
+
+    add_pageで受け取ったページは作業用のPdfWriterに複製され、
+    flushを呼ぶとそこから参照されるオブジェクトだけを出力ストリームへ書き出して破棄する。
+    メモリに残るのはオブジェクトのオフセット表とページ番号の一覧のみ。
+    deduplicatorを指定すると、既に書き出したストリームと同一内容のストリームは書き出さず、
+    既存のオブジェクトを参照する（入力をまたいで共有されるフォント・画像など）。
+    object_streamsを指定すると、ストリーム以外のオブジェクトはオブジェクトストリームにまとめ、
+    相互参照表は相互参照ストリームとして書き出す。
+    append_toを指定すると、出力ストリームに複製済みの既存のPDFに増分更新としてページを追記する
+    （新しいオブジェクト・書き直したページツリーのルート・文書情報と、/Prevで既存の相互参照表をたどる相互参照表のみを書き出す）。
+    """
+
+    def __init__(self, stream: BinaryIO, deduplicator: Optional["StreamDeduplicator"] = None,
+                 compress_level: Optional[int] = None, recompress: bool = False,
+                 object_streams: bool = False, append_to: Optional["PDFAppendBase"] = None):
+        """
+        Args:
+            stream (BinaryIO): 出力先ストリーム
+            deduplicator (Optional[StreamDeduplicator]): 同一内容のストリームを共有する場合の索引
+            compress_level (Optional[int]): 未圧縮ストリームをFlate圧縮するレベル（Noneの場合は圧縮しない）
+            recompress (bool): Flate圧縮済みのストリームもcompress_levelで圧縮し直す
+            object_streams (bool): オブジェクトストリームと相互参照ストリームで書き出す
+            append_to (Optional[PDFAppendBase]): 追記先の既存のPDFの情報（streamは既存の内容の末尾に位置していること）
+
+        Raises:
+            ValueError: append_toとobject_streamsを同時に指定した場合
+        """
+        if append_to is not None and object_streams:
+            raise ValueError("オブジェクトストリーム形式では追記できません")
+        self._stream = stream
+        self._deduplicator = deduplicator
+        self._compress_level = compress_level
+        self._recompress = recompress
+        self._object_streams = object_streams
+        self._position = 0
+        self._offsets: Dict[int, int] = {}
+        self._compressed: Dict[int, Tuple[int, int]] = {}
+        self._pending_compressed: List[Tuple[int, bytes]] = []
+        self._next_id = 1
+        self._page_ids: List[int] = []
+        self._metadata: Dict[str, str] = {}
+        self._scratch: Optional[PdfWriter] = None
+        self._closed = False
+        self._append_to = append_to
+
+        if append_to is not None:
+            # 既存のページツリーのルートを書き直し、カタログはそのまま使う
+            self._position = append_to.file_size
+            self._next_id = append_to.next_id
+            self._pages_id = append_to.pages_id
+            self._root_id = append_to.root_id
+            return
+
+        # ページツリーとカタログは最後に書き出すため番号だけ先に確保
+        self._pages_id = self._reserve_id()
+        self._root_id = self._reserve_id()
+
+        self._write(PDF_HEADER)
+
+    @property
+    def bytes_written(self) -> int:
+        """出力のバイト数（追記の場合は既存の内容を含む）"""
+        return self._position
+
+    @property
+    def page_count(self) -> int:
+        """書き出し済みのページ数（追記の場合は既存のページを含む）"""
+        base = self._append_to.page_count if self._append_to is not None else 0
+        return base + len(self._page_ids)
+
+    def add_page(self, page) -> None:
+        """
+        ページを追加（flushまでは作業用ライターに保持）
+
+        Args:
+            page (PageObject): 追加するページ
+        """
+        if self._closed:
+            raise ValueError("既に閉じられたライターです")
+        if self._scratch is None:
+            self._scratch = PdfWriter()
+        self._scratch.add_page(page)
+
+    def add_metadata(self, metadata: Dict[str, str]) -> None:
+        """
+        文書情報辞書に書き出すメタデータを設定
+
+        Args:
+            metadata (Dict[str, str]): '/Title'などのキーと値
+        """
+        self._metadata.update(metadata)
+
+    def flush(self) -> None:
+        """保留中のページと参照オブジェクトを書き出し、作業用ライターを破棄"""
+        scratch = self._scratch
+        if scratch is None:
+            return
+        self._scratch = None
+
+        # 作業用ライター内の番号から出力ファイル内の番号への対応表
+        id_map: Dict[Tuple[int, int], int] = {
+            self._key(scratch.root_object.indirect_reference): self._root_id,
+            self._key(scratch.root_object["/Pages"].indirect_reference): self._pages_id,
+        }
+        pending: Deque[Tuple[int, PdfObject]] = deque()
+        in_progress: Set[Tuple[int, int]] = set()
+
+        def resolve(reference: IndirectObject) -> int:
+            key = self._key(reference)
+            if key not in id_map:
+                obj = reference.get_object()
+                if self._deduplicator is not None and isinstance(obj, StreamObject) \
+                        and key not in in_progress:
+                    in_progress.add(key)
+                    id_map[key] = self._write_shared(key, obj, id_map, resolve)
+                    in_progress.discard(key)
+                else:
+                    id_map[key] = self._reserve_id()
+                    if key not in in_progress:
+                        pending.append((id_map[key], obj))
+            return id_map[key]
+
+        for page in scratch.pages:
+            self._page_ids.append(resolve(page.indirect_reference))
+
+        while pending:
+            object_id, obj = pending.popleft()
+            self._write_object(object_id, obj, resolve)
+
+    def close(self) -> None:
+        """ページツリー・カタログ・文書情報・相互参照表を書き出して完了"""
+        if self._closed:
+            return
+        self.flush()
+
+        kids = (self._append_to.kids if self._append_to is not None else []) + self._page_ids
+        pages = DictionaryObject({
+            NameObject("/Type"): NameObject("/Pages"),
+            NameObject("/Kids"): ArrayObject(
+                IndirectObject(page_id, 0, None) for page_id in kids
+            ),
+            NameObject("/Count"): NumberObject(self.page_count),
+        })
+        self._write_object(self._pages_id, pages, lambda ref: ref.idnum)
+
+        if self._append_to is None:
+            root = DictionaryObject({
+                NameObject("/Type"): NameObject("/Catalog"),
+                NameObject("/Pages"): IndirectObject(self._pages_id, 0, None),
+            })
+            self._write_object(self._root_id, root, lambda ref: ref.idnum)
+
+        trailer = DictionaryObject({
+            NameObject("/Root"): IndirectObject(self._root_id, 0, None),
+        })
+        if self._append_to is not None:
+            trailer[NameObject("/Prev")] = NumberObject(self._append_to.startxref)
+            if self._append_to.document_id:
+                trailer[NameObject("/ID")] = ArrayObject(
+                    ByteStringObject(part) for part in self._append_to.document_id
+                )
+            if self._append_to.info_id is not None:
+                trailer[NameObject("/Info")] = IndirectObject(self._append_to.info_id, 0, None)
+        if self._metadata:
+            info_id = self._reserve_id()
+            info = DictionaryObject({
+                NameObject(key): create_string_object(str(value))
+                for key, value in self._metadata.items()
+            })
+            self._write_object(info_id, info, lambda ref: ref.idnum)
+            trailer[NameObject("/Info")] = IndirectObject(info_id, 0, None)
+
+        if self._object_streams:
+            self._flush_object_stream()
+            self._write_xref_stream(trailer)
+        else:
+            trailer[NameObject("/Size")] = NumberObject(self._next_id)
+            self._write_xref(trailer)
+        self._closed = True
+
+    def _reserve_id(self) -> int:
+        object_id = self._next_id
+        self._next_id += 1
+        return object_id
+
+    @staticmethod
+    def _key(reference: IndirectObject) -> Tuple[int, int]:
+        return id(reference.pdf), reference.idnum
+
+    def _write(self, data: bytes) -> None:
+        self._stream.write(data)
+        self._position += len(data)
+
+    def _write_object(self, object_id: int, obj: PdfObject, resolve) -> None:
+        buffer = BytesIO()
+        if isinstance(obj, StreamObject):
+            serialize_object(self._encode_stream(obj), buffer, resolve)
+            self._write_body(object_id, buffer.getvalue())
+        else:
+            serialize_object(obj, buffer, resolve)
+            self._write_compressible(object_id, buffer.getvalue())
+
+    def _write_compressible(self, object_id: int, body: bytes) -> None:
+        """ストリーム以外のオブジェクトを書き出す（object_streamsの場合はオブジェクトストリームに溜める）"""
+        if not self._object_streams:
+            self._write_body(object_id, body)
+            return
+        self._pending_compressed.append((object_id, body))
+        if len(self._pending_compressed) >= OBJECTS_PER_STREAM:
+            self._flush_object_stream()
+
+    def _flush_object_stream(self) -> None:
+        """溜めたオブジェクトを1つのオブジェクトストリームとして書き出す"""
+        entries = self._pending_compressed
+        if not entries:
+            return
+        self._pending_compressed = []
+
+        stream_id = self._reserve_id()
+        offsets = []
+        bodies = BytesIO()
+        for index, (object_id, body) in enumerate(entries):
+            offsets.append(f"{object_id} {bodies.tell()}")
+            bodies.write(body)
+            bodies.write(b"\n")
+            self._compressed[object_id] = (stream_id, index)
+
+        header = (" ".join(offsets) + "\n").encode()
+        data = zlib.compress(header + bodies.getvalue(), self._compress_level or zlib.Z_DEFAULT_COMPRESSION)
+        self._write_body(stream_id, (
+            f"<<\n/Type /ObjStm\n/N {len(entries)}\n/First {len(header)}\n"
+            f"/Filter /FlateDecode\n/Length {len(data)}\n>>\nstream\n"
+        ).encode() + data + b"\nendstream")
+
+    def _encode_stream(self, obj: StreamObject) -> StreamObject:
+        """
+        compress_levelに応じてストリームをFlate圧縮した複製を返す（元の入力のオブジェクトは変更しない）
+
+        未圧縮のストリームは圧縮し、recompressの場合は単独のFlateDecodeで圧縮済みのものも圧縮し直す。
+        XMPメタデータ・他のフィルタ・圧縮しても小さくならないストリームはそのまま返す
+        """
+        if self._compress_level is None or obj.get("/Type") == "/Metadata":
+            return obj
+
+        filters = obj.get("/Filter")
+        if isinstance(filters, ArrayObject) and len(filters) == 1:
+            filters = filters[0]
+        if filters is None:
+            raw = obj._data
+        elif self._recompress and filters == "/FlateDecode" and "/DecodeParms" not in obj:
+            try:
+                raw = zlib.decompress(obj._data)
+            except zlib.error:
+                return obj
+        else:
+            return obj
+
+        data = zlib.compress(raw, self._compress_level)
+        if len(data) >= len(obj._data):
+            return obj
+
+        encoded = StreamObject()
+        for key, value in obj.items():
+            if key not in ("/Length", "/Filter", "/DecodeParms"):
+                encoded[key] = value
+        encoded[NameObject("/Filter")] = NameObject("/FlateDecode")
+        encoded._data = data
+        return encoded
+
+    def _write_body(self, object_id: int, body: bytes) -> None:
+        self._offsets[object_id] = self._position
+        self._write(f"{object_id} 0 obj\n".encode() + body + b"\nendobj\n")
+
+    def _write_shared(self, key: Tuple[int, int], obj: StreamObject,
+                      id_map: Dict[Tuple[int, int], int], resolve) -> int:
+        """
+        ストリームを書き出す（同一内容のストリームを書き出し済みの場合はその番号を返す）
+
+        参照先は先に解決するため、参照先が重複排除されたストリーム同士も同一と判定できる
+        """
+        buffer = BytesIO()
+        serialize_object(self._encode_stream(obj), buffer, resolve)
+        body = buffer.getvalue()
+
+        if key in id_map:
+            # 参照先から自身へ循環参照していた場合は番号が確保済みのため、そのまま書き出す
+            self._write_body(id_map[key], body)
+            return id_map[key]
+
+        digest, object_id = self._deduplicator.lookup(body)
+        if object_id is None:
+            object_id = self._reserve_id()
+            self._write_body(object_id, body)
+            self._deduplicator.register(digest, object_id)
+        return object_id
+
+    def _write_xref(self, trailer: DictionaryObject) -> None:
+        """書き出したオブジェクトの相互参照表を、番号が連続する範囲ごとのサブセクションで書き出す"""
+        xref_offset = self._position
+        # 増分更新でも空き領域リストの先頭（0番）を書き出す（先頭が0番でない相互参照表を誤りとみなすリーダーがあるため）
+        object_ids = [0] + sorted(self._offsets)
+
+        lines = [b"xref\n"]
+        start = 0
+        for index in range(1, len(object_ids) + 1):
+            if index < len(object_ids) and object_ids[index] == object_ids[index - 1] + 1:
+                continue
+            lines.append(f"{object_ids[start]} {index - start}\n".encode())
+            for object_id in object_ids[start:index]:
+                if object_id == 0:
+                    lines.append(b"0000000000 65535 f \n")
+                else:
+                    lines.append(f"{self._offsets[object_id]:010d} 00000 n \n".encode())
+            start = index
+        self._write(b"".join(lines))
+
+        buffer = BytesIO()
+        buffer.write(b"trailer\n")
+        serialize_object(trailer, buffer, lambda ref: ref.idnum)
+        buffer.write(f"\nstartxref\n{xref_offset}\n%%EOF\n".encode())
+        self._write(buffer.getvalue())
+
+    def _write_xref_stream(self, trailer: DictionaryObject) -> None:
+        """相互参照ストリーム（オブジェクトストリーム内のオブジェクトの位置を含む）を書き出す"""
+        xref_id = self._reserve_id()
+        xref_offset = self._position
+        self._offsets[xref_id] = xref_offset
+
+        offset_width = max(4, (xref_offset.bit_length() + 7) // 8)
+        rows = [bytes([0]) + (0).to_bytes(offset_width, "big") + (65535).to_bytes(2, "big")]
+        for object_id in range(1, self._next_id):
+            if object_id in self._compressed:
+                stream_id, index = self._compressed[object_id]
+                rows.append(bytes([2]) + stream_id.to_bytes(offset_width, "big") + index.to_bytes(2, "big"))
+            else:
+                rows.append(bytes([1]) + self._offsets[object_id].to_bytes(offset_width, "big") + b"\x00\x00")
+        data = zlib.compress(b"".join(rows))
+
+        buffer = BytesIO()
+        buffer.write(f"{xref_id} 0 obj\n<<\n/Type /XRef\n/Size {self._next_id}\n"
+                     f"/W [ 1 {offset_width} 2 ]\n/Filter /FlateDecode\n/Length {len(data)}".encode())
+        for key, value in trailer.items():
+            buffer.write(b"\n")
+            key.write_to_stream(buffer)
+            buffer.write(b" ")
+            serialize_object(value, buffer, lambda ref: ref.idnum)
+        buffer.write(b"\n>>\nstream\n")
+        buffer.write(data)
+        buffer.write(f"\nendstream\nendobj\nstartxref\n{xref_offset}\n%%EOF\n".encode())
+        self._write(buffer.getvalue())
+
+def serialize_object(obj: PdfObject, out: BytesIO, resolve) -> None:
+    """
+    PDFオブジェクトを間接参照の番号を付け替えながらバイト列に書き出す
+
+    Args:
+        obj (PdfObject): 書き出すオブジェクト
+        out (BytesIO): 出力先バッファ
+        resolve: IndirectObjectを受け取り出力ファイル内の番号を返す関数
+    """
+    if isinstance(obj, IndirectObject):
+        out.write(f"{resolve(obj)} 0 R".encode())
+    elif isinstance(obj, StreamObject):
+        data = obj._data
+        out.write(b"<<")
+        for key, value in obj.items():
+            if key == "/Length":
+                continue
+            out.write(b"\n")
+            key.write_to_stream(out)
+            out.write(b" ")
+            serialize_object(value, out, resolve)
+        out.write(f"\n/Length {len(data)}\n>>\nstream\n".encode())
+        out.write(data)
+        out.write(b"\nendstream")
+    elif isinstance(obj, DictionaryObject):
+        out.write(b"<<")
+        for key, value in obj.items():
+            out.write(b"\n")
+            key.write_to_stream(out)
+            out.write(b" ")
+            serialize_object(value, out, resolve)
+        out.write(b"\n>>")
+    elif isinstance(obj, ArrayObject):
+        out.write(b"[")
+        for value in obj:
+            out.write(b" ")
+            serialize_object(value, out, resolve)
+        out.write(b" ]")
+    else:
+        obj.write_to_stream(out)